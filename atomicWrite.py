@@ -0,0 +1,56 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: atomicWrite.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+Atomic file writes for the caches, manifests and reports of the shared modules.
+
+Files, which are read by concurrent worker processes (font resolution, sweep manifests,
+sample files, ...), are written to a temporary file in the same directory, which is
+then renamed to the target path. Readers hence either see the previous or the complete
+new file, but never a partially written one:
+    ##############################################
+    from atomicWrite import atomic_write
+    # other code ...
+    with atomic_write(path) as tmpfile:
+        with open(tmpfile, 'w') as fh:
+            json.dump(data, fh)
+    # other code ...
+    ##############################################
+The temporary file keeps the extension of path (e.g. samples.<pid>.<thread>.tmp.npy),
+since some writers (like np.save) append their extension otherwise.
+'''
+
+import os
+import threading
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_write(path):
+    '''
+    Yields a temporary path, which replaces path when leaving the context. The parent
+    directory of path is created if missing. If the body raises, the temporary file is
+    removed and path is left unchanged.
+    :param path: string, target path
+    '''
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+    root, ext = os.path.splitext(path)
+    # (unique per process and thread)
+    tmpfile = '{}.{}.{}.tmp{}'.format(root, os.getpid(), threading.get_ident(), ext)
+    try:
+        yield tmpfile
+        os.replace(tmpfile, path)
+    except BaseException:
+        if os.path.isfile(tmpfile):
+            os.remove(tmpfile)
+        raise
+
+if __name__ == '__main__':
+
+    pass
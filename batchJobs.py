@@ -0,0 +1,480 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: batchJobs.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Declarative batch jobs of the template plot functions.
+
+Instead of hard coding sweeps in the __main__ blocks of the templates (e.g. the
+wspace_values loop of call_AB_panel.py or the colormap list of
+mpl_standalone_colorbar.py), a job spec (JSON or YAML) names the template entry point,
+its fixed keyword arguments, a parameter grid and the output names:
+    ##############################################
+    {
+      "defaults": {"outdir": "out"},
+      "jobs": [
+        {"name": "AB_panel_wspace",
+         "template": "mpl_imshow_AB_panel/mpl_imshow_AB_panel.py",
+         "function": "plot_AB_panel",
+         "params": {"data": [{"__call__": "syntheticFields.getRandomField",
+                              "args": [{"__param__": "_size"}, {"__param__": "_size"}],
+                              "kwargs": {"seed": 1}},
+                             {"__call__": "syntheticFields.getRandomField",
+                              "args": [{"__param__": "_size"}, {"__param__": "_size"}],
+                              "kwargs": {"seed": 2}}],
+                    "cmaps": ["gray", "viridis"],
+                    "datestamp": false},
+         "grid": {"wspace": [0.0, 0.015, 0.025, 0.05], "_size": [128, 512]},
+         "outname": "AB_panel_{_size}_wspace_{wspace:0.3f}"}
+      ]
+    }
+    ##############################################
+    - template is the path of the template script relative to the repository root and
+      function the name of its plot function.
+    - grid is either a dict of parameter lists, whose cartesian product is expanded, or
+      a list of such dicts (the union of their products, e.g. for paired values). The
+      grid parameters are passed to the plot function as keyword arguments, except the
+      ones starting with an underscore, which only serve as variables.
+    - outname is formatted with the grid parameters (and the job index within the
+      grid as {index}, hence no grid parameter may be named index) and passed as
+      keyword argument outname.
+    - outdir (default 'out') is relative to the directory of the spec file.
+    - params values may be
+          {"__ndarray__": nested list, "dtype": "float64"} (numpy array),
+          {"__npy__": path} (numpy array of a .npy file, relative to the spec),
+          {"__call__": "module.function" or "script.py:function", "args": [...],
+           "kwargs": {...}} (the return value of the call, evaluated by the process
+           rendering the job, such that large inputs are never transferred, and
+           shared by the jobs of this process as read-only arrays) or
+          {"__param__": name} (the value of a grid parameter) or
+          {"__format__": string} (the string formatted with the grid parameters).
+    - defaults holds settings shared by all jobs (params are merged).
+Jobs are identified by the hash of their template, function and keyword arguments (as
+specified), where duplicate jobs are dropped and different jobs writing the same output
+raise a ValueError. The jobs are ordered by decreasing predicted cost, i.e. by the
+render time of the job (or of its plot function, scaled by the input size) recorded in
+previous runs (BATCH_COST_FILE), such that long jobs do not end up last in a parallel
+run. Jobs without history are considered first, ordered by their input size.
+
+--- Example invocations ---
+$python batchJobs.py spec.json
+$python batchJobs.py spec.yaml --executor process --workers 8 --memory-budget 2048
+$python batchJobs.py spec.json --executor daemon
+$python batchJobs.py spec.json --dry-run
+-------------------------------------------------------------------------------
+The executors are serial (in this process), process (worker processes, see
+parallelSweep.run_sweep and run_bounded_sweep) and daemon (the render daemon, see
+renderDaemon.py). Failing jobs are reported, while the remaining jobs are run on.
+'''
+
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import itertools
+import traceback
+from collections import namedtuple
+from collections import OrderedDict
+import numpy as np
+import matplotlib as mpl
+
+try:
+    import yaml
+except ImportError: # (YAML specs are optional)
+    yaml = None
+
+from atomicWrite import atomic_write
+from renderCache import getValueKey
+from templateBenchmarks import REPODIR
+from templateBenchmarks import loadTemplate
+from parallelSweep import run_sweep
+from parallelSweep import run_bounded_sweep
+from renderClient import submit
+from renderClient import RENDER_DAEMON_SOCKET
+
+BATCH_COST_FILE = os.path.join(mpl.get_cachedir(), 'mpl-benchmarks-batch-costs.json')
+
+BATCH_EXECUTORS = ('serial', 'process', 'daemon')
+
+# number of evaluated __call__ values kept per process (shared by the jobs of a grid)
+BATCH_VALUE_CACHE_SIZE = 8
+
+# template and function relative to the repository root, kwargs and params as
+# specified (before evaluation), outdir absolute, key the hash of the job and size the
+# estimated number of input elements
+BatchJob = namedtuple('BatchJob', ['name', 'template', 'function', 'kwargs', 'params',
+                                   'basedir', 'outdir', 'outname', 'key', 'size'])
+
+BatchResult = namedtuple('BatchResult', ['job', 'ok', 'result', 'seconds', 'error'])
+
+_values = OrderedDict()
+
+def load_spec(path):
+    '''
+    Reads a JSON (.json) or YAML (.yaml, .yml) job spec.
+    '''
+    with open(path, 'r') as fh:
+        if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ImportError("Reading YAML specs requires PyYAML " +
+                                  "(pip install pyyaml), or use a JSON spec.")
+            return yaml.safe_load(fh)
+        return json.load(fh)
+
+def _substitute(obj, params):
+    '''
+    Replaces all {"__param__": name} of obj by the grid parameter value and all
+    {"__format__": string} by the string formatted with the grid parameters.
+    '''
+    if isinstance(obj, dict):
+        if '__param__' in obj:
+            return params[obj['__param__']]
+        if '__format__' in obj:
+            return obj['__format__'].format(**params)
+        return {key: _substitute(value, params) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_substitute(value, params) for value in obj]
+    return obj
+
+def _expandGrid(grid):
+    '''
+    :returns combinations: list of parameter dicts of the grid (see module docstring)
+    '''
+    if grid is None:
+        return [{}]
+    grids = grid if isinstance(grid, list) else [grid]
+    combinations = []
+    for grid in grids:
+        names = list(grid.keys())
+        for values in itertools.product(*[grid[name] for name in names]):
+            combinations.append(dict(zip(names, values)))
+    return combinations
+
+def getSizeEstimate(obj, basedir = REPODIR):
+    '''
+    Returns the estimated number of input elements of the (substituted) keyword
+    arguments, i.e. the elements of all arrays, where the size of a __call__ value is
+    the product of its integer arguments.
+    '''
+    if isinstance(obj, dict):
+        if '__ndarray__' in obj:
+            return int(np.size(obj['__ndarray__']))
+        if '__npy__' in obj:
+            try:
+                return os.path.getsize(os.path.join(basedir, obj['__npy__'])) // 8
+            except OSError:
+                return 0
+        if '__call__' in obj:
+            integers = [value for value in obj.get('args', [])
+                        if isinstance(value, int) and not isinstance(value, bool)]
+            return int(np.prod(integers)) if integers else 1
+        return sum(getSizeEstimate(value, basedir) for value in obj.values())
+    if isinstance(obj, list):
+        if obj and all(isinstance(value, (int, float)) for value in obj):
+            return len(obj)
+        return sum(getSizeEstimate(value, basedir) for value in obj)
+    return 0
+
+def expandSpec(spec, basedir):
+    '''
+    Expands the grids of all jobs of the spec.
+    :param spec: dict as returned by load_spec
+    :param basedir: string, directory of relative outdir and __npy__ paths (the
+        directory of the spec file)
+    :returns jobs: list of BatchJobs in the order of the spec
+    '''
+    defaults = spec.get('defaults', {})
+    jobs = []
+    for entry in spec['jobs']:
+        entry = dict(defaults, **entry)
+        entry['params'] = dict(defaults.get('params', {}), **entry.get('params', {}))
+        for name in ['template', 'function']:
+            if name not in entry:
+                raise ValueError("Job {} of the spec has no {}.".format(
+                                 entry.get('name', len(jobs)), name))
+        outdir = os.path.join(basedir, entry.get('outdir', 'out'))
+        grid = entry.get('grid')
+        if any('index' in names for names in (grid if isinstance(grid, list) else [grid])
+               if names is not None):
+            raise ValueError("Job {} of the spec has a grid parameter named index "
+                             "(reserved for the job index).".format(
+                             entry.get('name', len(jobs))))
+        for index, params in enumerate(_expandGrid(grid)):
+            kwargs = dict(entry['params'])
+            kwargs.update({name: value for name, value in params.items()
+                           if not name.startswith('_')})
+            kwargs = _substitute(kwargs, params)
+            outname = entry.get('outname')
+            if outname is not None:
+                outname = outname.format(index = index, **params)
+                kwargs['outname'] = outname
+            kwargs['outdir'] = outdir
+            key = getValueKey([entry['template'], entry['function'], kwargs])
+            if key is None:
+                raise ValueError("The parameters of job {} can not be hashed.".format(
+                                 entry.get('name')))
+            jobs.append(BatchJob(entry.get('name', entry['function']), entry['template'],
+                                 entry['function'], kwargs, params, basedir, outdir,
+                                 outname, key, getSizeEstimate(kwargs, basedir)))
+    return jobs
+
+def dropDuplicates(jobs):
+    '''
+    Drops repeated jobs (of equal keys).
+    :returns jobs, duplicates: lists of the unique jobs (in order) and the dropped jobs
+    :raises ValueError: if different jobs write the same output
+    '''
+    unique, duplicates = OrderedDict(), []
+    outputs = {}
+    for job in jobs:
+        if job.key in unique:
+            duplicates.append(job)
+            continue
+        if job.outname is not None:
+            output = os.path.join(job.outdir, job.outname)
+            if output in outputs:
+                raise ValueError("The jobs {} and {} both write {}.".format(
+                                 outputs[output].name, job.name, output))
+            outputs[output] = job
+        unique[job.key] = job
+    return list(unique.values()), duplicates
+
+class CostModel:
+    '''
+    Render times of previous runs, per job key and per plot function (the latter with
+    the mean input size of its jobs), stored as JSON file.
+    '''
+
+    def __init__(self, path = BATCH_COST_FILE):
+        self.path = path
+        try:
+            with open(path, 'r') as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = {}
+        self.jobs = data.get('jobs', {})
+        self.functions = data.get('functions', {})
+
+    @staticmethod
+    def _getFunctionKey(job):
+        return '{}:{}'.format(job.template, job.function)
+
+    def predict(self, job):
+        '''
+        Returns the predicted render time of job in seconds (or None without history).
+        '''
+        if job.key in self.jobs:
+            return self.jobs[job.key]
+        if self._getFunctionKey(job) in self.functions:
+            seconds, size, n = self.functions[self._getFunctionKey(job)]
+            return seconds / n * (job.size / (size / n) if size > 0 else 1.0)
+        return None
+
+    def update(self, job, seconds):
+        self.jobs[job.key] = seconds
+        total, size, n = self.functions.get(self._getFunctionKey(job), (0.0, 0, 0))
+        self.functions[self._getFunctionKey(job)] = (total + seconds, size + job.size,
+                                                      n + 1)
+
+    def save(self):
+        with atomic_write(self.path) as tmpfile:
+            with open(tmpfile, 'w') as fh:
+                json.dump({'jobs': self.jobs, 'functions': self.functions}, fh)
+
+def orderJobs(jobs, costModel = None):
+    '''
+    Orders the jobs by decreasing predicted cost, where jobs without history come first
+    (ordered by decreasing input size).
+    '''
+    costModel = costModel if costModel is not None else CostModel()
+    predictions = [costModel.predict(job) for job in jobs]
+    order = sorted(range(len(jobs)),
+                   key = lambda k: (predictions[k] is not None,
+                                    -(predictions[k] or 0.0), -jobs[k].size, k))
+    return [jobs[k] for k in order]
+
+def _getCallable(name, loadScript = loadTemplate):
+    '''
+    Returns the function of "module.function" or "script.py:function" (relative to
+    the repository root, imported by loadScript).
+    '''
+    if ':' in name:
+        path, function = name.rsplit(':', 1)
+        return getattr(loadScript(path), function)
+    modulename, function = name.rsplit('.', 1)
+    return getattr(importlib.import_module(modulename), function)
+
+def _getReadOnly(value):
+    '''
+    Returns read-only views of the arrays in value (also within tuples and lists).
+    '''
+    if isinstance(value, np.ndarray):
+        value = value.view()
+        value.flags.writeable = False
+        return value
+    if isinstance(value, (tuple, list)):
+        return type(value)(_getReadOnly(item) for item in value)
+    return value
+
+def evaluateArguments(obj, basedir, loadScript = loadTemplate):
+    '''
+    Evaluates the (substituted) keyword arguments of a job (see module docstring).
+    :param basedir: string, directory of relative __npy__ paths
+    :param loadScript: function, which imports the scripts of "script.py:function"
+        calls (e.g. restricted to the scripts served by the render daemon)
+    The results of __call__ values are cached and shared by all jobs of the process,
+    hence their arrays are returned read-only, such that a plot function modifying its
+    input in place raises instead of corrupting the input of later jobs.
+    '''
+    if isinstance(obj, dict):
+        if '__ndarray__' in obj:
+            return np.asarray(obj['__ndarray__'], dtype = obj.get('dtype'))
+        if '__npy__' in obj:
+            return np.load(os.path.join(basedir, obj['__npy__']))
+        if '__call__' in obj:
+            key = getValueKey(obj)
+            if key not in _values:
+                args = evaluateArguments(obj.get('args', []), basedir, loadScript)
+                kwargs = evaluateArguments(obj.get('kwargs', {}), basedir, loadScript)
+                _values[key] = _getReadOnly(_getCallable(obj['__call__'], loadScript)(
+                                            *args, **kwargs))
+                while len(_values) > BATCH_VALUE_CACHE_SIZE:
+                    _values.popitem(last = False)
+            return _values[key]
+        return {key: evaluateArguments(value, basedir, loadScript)
+                for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [evaluateArguments(value, basedir, loadScript) for value in obj]
+    return obj
+
+def _runSpecJob(template, function, kwargs, basedir):
+    '''
+    Runs one job (in the calling or in a worker process).
+    :returns outcome: dict with the keys ok, result, seconds and error
+    '''
+    start = time.perf_counter()
+    try:
+        kwargs = evaluateArguments(kwargs, basedir)
+        result = getattr(loadTemplate(template), function)(**kwargs)
+    except (Exception, SystemExit) as exc:
+        return {'ok': False, 'result': None, 'seconds': time.perf_counter() - start,
+                'error': '{}: {}'.format(type(exc).__name__, exc),
+                'traceback': traceback.format_exc()}
+    return {'ok': True, 'result': result, 'seconds': time.perf_counter() - start,
+            'error': None}
+
+def run_batch(jobs, executor = 'serial', n_workers = None, memory_budget = None,
+              socketPath = None, costModel = None, verbose = True):
+    '''
+    Runs the jobs in the given order.
+    :param jobs: sequence of BatchJobs (see expandSpec, dropDuplicates and orderJobs)
+    :param executor: string, one of BATCH_EXECUTORS
+    :param n_workers: int, number of worker processes of the process executor
+    :param memory_budget: float, RSS in MB, above which workers of the process executor
+        are replaced (see parallelSweep.run_bounded_sweep)
+    :param socketPath: string, socket of the render daemon (daemon executor)
+    :param costModel: CostModel, which is updated with the render times and saved
+    :returns results: list of BatchResult tuples (job, ok, result, seconds, error)
+    '''
+    jobs = list(jobs)
+    if executor not in BATCH_EXECUTORS:
+        raise ValueError("Unknown executor '{}' encountered.".format(executor))
+    for outdir in set(job.outdir for job in jobs):
+        os.makedirs(outdir, exist_ok = True)
+
+    if executor == 'serial':
+        outcomes = []
+        for job in jobs:
+            outcomes.append(_runSpecJob(job.template, job.function, job.kwargs,
+                                        job.basedir))
+            if verbose:
+                print(formatBatchResult(BatchResult(job, **_select(outcomes[-1]))))
+    elif executor == 'process':
+        sweep = [(_runSpecJob, {'template': job.template, 'function': job.function,
+                                'kwargs': job.kwargs, 'basedir': job.basedir})
+                 for job in jobs]
+        if memory_budget is not None:
+            outcomes = run_bounded_sweep(sweep, n_workers = n_workers,
+                                         memory_budget = memory_budget,
+                                         verbose = verbose).results
+        else:
+            outcomes = run_sweep(sweep, n_workers = n_workers)
+    else:
+        # (the daemon evaluates the arguments, see renderDaemon.RenderServer.render)
+        messages = [{'template': job.template, 'function': job.function,
+                     'kwargs': job.kwargs, 'basedir': job.basedir}
+                    for job in jobs]
+        outcomes = [{'ok': response['ok'], 'result': response.get('result'),
+                     'seconds': response.get('seconds', 0.0),
+                     'error': response.get('error')}
+                    for response in submit(messages, socketPath or RENDER_DAEMON_SOCKET)]
+
+    results = [BatchResult(job, **_select(outcome)) for job, outcome in zip(jobs, outcomes)]
+    if verbose and executor != 'serial':
+        for result in results:
+            print(formatBatchResult(result))
+    if costModel is not None:
+        for result in results:
+            if result.ok:
+                costModel.update(result.job, result.seconds)
+        costModel.save()
+    return results
+
+def _select(outcome):
+    return {name: outcome[name] for name in ['ok', 'result', 'seconds', 'error']}
+
+def formatBatchResult(result):
+    if result.ok:
+        return '{:<24s} {} ({:.3f} s)'.format(result.job.name, result.result,
+                                               result.seconds)
+    return '{:<24s} {} failed ({})'.format(result.job.name, result.job.outname,
+                                           result.error)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Batch runner of template job specs.')
+    parser.add_argument('specs', nargs = '+', help = 'JSON or YAML job specs')
+    parser.add_argument('--executor', choices = BATCH_EXECUTORS, default = 'serial',
+                        help = 'executor of the jobs (default: %(default)s)')
+    parser.add_argument('--workers', type = int, default = None,
+                        help = 'worker processes of the process executor')
+    parser.add_argument('--memory-budget', type = float, default = None,
+                        help = 'RSS in MB, above which workers are replaced')
+    parser.add_argument('--socket', default = None, help = 'socket of the render daemon')
+    parser.add_argument('--costs', default = BATCH_COST_FILE,
+                        help = 'render time history (default: %(default)s)')
+    parser.add_argument('--dry-run', action = 'store_true',
+                        help = 'only print the ordered jobs')
+    args = parser.parse_args()
+
+    jobs = []
+    for path in args.specs:
+        jobs += expandSpec(load_spec(path), os.path.dirname(os.path.abspath(path)))
+    jobs, duplicates = dropDuplicates(jobs)
+    costModel = CostModel(args.costs)
+    jobs = orderJobs(jobs, costModel)
+    print("{} jobs ({} duplicates dropped)".format(len(jobs), len(duplicates)))
+
+    if args.dry_run:
+        for job in jobs:
+            prediction = costModel.predict(job)
+            print('{:<24s} {:<56s} {}'.format(job.name, str(job.outname),
+                  'unknown' if prediction is None else '{:.3f} s'.format(prediction)))
+        sys.exit(0)
+
+    start = time.perf_counter()
+    results = run_batch(jobs, executor = args.executor, n_workers = args.workers,
+                        memory_budget = args.memory_budget, socketPath = args.socket,
+                        costModel = costModel)
+    failed = [result for result in results if not result.ok]
+    print("{} of {} jobs succeeded in {:.1f} s".format(len(results) - len(failed),
+          len(results), time.perf_counter() - start))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,255 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: benchmark_templates.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Benchmark suite of the template plot functions (see templateBenchmarks.py).
+
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python benchmark_templates.py --update
+to measure all cases and to store the results as baseline (baselines/baseline.json).
+The baseline is not updated, if any of the cases fails.
+After modifying the templates or upgrading matplotlib, invoke
+$python benchmark_templates.py
+to measure all cases again and to compare them against the baseline. The script exits
+with status 1, if any case regressed by more than the tolerance.
+-------------------------------------------------------------------------------
+$python benchmark_templates.py --cases pcolor image --repeat 5 --tolerance 0.1
+only runs the cases pcolor and image (5 timed calls each) with a tolerance of 10 %.
+-------------------------------------------------------------------------------
+Baselines are machine specific, i.e. compare only results of the same machine.
+'''
+
+import sys
+sys.path.append('../')
+import os
+import inspect
+import argparse
+import tempfile
+import numpy as np
+from scipy.stats import norm
+
+from templateBenchmarks import BenchmarkCase
+from templateBenchmarks import run_benchmarks
+from templateBenchmarks import save_baseline
+from templateBenchmarks import load_baseline
+from templateBenchmarks import compareResults
+from templateBenchmarks import formatRegression
+from templateBenchmarks import BENCHMARK_REPEAT
+from templateBenchmarks import BENCHMARK_TOLERANCE
+from templateBenchmarks import BENCHMARK_RSS_TOLERANCE
+from templateBenchmarks import loadTemplateFunction
+from syntheticFields import getRampField
+from mplUtils import getHistogramCoordinates
+
+BASEDIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BASEDIR, 'baselines', 'baseline.json')
+
+CORRELATION_TEMPLATE = \
+    'mpl_correlation2d_with_marginals/plot_correlatedGaussian_wMarginals.py'
+
+# seed of the synthetic input data
+SEED = 123456789
+
+##########################################################################################
+# keyword arguments of the plot functions per problem size
+
+def getPcolorKwargs(size, outdir):
+    '''
+    size x size ramp field on a unit grid.
+    '''
+    xVals = np.arange(size, dtype = float)
+    step = max(1, size // 5)
+    xFormat = ('linear', -0.5, size - 0.5, 0.0, size, step, step, r'x axis label')
+    yFormat = ('linear', -0.5, size - 0.5, 0.0, size, step, step, r'y axis label')
+    Z = getRampField(xVals, xVals, slope = 0.2)
+    return {'X': xVals, 'Y': xVals, 'Z': Z,
+            'fProps': (4.0, 4.0, 0.16, 0.80, 0.16, 0.88),
+            'xFormat': xFormat,
+            'yFormat': yFormat,
+            'zFormat': ('linear', 0.0, np.max(Z), np.max(Z) / 5.0),
+            'zColor': ('viridis', np.min(Z), np.max(Z), r'z label (cbar)'),
+            'outname': 'benchmark_pcolor_{}'.format(size),
+            'outdir': outdir,
+            'datestamp': False}
+
+def getImageKwargs(size, outdir):
+    '''
+    size x size ramp image with colorbar.
+    '''
+    img = getRampField(np.arange(size), np.arange(size), slope = 0.2)
+    return {'img': img,
+            'fProps': (4.0, 4.0, 0.12, 0.88, 0.12, 0.88),
+            'zFormat': ('linear', 0.0, np.max(img), np.max(img) / 5.0),
+            'zColor': ('viridis', np.min(img), np.max(img), r'cb label (cbar)'),
+            'show_colorbar': True,
+            'outname': 'benchmark_image_{}'.format(size),
+            'outdir': outdir,
+            'datestamp': False}
+
+def getABPanelKwargs(size, outdir):
+    '''
+    Two size x size uniform random images.
+    '''
+    rng = np.random.default_rng(SEED)
+    return {'data': [rng.random((size, size)), rng.random((size, size))],
+            'cmaps': ['gray', 'viridis'],
+            'outname': 'benchmark_AB_panel_{}'.format(size),
+            'outdir': outdir,
+            'top_height_frac': 0.1,
+            'bottom_height_frac': 0.1,
+            'left_width_frac': 0.02,
+            'right_width_frac': 0.02,
+            'wspace': 0.015,
+            'anno_dict': {'A_top_left': 'top left label',
+                          'B_top_left': 'top left label',
+                          'A_bottom_left': 'image matrix {}'.format(size)},
+            'dpi': 300,
+            'datestamp': False}
+
+def getPatchArrayKwargs(size, outdir):
+    '''
+    size x size array of 5 x 5 random patches.
+    '''
+    rng = np.random.default_rng(SEED)
+    return {'X': [rng.random((5, 5)) for k in range(size * size)],
+            'nrows': size,
+            'ncols': size,
+            'outname': 'benchmark_patch_array_{}'.format(size),
+            'outdir': outdir,
+            'cmap': 'gray',
+            'datestamp': False}
+
+def getCorrelationKwargs(size, outdir):
+    '''
+    size fully correlated normal samples with their marginal distributions.
+    '''
+    mu1, sigma1, mu2, sigma2 = 87.25, 8.124, 125.75, 11.25
+    # (the annotations of Plot read these parameters from the globals of the script)
+    plot = loadTemplateFunction(CORRELATION_TEMPLATE, 'Plot')
+    inspect.unwrap(plot).__globals__.update(
+        mu1 = mu1, sigma1 = sigma1, mu2 = mu2, sigma2 = sigma2)
+    z = np.random.default_rng(SEED).standard_normal(size)
+    X = np.column_stack([mu1 + sigma1 * z, mu2 + sigma2 * z])
+    xVals1 = np.linspace(0.0, 135.0, 700)
+    xVals2 = np.linspace(0.0, 175.0, 700)
+    return {'X': X,
+            'marginalX': np.column_stack([xVals1, norm.pdf(xVals1, mu1, sigma1)]),
+            'marginalY': np.column_stack([xVals2, norm.pdf(xVals2, mu2, sigma2)]),
+            'params': [r'$\rho = 1.0$'],
+            'outname': 'benchmark_correlation_{}'.format(size),
+            'outdir': outdir,
+            'pColors': ['C0', '#999999'],
+            'xFormat': (48.0, 123.0, 40.0, 1.02 * 123.0, 20.0, 5.0),
+            'yFormat': (78.0, 177.0, 60.0, 1.02 * 177.0, 20.0, 5.0),
+            'datestamp': False}
+
+def getScatterHistogramKwargs(size, outdir):
+    '''
+    Histogram of exponential samples with size bins and the analytical density.
+    '''
+    samples = np.random.default_rng(SEED).exponential(1.5, 100 * size)
+    xVals = np.linspace(0.0, 20.0, 500)
+    return {'X': np.column_stack([xVals, np.exp(-xVals / 1.5) / 1.5]),
+            'Y': getHistogramCoordinates(samples, n_bins = size, density = True),
+            'outname': 'benchmark_scatter_histogram_{}'.format(size),
+            'outdir': outdir,
+            'pColors': ['C3'],
+            'datestamp': False}
+
+def getBinnedHistogramKwargs(size, outdir):
+    '''
+    Normal distribution binned into size bins.
+    '''
+    bins = np.linspace(0.0, 1.0, size + 1)
+    values = norm.pdf((bins[1:] + bins[:-1]) / 2.0, loc = 0.5, scale = 0.184)
+    return {'bins': bins,
+            'values': values / np.sum(values),
+            'outname': 'benchmark_binned_histogram_{}'.format(size),
+            'outdir': outdir,
+            'pColors': {'blue': '#0000FF', 'opaque_standard_blue': '#6666ff'},
+            'datestamp': False}
+
+##########################################################################################
+# benchmark cases (paths relative to the repository root)
+
+CASES = [
+    BenchmarkCase('pcolor',
+                  'mpl_pcolormesh_with_fixed_size_and_relative_border_margins/'
+                  'mpl_pcolormesh_with_fixed_size_and_relative_border_margins.py',
+                  'plot_pcolor', getPcolorKwargs, (10, 100, 500)),
+    BenchmarkCase('image', 'mpl_imshow_template/mpl_imshow_template.py',
+                  'plot_image', getImageKwargs, (32, 256, 1024)),
+    BenchmarkCase('AB_panel', 'mpl_imshow_AB_panel/mpl_imshow_AB_panel.py',
+                  'plot_AB_panel', getABPanelKwargs, (64, 256, 1024)),
+    BenchmarkCase('patch_array', 'mpl_array_plot/mpl_array_plot.py',
+                  'plot_patch_array', getPatchArrayKwargs, (3, 6, 12)),
+    BenchmarkCase('correlation', CORRELATION_TEMPLATE, 'Plot', getCorrelationKwargs,
+                  (1000, 100000, 1000000)),
+    BenchmarkCase('scatter_histogram', 'mpl_scatter_histogram/mpl_scatter_histogram.py',
+                  'Plot', getScatterHistogramKwargs, (25, 250, 2500)),
+    BenchmarkCase('binned_histogram',
+                  'mpl_histogram_of_already_binned_data/'
+                  'mpl_histogram_of_already_binned_data.py',
+                  'Plot', getBinnedHistogramKwargs, (30, 300, 3000)),
+]
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Template benchmark suite.')
+    parser.add_argument('--update', action = 'store_true',
+                        help = 'store the results as new baseline')
+    parser.add_argument('--baseline', default = BASELINE_FILE,
+                        help = 'baseline file (default: %(default)s)')
+    parser.add_argument('--cases', nargs = '+', default = None,
+                        help = 'names of the cases to run (default: all)')
+    parser.add_argument('--repeat', type = int, default = BENCHMARK_REPEAT,
+                        help = 'timed calls per case and size (default: %(default)s)')
+    parser.add_argument('--tolerance', type = float, default = BENCHMARK_TOLERANCE,
+                        help = 'tolerated relative slowdown (default: %(default)s)')
+    parser.add_argument('--rss-tolerance', type = float,
+                        default = BENCHMARK_RSS_TOLERANCE,
+                        help = 'tolerated relative peak RSS increase (default: %(default)s)')
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if args.cases is None or case.name in args.cases]
+
+    with tempfile.TemporaryDirectory() as outdir:
+        results = run_benchmarks(cases, outdir, repeat = args.repeat)
+
+    if args.update:
+        failed = [key for key, result in results.items() if 'error' in result]
+        if failed:
+            print("Not updating the baseline, since {} failed:".format(', '.join(failed)))
+            for key in failed:
+                print(results[key].get('traceback', results[key]['error']))
+            sys.exit(1)
+        if os.path.isfile(args.baseline):
+            # keep the baseline of the cases, which were not run
+            baseline = load_baseline(args.baseline)['results']
+            baseline.update(results)
+            results = baseline
+        print("Baseline written to", save_baseline(results, args.baseline))
+        sys.exit(0)
+
+    if not os.path.isfile(args.baseline):
+        print("No baseline found at {} (create it using --update).".format(args.baseline))
+        sys.exit(0)
+
+    baseline = load_baseline(args.baseline)
+    print("Baseline of", baseline['environment'])
+    regressions = compareResults(results, baseline,
+                                 tolerance = args.tolerance,
+                                 rssTolerance = args.rss_tolerance)
+    for regression in regressions:
+        print("REGRESSION", formatRegression(regression))
+    if regressions:
+        sys.exit(1)
+    print("No regressions.")
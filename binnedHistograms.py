@@ -0,0 +1,339 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: binnedHistograms.py
+# tested with python 3.11.7 in conjunction with numpy 2.4.6
+##########################################################################################
+
+'''
+Fixed grid histograms, which are accumulated chunk by chunk.
+
+Passing the raw samples to ax.scatter and ax.hist requires all samples in memory and
+draws (and writes to pdf) one marker per sample. Instead, the samples are streamed
+through fixed bin edges, where only the bin counts are kept:
+    ##############################################
+    from sampleStore import iter_sample_chunks
+    from binnedHistograms import BinnedHistogram2d
+    # other code ...
+    joint = BinnedHistogram2d.fromRange((48.0, 123.0), (78.0, 177.0), bins = 200)
+    for chunk in iter_sample_chunks(os.path.join(RAWDIR, 'GaussianSamples')):
+        joint.update(chunk)
+    ax1.imshow(joint.density().T, extent = joint.extent, origin = 'lower')
+    # other code ...
+    ##############################################
+The counts agree with np.histogram, respectively np.histogram2d, of the concatenated
+samples for the same bin edges (samples outside of the edges are not counted).
+Partial histograms (e.g. of several worker processes) are combined using merge, and
+are drawn directly from their counts, without a second binning pass of ax.hist:
+    ##############################################
+    hist = BinnedHistogram.fromCounts(bins, values) # already binned data
+    hist.rebin(2).bar(ax1, color = pColors['blue'], edgecolor = 'k')
+    hist.stairs(ax1, density = True, color = 'k')
+    ##############################################
+'''
+
+import numpy as np
+
+def _uniformWidth(edges):
+    '''
+    Returns the bin width of equally spaced edges, or None for non-uniform edges.
+    '''
+    widths = np.diff(edges)
+    if np.allclose(widths, widths[0], rtol = 1.0e-12, atol = 0.0):
+        return widths[0]
+    return None
+
+def getBinIndices(values, edges):
+    '''
+    Returns the bin index of every value for the given (increasing) bin edges, where
+    every bin is half open [left, right), except the last bin, which includes its
+    right edge (as np.histogram). Values outside of the edges or non-finite values
+    are assigned the index -1.
+    For equally spaced edges the indices are computed arithmetically, which is
+    considerably faster than a binary search.
+    '''
+    values = np.asarray(values, dtype = float)
+    edges = np.asarray(edges, dtype = float)
+    n_bins = len(edges) - 1
+    inside = (values >= edges[0]) & (values <= edges[-1])
+    width = _uniformWidth(edges)
+    if width is None:
+        indices = np.searchsorted(edges, values, side = 'right') - 1
+        indices[values == edges[-1]] = n_bins - 1
+    else:
+        # (non-finite values are replaced, they are masked below anyway)
+        offsets = np.where(inside, values, edges[0]) - edges[0]
+        indices = (offsets / width).astype(np.intp)
+        np.clip(indices, 0, n_bins - 1, out = indices)
+        # correct rounding errors at the bin edges (as np.histogram)
+        indices -= (values < edges[indices])
+        indices += (values >= edges[indices + 1]) & (indices != n_bins - 1)
+    indices[~inside] = -1
+    return indices
+
+def getCoarseIndices(edges, coarseEdges):
+    '''
+    Returns the positions of the coarse bin edges within the (fine) bin edges.
+    :raises ValueError: if coarseEdges is not a subset of edges
+    '''
+    edges = np.asarray(edges, dtype = float)
+    coarseEdges = np.asarray(coarseEdges, dtype = float)
+    indices = np.clip(np.searchsorted(edges, coarseEdges), 0, len(edges) - 1)
+    # (tolerate rounding errors of recomputed edges, e.g. by np.linspace)
+    below = np.clip(indices - 1, 0, len(edges) - 1)
+    closer = np.abs(edges[below] - coarseEdges) < np.abs(edges[indices] - coarseEdges)
+    indices = np.where(closer, below, indices)
+    scale = np.max(np.abs(edges))
+    if len(coarseEdges) < 2 or np.any(np.diff(indices) <= 0) or \
+       not np.allclose(edges[indices], coarseEdges, rtol = 0.0, atol = 1.0e-9 * scale):
+        raise ValueError("The coarse bin edges must be a subset of the bin edges.")
+    return indices
+
+class BinnedHistogram:
+    '''
+    Histogram of 1d samples for fixed bin edges.
+    The counts are integers for accumulated samples, or any (e.g. float) values for
+    already binned data (see fromCounts).
+    '''
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype = float)
+        self.counts = np.zeros(len(self.edges) - 1, dtype = np.int64)
+
+    @classmethod
+    def fromRange(cls, range, bins):
+        '''
+        Histogram with bins equally spaced bins spanning range = (min, max).
+        '''
+        return cls(np.linspace(range[0], range[1], bins + 1))
+
+    @classmethod
+    def fromCounts(cls, edges, counts):
+        '''
+        Histogram of already binned data, i.e. of the given counts (or weights) per bin.
+        '''
+        hist = cls(edges)
+        counts = np.asarray(counts)
+        if counts.shape != hist.counts.shape:
+            raise ValueError("Expected {} counts for {} bin edges, got {}.".format(
+                             len(hist.counts), len(hist.edges), counts.shape))
+        hist.counts = counts.copy()
+        return hist
+
+    @classmethod
+    def fromData(cls, values, bins = 10, range = None):
+        '''
+        Histogram of the values with the bin edges chosen as by np.histogram(values,
+        bins, range), i.e. a drop-in replacement of np.histogram.
+        '''
+        values = np.ravel(values)
+        return cls(np.histogram_bin_edges(values, bins = bins, range = range)).update(values)
+
+    @property
+    def centers(self):
+        return (self.edges[1:] + self.edges[:-1]) / 2.0
+
+    def update(self, values):
+        '''
+        Adds the values (array of any shape) to the histogram.
+        :returns self:
+        '''
+        indices = getBinIndices(np.ravel(values), self.edges)
+        self.counts = self.counts + np.bincount(indices[indices >= 0],
+                                                minlength = len(self.counts))
+        return self
+
+    def merge(self, *others):
+        '''
+        Adds the counts of other histograms of the same bin edges, e.g. the partial
+        histograms of several worker processes.
+        :returns self:
+        '''
+        for other in others:
+            if not np.array_equal(self.edges, other.edges):
+                raise ValueError("Only histograms of identical bin edges can be merged.")
+            self.counts = self.counts + other.counts
+        return self
+
+    def rebin(self, edges):
+        '''
+        Returns a new histogram of coarser bins, where the counts of the merged bins are
+        summed up (counts outside of the coarse edges are discarded).
+        :param edges: coarse bin edges (a subset of self.edges) or int, the number of
+            consecutive bins merged into one bin (which has to divide the number of bins)
+        :returns hist: BinnedHistogram
+        '''
+        if np.isscalar(edges):
+            factor = int(edges)
+            if factor < 1 or len(self.counts) % factor:
+                raise ValueError("Cannot merge {} bins into groups of {}.".format(
+                                 len(self.counts), edges))
+            indices = np.arange(0, len(self.edges), factor)
+        else:
+            indices = getCoarseIndices(self.edges, edges)
+        hist = type(self)(self.edges[indices])
+        hist.counts = np.add.reduceat(self.counts, indices[:-1])
+        # (reduceat sums up to the end of the array for the last index)
+        hist.counts[-1] = self.counts[indices[-2]:indices[-1]].sum()
+        return hist
+
+    def density(self):
+        '''
+        Returns the probability density of the binned samples (as np.histogram for
+        density = True).
+        '''
+        total = self.counts.sum()
+        if total == 0:
+            return np.zeros(len(self.counts))
+        return self.counts / np.diff(self.edges) / total
+
+    def getValues(self, density = False):
+        return self.density() if density else self.counts
+
+    def getCoordinates(self, density = False):
+        '''
+        Returns the (bin center, count) pairs as numpy ndarray of shape (n_bins, 2).
+        '''
+        res = np.zeros((len(self.counts), 2))
+        res[:, 0] = self.centers
+        res[:, 1] = self.getValues(density)
+        return res
+
+    def stairs(self, ax, density = False, **kwargs):
+        '''
+        Draws the histogram as step line (or filled step area for fill = True) using
+        ax.stairs, i.e. without binning the data again as ax.hist does.
+        :returns handle: StepPatch
+        '''
+        return ax.stairs(self.getValues(density), self.edges, **kwargs)
+
+    def bar(self, ax, density = False, **kwargs):
+        '''
+        Draws the histogram as bars using ax.bar, which looks as ax.hist(...,
+        histtype = 'bar') of the binned samples.
+        :returns handle: BarContainer
+        '''
+        return ax.bar(self.edges[:-1], self.getValues(density), np.diff(self.edges),
+                      align = 'edge', **kwargs)
+
+class BinnedHistogram2d:
+    '''
+    Histogram of 2d samples (x, y) for fixed bin edges along both axes, where
+    counts[i, j] counts the samples of the x bin i and the y bin j (as np.histogram2d).
+    Further accumulates the first and second moments of the binned samples.
+    '''
+
+    def __init__(self, xEdges, yEdges):
+        self.xEdges = np.asarray(xEdges, dtype = float)
+        self.yEdges = np.asarray(yEdges, dtype = float)
+        self.counts = np.zeros((len(self.xEdges) - 1, len(self.yEdges) - 1),
+                               dtype = np.int64)
+        # sums of (x - x0), (y - y0) and their products (shifted for numerical stability)
+        self._shift = None
+        self._sums = np.zeros(5)
+
+    @classmethod
+    def fromRange(cls, xRange, yRange, bins):
+        '''
+        Histogram with equally spaced bins, bins = n or (nx, ny).
+        '''
+        nx, ny = (bins, bins) if np.isscalar(bins) else bins
+        return cls(np.linspace(xRange[0], xRange[1], nx + 1),
+                   np.linspace(yRange[0], yRange[1], ny + 1))
+
+    @property
+    def extent(self):
+        '''
+        (xmin, xmax, ymin, ymax) as used by imshow.
+        '''
+        return (self.xEdges[0], self.xEdges[-1], self.yEdges[0], self.yEdges[-1])
+
+    def update(self, samples):
+        '''
+        Adds the samples, an array of shape (n_samples, 2), to the histogram.
+        :returns self:
+        '''
+        samples = np.asarray(samples, dtype = float)
+        ix = getBinIndices(samples[:, 0], self.xEdges)
+        iy = getBinIndices(samples[:, 1], self.yEdges)
+        valid = (ix >= 0) & (iy >= 0)
+        nx, ny = self.counts.shape
+        flat = ix[valid] * ny + iy[valid]
+        self.counts += np.bincount(flat, minlength = nx * ny).reshape(nx, ny)
+
+        if np.any(valid):
+            x, y = samples[valid, 0], samples[valid, 1]
+            if self._shift is None:
+                self._shift = (x[0], y[0])
+            dx, dy = x - self._shift[0], y - self._shift[1]
+            self._sums += (dx.sum(), dy.sum(), np.dot(dx, dx), np.dot(dy, dy),
+                           np.dot(dx, dy))
+        return self
+
+    def merge(self, *others):
+        '''
+        Adds the counts and the moments of other histograms of the same bin edges.
+        :returns self:
+        '''
+        for other in others:
+            if not (np.array_equal(self.xEdges, other.xEdges) and
+                    np.array_equal(self.yEdges, other.yEdges)):
+                raise ValueError("Only histograms of identical bin edges can be merged.")
+            self.counts = self.counts + other.counts
+            if other._shift is None:
+                continue
+            if self._shift is None:
+                self._shift = other._shift
+                self._sums = other._sums.copy()
+                continue
+            # shift the sums of other to the shift of self
+            n = other.counts.sum()
+            sx, sy, sxx, syy, sxy = other._sums
+            ddx, ddy = other._shift[0] - self._shift[0], other._shift[1] - self._shift[1]
+            self._sums += (sx + n * ddx, sy + n * ddy,
+                           sxx + 2.0 * ddx * sx + n * ddx * ddx,
+                           syy + 2.0 * ddy * sy + n * ddy * ddy,
+                           sxy + ddx * sy + ddy * sx + n * ddx * ddy)
+        return self
+
+    def marginal(self, axis = 0):
+        '''
+        Returns the marginal BinnedHistogram along x (axis = 0) or y (axis = 1).
+        '''
+        hist = BinnedHistogram(self.xEdges if axis == 0 else self.yEdges)
+        hist.counts = self.counts.sum(axis = 1 - axis)
+        return hist
+
+    def density(self):
+        '''
+        Returns the probability density of the binned samples (as np.histogram2d for
+        density = True).
+        '''
+        total = self.counts.sum()
+        if total == 0:
+            return np.zeros(self.counts.shape)
+        areas = np.outer(np.diff(self.xEdges), np.diff(self.yEdges))
+        return self.counts / (total * areas)
+
+    def getPearson(self):
+        '''
+        Returns the Pearson correlation coefficient of the binned samples, i.e. only of
+        the samples within the histogram range (in contrast to scipy.stats.pearsonr of
+        all samples). Returns NaN for less than two samples or a constant coordinate.
+        '''
+        n = self.counts.sum()
+        if n < 2:
+            return np.nan
+        sx, sy, sxx, syy, sxy = self._sums
+        covariance = sxy - sx * sy / n
+        variance = (sxx - sx * sx / n) * (syy - sy * sy / n)
+        if variance <= 0.0:
+            return np.nan
+        return covariance / np.sqrt(variance)
+
+if __name__ == '__main__':
+
+    pass
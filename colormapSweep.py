@@ -0,0 +1,207 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: colormapSweep.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Incremental rendering of one figure for a sweep of colormaps.
+
+Sweeping colormaps by calling a plot function per colormap rebuilds the figure, the
+axes, the colorbar, its ticks and its labels for every colormap, although only the
+lookup table of the mapped artists changes. Here the figure is built once and only the
+colormap of its mappables (e.g. QuadMesh, AxesImage or the mappable of a standalone
+colorbar, cb1.mappable) is swapped. Colorbars follow the swap of their mappable, where
+their locator, ticks and labels are kept, as long as the norm is unchanged:
+    ##############################################
+    from colormapSweep import ColormapSweep
+    from colormapSweep import getFigureKey
+    # other code ...
+    def plot_colorbar_sweep(params, cMaps, outnames, outdir, ...):
+        arguments = dict(locals())
+        # set up figure and colorbar cb1 ...
+        key = getFigureKey(plot_colorbar_sweep, arguments,
+                           exclude = ('cMaps', 'outnames', 'outdir'))
+        sweep = ColormapSweep(f, [cb1.mappable], outdir, formats = ['pdf', 'png'],
+                              key = key)
+        for cMap, outname in zip(cMaps, outnames):
+            sweep.render(cMap, outname)
+        return sweep.close()
+    # other code ...
+    ##############################################
+Given a key, which describes the content of the figure apart from the colormap, every
+written output is recorded in an OutputManifest of the output directory. Outputs,
+whose recorded key (of figure content, colormap, formats and name) is unchanged and
+whose files were not modified since, are not written again. Without a key, all outputs
+are written.
+'''
+
+import os
+import json
+from matplotlib import pyplot as plt
+
+from atomicWrite import atomic_write
+from figureExport import save_figure
+from renderCache import getValueKey
+from renderCache import getRenderKey
+
+# subdirectory of the output directory holding the manifest entries
+SWEEP_MANIFEST_DIR = '.sweep-manifest'
+
+def getOutputKey(key, *parts):
+    '''
+    Returns the hash (hex string) of the figure key and further parts by value (see
+    renderCache.getValueKey), or None if key is None or a part can not be hashed.
+    '''
+    if key is None:
+        return None
+    return getValueKey([key] + list(parts))
+
+def getFigureKey(func, kwargs, exclude = ('outdir',)):
+    '''
+    Returns the key of the figure created by func(**kwargs) for the rcParams in effect
+    (see renderCache.getRenderKey), or None if the arguments can not be hashed by value.
+    '''
+    return getRenderKey(func, (), kwargs, exclude = exclude)
+
+def _getFileStamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _swapColormap(mappable, cmap):
+    '''
+    Sets the colormap of mappable, where an attached colorbar keeps its tick locators,
+    tick formatters and axis limits. (A colorbar otherwise restores its own locators and
+    formatters and resets its limits to the norm, when redrawn for the new colormap,
+    e.g. dropping labels of set_ticklabels or minor ticks of cax.minorticks_on.)
+    '''
+    colorbar = getattr(mappable, 'colorbar', None)
+    if colorbar is None:
+        mappable.set_cmap(cmap)
+        return
+    axis = colorbar.long_axis
+    colorbar.locator = axis.get_major_locator()
+    colorbar.formatter = axis.get_major_formatter()
+    colorbar.minorlocator = axis.get_minor_locator()
+    colorbar.minorformatter = axis.get_minor_formatter()
+    limits = tuple(axis.get_view_interval())
+    mappable.set_cmap(cmap)
+    axis.set_view_interval(*limits, ignore = True)
+
+class OutputManifest:
+    '''
+    Record of the content key of every output written to outdir, with one entry file
+    per output name (such that concurrent workers never write the same entry).
+    '''
+
+    def __init__(self, outdir):
+        self.outdir = outdir
+        self.manifestdir = os.path.join(outdir, SWEEP_MANIFEST_DIR)
+
+    def _getEntryFile(self, outname):
+        return os.path.join(self.manifestdir, outname + '.json')
+
+    def isCurrent(self, outname, key, formats):
+        '''
+        Returns True, if the outputs outname.<fmt> of all formats were written for key
+        and were not modified since.
+        '''
+        if key is None:
+            return False
+        try:
+            with open(self._getEntryFile(outname), 'r') as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return False
+        if entry.get('key') != key:
+            return False
+        files = entry.get('files', {})
+        for fmt in formats:
+            try:
+                if _getFileStamp(os.path.join(self.outdir, outname + '.' + fmt)) != \
+                   files.get(fmt):
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def record(self, outname, key, formats):
+        '''
+        Records the outputs outname.<fmt> of all formats as written for key (a key of
+        None removes the entry).
+        '''
+        entryfile = self._getEntryFile(outname)
+        if key is None:
+            if os.path.isfile(entryfile):
+                os.remove(entryfile)
+            return
+        files = {fmt: _getFileStamp(os.path.join(self.outdir, outname + '.' + fmt))
+                 for fmt in formats}
+        with atomic_write(entryfile) as tmpfile:
+            with open(tmpfile, 'w') as fh:
+                json.dump({'key': key, 'files': files}, fh)
+
+class ColormapSweep:
+    '''
+    Writes the figure f for a sequence of colormaps, where only the colormap of the
+    given mappables is swapped between the outputs.
+    :param f: matplotlib figure instance, which is fully set up
+    :param mappables: sequence of ScalarMappables (QuadMesh, AxesImage, cb1.mappable)
+    :param outdir: string, output directory
+    :param formats: sequence of file formats (see figureExport.save_figure)
+    :param key: hex string (e.g. of getFigureKey) describing the figure content apart from
+        the colormap, or None, which writes every output
+    :param skipUnchanged: bool, if False, every output is written (and recorded)
+    '''
+
+    def __init__(self, f, mappables, outdir, formats = ('pdf',), key = None,
+                 skipUnchanged = True):
+        self.f = f
+        self.mappables = list(mappables)
+        self.outdir = outdir
+        self.formats = list(formats)
+        self.key = key
+        self.skipUnchanged = skipUnchanged
+        self.manifest = OutputManifest(outdir)
+        self.outnames = []
+        self.written = []
+        self.skipped = []
+
+    def render(self, cmap, outname, data = None):
+        '''
+        Writes the figure for the colormap cmap to outdir/outname.<fmt>, unless the
+        recorded outputs are current.
+        :param cmap: Colormap instance or registered colormap name
+        :param data: further content of this output (hashed into its key), which the
+            caller swapped on the figure before
+        :returns written: bool, False if the outputs were current and were skipped
+        '''
+        key = getOutputKey(self.key, cmap, data, self.formats, outname)
+        self.outnames.append(outname)
+        if self.skipUnchanged and self.manifest.isCurrent(outname, key, self.formats):
+            self.skipped.append(outname)
+            return False
+        for mappable in self.mappables:
+            if mappable.get_cmap() is not cmap:
+                _swapColormap(mappable, cmap)
+        save_figure(self.f, os.path.join(self.outdir, outname), self.formats)
+        self.manifest.record(outname, key, self.formats)
+        self.written.append(outname)
+        return True
+
+    def close(self):
+        '''
+        Closes the figure.
+        :returns outnames: list of all (written and skipped) output names in the order
+            of the render calls
+        '''
+        plt.close(self.f)
+        return self.outnames
+
+if __name__ == '__main__':
+
+    pass
@@ -9,29 +9,87 @@
 ##########################################################################################
 
 import os
+import time
 import datetime
+import subprocess
 from glob import glob as glob
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
 OUTDIR = os.path.join(BASEDIR, 'out_svg')
 
-os.makedirs(OUTDIR, exist_ok = True)
+# status is one of 'converted', 'skipped' (svg is up to date) or 'failed'
+ConversionResult = namedtuple('ConversionResult',
+                              ['pdf', 'svg', 'status', 'seconds', 'error'])
 
-def convert_pdf2svg(figures, outdir = OUTDIR):
+def convert_single_pdf2svg(figure, svgfile, skip_up_to_date = True, timeout = None):
+    '''
+    converts a single *.pdf figure to the svg file svgfile by running the command line
+    tool pdf2svg directly as a subprocess (i.e. without starting a shell)
+    returns a ConversionResult
+    '''
+    start = time.perf_counter()
+
+    if skip_up_to_date and os.path.exists(svgfile) and \
+        os.path.getmtime(svgfile) >= os.path.getmtime(figure):
+        return ConversionResult(figure, svgfile, 'skipped',
+                                time.perf_counter() - start, None)
+
+    try:
+        proc = subprocess.run(['pdf2svg', figure, svgfile],
+                              stdout = subprocess.PIPE,
+                              stderr = subprocess.PIPE,
+                              timeout = timeout)
+    except (OSError, subprocess.SubprocessError) as error:
+        return ConversionResult(figure, svgfile, 'failed',
+                                time.perf_counter() - start, str(error))
+
+    if proc.returncode != 0:
+        error = proc.stderr.decode(errors = 'replace').strip()
+        error = error or 'pdf2svg exited with status {}'.format(proc.returncode)
+        return ConversionResult(figure, svgfile, 'failed',
+                                time.perf_counter() - start, error)
+
+    return ConversionResult(figure, svgfile, 'converted',
+                            time.perf_counter() - start, None)
+
+def convert_pdf2svg(figures, outdir = OUTDIR, max_workers = None, skip_up_to_date = True,
+                    timeout = None):
     '''
     converts list of *.pdf figures (as contained in figures)
     to svg figures using the command line tool pdf2svg
+
+    The conversions run as concurrent pdf2svg subprocesses, of which at most max_workers
+    (default os.cpu_count()) are alive at any time. Figures whose svg file is already
+    newer than the pdf file are skipped, unless skip_up_to_date = False.
+    returns a list of ConversionResult tuples (pdf, svg, status, seconds, error),
+    in the order of figures
     '''
-    for figure in figures:
+    os.makedirs(outdir, exist_ok = True)
+
+    figures = list(figures)
+    svgfiles = [os.path.join(outdir, os.path.splitext(os.path.basename(figure))[0] + '.svg')
+                for figure in figures]
 
-        outname = os.path.splitext(os.path.basename(figure))[0]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(figures)))
 
-        cmd = 'pdf2svg ' + figure + \
-            ' ' + os.path.join(outdir, outname + '.svg')
+    # the work is done by the pdf2svg processes, hence threads suffice to drive them
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        results = list(executor.map(
+            lambda args: convert_single_pdf2svg(*args, skip_up_to_date = skip_up_to_date,
+                                                timeout = timeout),
+            zip(figures, svgfiles)))
 
-        os.system(cmd)
+    for result in results:
+        if result.status == 'failed':
+            print("Error: pdf2svg failed for", result.pdf, "::", result.error)
+
+    return results
 
 if __name__ == '__main__':
 
@@ -41,5 +99,8 @@ if __name__ == '__main__':
     # create candidate figure list via globbing
     figure_list = glob(glob_search_path)
 
-    convert_pdf2svg(figure_list,
-                    outdir = OUTDIR)
+    results = convert_pdf2svg(figure_list,
+                              outdir = OUTDIR)
+
+    for result in results:
+        print(result.status, '{:.3f} s'.format(result.seconds), result.svg)
@@ -0,0 +1,145 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: figureExport.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Multi-format figure export.
+
+Previously svg figures were created by first writing a pdf file and then converting it
+using the command line tool pdf2svg, i.e. every svg figure was rendered twice and
+written to disk twice. Here every requested format is rendered straight from the
+in-memory figure by its own matplotlib backend:
+    ##############################################
+    from figureExport import save_figure
+    # other code ...
+    save_figure(f, os.path.join(outdir, outname), formats = ['pdf', 'png', 'svg'])
+    # other code ...
+    ##############################################
+When writing several formats, save_all draws the layout only once (layout engine and
+tight bounding box) and reuses it for all remaining formats. It further reports the time
+spent in each format:
+    ##############################################
+    from figureExport import save_all
+    # other code ...
+    results = save_all(f, os.path.join(outdir, outname), formats = ['pdf', 'png', 'eps'],
+                       bbox_inches = 'tight', verbose = True)
+    # other code ...
+    ##############################################
+'''
+
+import time
+from collections import namedtuple
+import matplotlib as mpl
+
+# default savefig settings per format, as used throughout the template scripts
+FORMAT_DEFAULTS = {
+    'pdf': {'dpi': 300, 'transparent': True},
+    'png': {'dpi': 600, 'transparent': False},
+    'svg': {'dpi': 300, 'transparent': True},
+    'eps': {'dpi': 600, 'transparent': False}, # eps does not support transparency
+}
+
+# font embedding: TrueType (Type 42) fonts in pdf and eps output and text converted to
+# paths in svg output (equivalent to the previous pdf2svg output)
+EXPORT_RCPARAMS = {
+    'pdf.fonttype': 42,
+    'ps.fonttype': 42,
+    'svg.fonttype': 'path',
+}
+
+# timing record of save_all, where format is either the file format or 'layout' for the
+# shared layout pass (with path = None)
+SaveResult = namedtuple('SaveResult', ['format', 'path', 'seconds'])
+
+def _normalizeFormat(fmt):
+    fmt = fmt.lower().lstrip('.')
+    if fmt not in FORMAT_DEFAULTS:
+        raise ValueError("Unsupported output format '{}' encountered.".format(fmt))
+    return fmt
+
+def save_all(fig, basename, formats = ('pdf', 'png'), bbox_inches = None,
+             pad_inches = None, verbose = False, **kwargs):
+    '''
+    Writes the figure fig to basename + '.' + fmt for every fmt in formats, while
+    laying out the figure only once.
+    Without sharing, every savefig call re-runs the figure's layout engine (if any) and
+    for bbox_inches = 'tight' draws the figure an additional time to measure the tight
+    bounding box. Here the layout is computed by a single pass before (or during) the
+    first format, after which the layout engine is paused and the measured tight
+    bounding box is passed on to all formats. The original layout engine is restored
+    afterwards.
+    :param fig: matplotlib figure instance
+    :param basename: string, output path without file extension
+    :param formats: sequence of file formats, any of 'pdf', 'png', 'svg' and 'eps'
+    :param bbox_inches: None, 'tight' or a Bbox in inches (see Figure.savefig)
+    :param pad_inches: float, padding for bbox_inches = 'tight'.
+        Defaults to rcParams['savefig.pad_inches'].
+    :param verbose: bool, prints the time spent in each format
+    :param kwargs: additional savefig keyword arguments, which override the
+        FORMAT_DEFAULTS for all formats
+    :returns results: list of SaveResult tuples (format, path, seconds) in the order of
+        formats, preceded by a ('layout', None, seconds) entry if a separate layout pass
+        was required (bbox_inches = 'tight').
+    '''
+    formats = [_normalizeFormat(fmt) for fmt in formats]
+    results = []
+    engine = fig.get_layout_engine()
+
+    with mpl.rc_context(EXPORT_RCPARAMS):
+        try:
+            if bbox_inches == 'tight' and formats:
+                start = time.perf_counter()
+                # executes the layout engine and positions all artists without output
+                fig.draw_without_rendering()
+                if pad_inches is None:
+                    pad_inches = mpl.rcParams['savefig.pad_inches']
+                bbox_inches = fig.get_tightbbox().padded(pad_inches)
+                if engine is not None:
+                    fig.set_layout_engine('none')
+                results.append(SaveResult('layout', None, time.perf_counter() - start))
+
+            for fmt in formats:
+                options = dict(FORMAT_DEFAULTS[fmt])
+                options.update(kwargs)
+                if bbox_inches is not None:
+                    options['bbox_inches'] = bbox_inches
+                path = basename + '.' + fmt
+                start = time.perf_counter()
+                fig.savefig(path, format = fmt, **options)
+                results.append(SaveResult(fmt, path, time.perf_counter() - start))
+                # the first savefig call has executed the layout engine
+                if engine is not None and fig.get_layout_engine() is engine:
+                    fig.set_layout_engine('none')
+        finally:
+            if engine is not None:
+                fig.set_layout_engine(engine)
+
+    if verbose:
+        for result in results:
+            print('{:<8s}{:8.3f} s  {}'.format(result.format, result.seconds,
+                                               result.path or ''))
+
+    return results
+
+def save_figure(f, basename, formats = ('pdf',), **kwargs):
+    '''
+    Writes the figure f to basename + '.' + fmt for every fmt in formats.
+    :param f: matplotlib figure instance
+    :param basename: string, output path without file extension
+    :param formats: sequence of file formats, any of 'pdf', 'png', 'svg' and 'eps'
+    :param kwargs: additional keyword arguments of save_all, respectively savefig,
+        which override the FORMAT_DEFAULTS for all formats
+    :returns paths: list of the written file paths
+    '''
+    results = save_all(f, basename, formats, **kwargs)
+    return [result.path for result in results if result.path is not None]
+
+if __name__ == '__main__':
+
+    pass
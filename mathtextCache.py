@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: mathtextCache.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Process wide cache of parsed mathtext layouts.
+
+matplotlib caches parsed mathtext expressions in MathTextParser._parse_cached, which is
+an lru_cache of size 50 on the parser method. Since the parser instance (self) is part
+of the cache key and every renderer creates its own parser, repeated labels like
+r'$p(k\\, |\\, \\mu)$' or colorbar labels are parsed and laid out again for every figure
+(and every output format) anyway.
+install() replaces this cache by a single, size bounded LRU cache, which is shared by
+all parser instances of the process and keyed by
+    (output type, string, font properties, dpi, antialiasing, glyph load flags,
+     mathtext rcParams).
+The mathtext rcParams (mathtext.default, mathtext.fallback and the fonts of the custom
+fontset) are read by the parser itself instead of being part of the font properties.
+Since the cache lives as long as the process (e.g. the render daemon), they are part
+of the key, such that changing them (e.g. in a style context) never yields stale
+layouts.
+The shared utilities (mplUtils) install it at import. The hit and miss counters are
+available through getMathtextCacheInfo():
+    ##############################################
+    from mathtextCache import getMathtextCacheInfo
+    # other code ...
+    print(getMathtextCacheInfo())
+    # other code ...
+    ##############################################
+'''
+
+import threading
+from collections import OrderedDict
+from collections import namedtuple
+import matplotlib as mpl
+from matplotlib.mathtext import MathTextParser
+
+MATHTEXT_CACHE_SIZE = 2048
+
+# rcParams read directly by the mathtext parser (mathtext.bfit requires mpl >= 3.8)
+MATHTEXT_RC_KEYS = ('mathtext.default', 'mathtext.fallback',
+                    'mathtext.cal', 'mathtext.rm', 'mathtext.tt', 'mathtext.it',
+                    'mathtext.bf', 'mathtext.sf', 'mathtext.bfit')
+
+MathtextCacheInfo = namedtuple('MathtextCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'maxsize': MATHTEXT_CACHE_SIZE}
+_original = None
+
+def _parse_cached(self, s, dpi, prop, antialiased, load_glyph_flags):
+    '''
+    Replacement of MathTextParser._parse_cached (prop is already a private copy).
+    '''
+    rc = tuple(mpl.rcParams.get(name) for name in MATHTEXT_RC_KEYS)
+    key = (self._output_type, s, dpi, prop, antialiased, load_glyph_flags, rc)
+    with _lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+            _stats['hits'] += 1
+            return result
+        _stats['misses'] += 1
+
+    result = _original.__wrapped__(self, s, dpi, prop, antialiased, load_glyph_flags)
+
+    with _lock:
+        _cache[key] = result
+        while len(_cache) > _stats['maxsize']:
+            _cache.popitem(last = False)
+    return result
+
+def install(maxsize = MATHTEXT_CACHE_SIZE):
+    '''
+    Installs the process wide mathtext cache (repeated calls only update maxsize).
+    :param maxsize: int, maximal number of cached mathtext layouts
+    :returns installed: bool, False if the matplotlib version does not provide the
+        expected MathTextParser._parse_cached hook (the cache is then not used)
+    '''
+    global _original
+    with _lock:
+        _stats['maxsize'] = maxsize
+        if _original is not None:
+            return True
+        original = getattr(MathTextParser, '_parse_cached', None)
+        if original is None or not hasattr(original, '__wrapped__'):
+            return False
+        _original = original
+        MathTextParser._parse_cached = _parse_cached
+    return True
+
+def uninstall():
+    '''
+    Restores matplotlib's default mathtext parse cache and clears the cache.
+    '''
+    global _original
+    with _lock:
+        if _original is not None:
+            MathTextParser._parse_cached = _original
+            _original = None
+    clearMathtextCache()
+
+def getMathtextCacheInfo():
+    '''
+    :returns info: MathtextCacheInfo (hits, misses, maxsize, currsize)
+    '''
+    with _lock:
+        return MathtextCacheInfo(_stats['hits'], _stats['misses'], _stats['maxsize'],
+                                 len(_cache))
+
+def clearMathtextCache():
+    '''
+    Clears the cached layouts and resets the hit and miss counters.
+    '''
+    with _lock:
+        _cache.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+if __name__ == '__main__':
+
+    pass
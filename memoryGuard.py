@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: memoryGuard.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Memory growth reports of long running render loops.
+
+Rendering tens of thousands of figures in one process slowly grows its resident set
+size, since matplotlib keeps (bounded and unbounded) caches of text layouts, fonts and
+parsed mathtext, and since figures, which are not closed explicitly, stay registered
+with pyplot. The MemoryGuard samples the process every N renders and reports the open
+figures, the RSS, the traced memory (optional, using tracemalloc), the sizes of
+matplotlib's caches and the object types (and source lines), whose number (size)
+grew since the first sample:
+    ##############################################
+    from memoryGuard import MemoryGuard
+    from memoryGuard import formatMemoryReport
+    # other code ...
+    guard = MemoryGuard(every = 100)
+    for n in range(50000):
+        plot_pcolor(...)
+        report = guard.record()
+        if report is not None:
+            print(formatMemoryReport(report))
+    guard.close()
+    # other code ...
+    ##############################################
+The first sample is the reference, i.e. the warm up of the first N renders (fonts,
+styles, ...) is not reported as growth. Counting the object types walks all objects
+tracked by the garbage collector, hence choose N such that this cost is negligible
+compared to N renders.
+For sweeps in worker processes, parallelSweep.run_bounded_sweep runs a guard in every
+worker and replaces workers, whose RSS exceeds a memory budget, by fresh processes.
+'''
+
+import os
+import sys
+import gc
+import importlib
+import tracemalloc
+from collections import Counter
+from collections import namedtuple
+
+try:
+    import resource
+except ImportError: # (not available on Windows)
+    resource = None
+
+# number of renders between two samples
+MEMORY_GUARD_EVERY = 100
+
+# number of reported object types and source lines
+MEMORY_GUARD_TOP = 10
+
+# generic types (containers, functions, weak references, ...) grow along with any leaked
+# object and are not reported (their growth is visible in the reported source lines)
+MEMORY_GUARD_IGNORED_TYPES = ('builtins.', 'weakref.')
+
+# lru caches of matplotlib, which grow with the number of distinct texts, fonts and
+# mathtext expressions, as (name, module, attribute path)
+MATPLOTLIB_CACHES = (
+    ('mathtext', 'matplotlib.mathtext', ('MathTextParser', '_parse_cached')),
+    ('findfont', 'matplotlib.font_manager', ('FontManager', '_findfont_cached')),
+    ('fonts', 'matplotlib.font_manager', ('_get_font',)),
+    ('fontconfig patterns', 'matplotlib.font_manager', ('parse_fontconfig_pattern',)),
+)
+
+# rss and traced in MB (traced is None without tracemalloc), types as list of
+# (type name, count, growth), lines as list of (source line, growth in bytes) and
+# caches as dict of cache name and number of entries
+MemoryReport = namedtuple('MemoryReport', ['pid', 'renders', 'figures', 'rss', 'traced',
+                                           'types', 'lines', 'caches'])
+
+def getRSS():
+    '''
+    Returns the current resident set size of the process in MB (the peak resident set
+    size, where the current one is unavailable, or None on Windows).
+    '''
+    try:
+        with open('/proc/self/statm', 'r') as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024.0 ** 2
+    except (OSError, ValueError, IndexError, AttributeError):
+        return getPeakRSS()
+
+def getPeakRSS():
+    '''
+    Returns the peak resident set size of the process in MB (or None if unavailable).
+    '''
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # (ru_maxrss is given in bytes on macOS and in kilobytes elsewhere)
+    return peak / 1024.0 ** 2 if sys.platform == 'darwin' else peak / 1024.0
+
+def getFigureCount():
+    '''
+    Returns the number of figures registered with pyplot (0, if pyplot is not in use).
+    '''
+    pyplot = sys.modules.get('matplotlib.pyplot')
+    return 0 if pyplot is None else len(pyplot.get_fignums())
+
+def getCacheSizes():
+    '''
+    Returns the number of entries of the lru caches in MATPLOTLIB_CACHES (caches, which
+    do not exist in the installed matplotlib version, are omitted).
+    '''
+    sizes = {}
+    for name, modulename, path in MATPLOTLIB_CACHES:
+        if modulename not in sys.modules:
+            continue
+        obj = importlib.import_module(modulename)
+        for attribute in path:
+            obj = getattr(obj, attribute, None)
+        if hasattr(obj, 'cache_info'):
+            sizes[name] = obj.cache_info().currsize
+    return sizes
+
+def getTypeCounts():
+    '''
+    Returns a Counter of the qualified type names of all objects tracked by the garbage
+    collector.
+    '''
+    counts = Counter()
+    for cls, n in Counter(type(obj) for obj in gc.get_objects()).items():
+        counts[_getTypeName(cls)] += n
+    return counts
+
+def _getTypeName(cls):
+    # (__module__ and __qualname__ of some extension types are descriptors)
+    module = cls.__dict__.get('__module__', getattr(cls, '__module__', None))
+    name = getattr(cls, '__qualname__', None)
+    return '{}.{}'.format(module if isinstance(module, str) else 'builtins',
+                          name if isinstance(name, str) else cls.__name__)
+
+class MemoryGuard:
+    '''
+    Samples the memory of the process every N recorded renders.
+    :param every: int, number of renders between two samples
+    :param traceMalloc: bool, if True, tracemalloc is started (which slows down all
+        allocations) and the source lines with the largest growth are reported.
+        tracemalloc is stopped by close, unless it was already running before.
+    :param top: int, number of reported object types and source lines
+    '''
+
+    def __init__(self, every = MEMORY_GUARD_EVERY, traceMalloc = False,
+                 top = MEMORY_GUARD_TOP):
+        self.every = every
+        self.traceMalloc = traceMalloc
+        self.top = top
+        self.renders = 0
+        self.reports = []
+        self._types = None
+        self._snapshot = None
+        # (True if tracemalloc was started by the guard and is hence stopped by close)
+        self.startedMalloc = traceMalloc and not tracemalloc.is_tracing()
+        if self.startedMalloc:
+            tracemalloc.start()
+
+    def record(self, renders = 1):
+        '''
+        Records renders finished renders.
+        :returns report: MemoryReport, if a sample was taken, otherwise None
+        '''
+        before = self.renders // self.every
+        self.renders += renders
+        if self.renders // self.every == before:
+            return None
+        return self.sample()
+
+    def sample(self):
+        '''
+        Samples the process now (independent of the number of renders).
+        :returns report: MemoryReport
+        '''
+        gc.collect()
+        counts = getTypeCounts()
+        if self._types is None:
+            self._types = counts
+        growth = counts.copy()
+        growth.subtract(self._types)
+        types = [(name, counts[name], n) for name, n in growth.most_common()
+                 if n > 0 and not name.startswith(MEMORY_GUARD_IGNORED_TYPES)][:self.top]
+
+        lines, traced = [], None
+        if self.traceMalloc and tracemalloc.is_tracing():
+            traced = tracemalloc.get_traced_memory()[0] / 1024.0 ** 2
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__),
+                 tracemalloc.Filter(False, __file__)])
+            if self._snapshot is None:
+                self._snapshot = snapshot
+            lines = [(str(stat.traceback[0]), stat.size_diff)
+                     for stat in snapshot.compare_to(self._snapshot, 'lineno')[:self.top]
+                     if stat.size_diff > 0]
+
+        report = MemoryReport(os.getpid(), self.renders, getFigureCount(), getRSS(),
+                              traced, types, lines, getCacheSizes())
+        self.reports.append(report)
+        return report
+
+    def getGrowth(self):
+        '''
+        Returns the RSS growth in MB per render between the first and the last sample
+        (or None for less than two samples).
+        '''
+        if len(self.reports) < 2 or self.reports[0].rss is None:
+            return None
+        first, last = self.reports[0], self.reports[-1]
+        return (last.rss - first.rss) / float(last.renders - first.renders)
+
+    def close(self):
+        '''
+        Stops tracemalloc, if it was started by this guard.
+        '''
+        if self.startedMalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.startedMalloc = False
+
+def formatMemoryReport(report):
+    lines = ['pid {} after {} renders: {} open figures, RSS {:.1f} MB'.format(
+             report.pid, report.renders, report.figures,
+             report.rss if report.rss is not None else float('nan'))]
+    if report.traced is not None:
+        lines[0] += ', traced {:.1f} MB'.format(report.traced)
+    if report.caches:
+        lines.append('    caches: ' + ', '.join('{} {}'.format(name, size)
+                                                for name, size in report.caches.items()))
+    for name, count, growth in report.types:
+        lines.append('    {:+8d} {:<56s} ({} objects)'.format(growth, name, count))
+    for line, growth in report.lines:
+        lines.append('    {:+8.1f} kB {}'.format(growth / 1024.0, line))
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+
+    pass
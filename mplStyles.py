@@ -0,0 +1,153 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: mplStyles.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Named, precompiled rcParams style profiles for the template scripts.
+
+The plot functions of the templates used to start with a block of ~15 global rcParams
+assignments (tick placement, fonts, pdf.fonttype, mathtext.fontset, latex preamble ...),
+which are validated again on every call and which leak into every figure created
+afterwards. Instead, every plot function now declares its style profile
+    ##############################################
+    from mplStyles import use_style
+    # other code ...
+    @use_style('pcolor')
+    def plot_pcolor(...):
+        ...
+    ##############################################
+or uses the scoped context explicitly
+    ##############################################
+    with style_context('clean', {'legend.fontsize': 7.5}):
+        ...
+    ##############################################
+All profiles are validated once at import, where the requested font families are
+resolved against the installed fonts (see mpl_fonts/available_fonts.py). Entering a
+style context only writes the precompiled values into mpl.rcParams (bypassing the
+validation) and the previous values are restored when leaving the context. Since the
+rcParams are global to the process, the style contexts hold a (reentrant) lock, such
+that styled rendering from several threads is serialized instead of leaking state
+between templates.
+'''
+
+import threading
+from functools import wraps
+from contextlib import contextmanager
+import matplotlib as mpl
+
+from mpl_fonts.available_fonts import resolve_families
+from renderTrace import trace_stage
+
+# settings shared by all profiles
+_CLEAN = {
+    'xtick.top': False,
+    'xtick.bottom': True,
+    'ytick.right': False,
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'font.size': 10,
+    'legend.fontsize': 8.0,
+    'axes.linewidth': 0.5,
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Myriad Pro'],
+    'pdf.fonttype': 42,
+    'text.usetex': False,
+    'mathtext.fontset': 'cm',
+    'text.latex.preamble': r'\usepackage{cmbright}' + r'\usepackage{amsmath}',
+}
+
+STYLE_DEFINITIONS = {
+    # line plots with outward ticks on the bottom and left axis only
+    'clean': _CLEAN,
+    # pcolormesh / pcolor / heatmap panels
+    'pcolor': dict(_CLEAN),
+    # bare images without any axis ticks
+    'image': dict(_CLEAN, **{'xtick.bottom': False, 'ytick.left': False}),
+    # schematic plots in the style of Bishop's PRML figures
+    'prml-schematic': dict(_CLEAN, **{'legend.fontsize': 7.0,
+                                      'axes.linewidth': 1.0,
+                                      'font.sans-serif': ['Helvetica']}),
+}
+
+def _validate(params):
+    # mpl.RcParams validates (and converts) every value, raising on invalid entries
+    validated = mpl.RcParams(params)
+    return {key: dict.__getitem__(validated, key) for key in params}
+
+def compileStyle(name, overrides = None):
+    '''
+    Returns the validated rcParams of the style profile name, updated by overrides.
+    :param name: string, one of the keys of STYLE_DEFINITIONS
+    :param overrides: dict of additional rcParams, e.g. {'legend.fontsize': 7.5}
+    :returns style: dict of validated rcParams
+    '''
+    if name not in STYLE_DEFINITIONS:
+        raise ValueError("Unknown style '{}' encountered.".format(name))
+    params = dict(STYLE_DEFINITIONS[name])
+    if overrides:
+        params.update(overrides)
+    style = _validate(params)
+    # missing families are dropped here, which avoids the font manager's fallback
+    # search (and its warnings) for every text size at render time
+    if 'font.sans-serif' in style:
+        style['font.sans-serif'] = resolve_families(style['font.sans-serif'])
+    return style
+
+# compiled once at import
+STYLES = {name: compileStyle(name) for name in STYLE_DEFINITIONS}
+
+_rcLock = threading.RLock()
+
+@contextmanager
+def style_context(style, overrides = None):
+    '''
+    Scoped style context. Applies the style to mpl.rcParams and restores the
+    previous values of the changed keys on exit.
+    :param style: string, name of a style profile, or a dict as returned by compileStyle
+    :param overrides: dict of additional rcParams (validated on every call, hence
+        prefer compileStyle or use_style for repeated usage)
+    '''
+    if isinstance(style, str):
+        if style in STYLES and not overrides:
+            style = STYLES[style]
+        else:
+            style = compileStyle(style, overrides)
+    elif overrides:
+        style = dict(style)
+        style.update(_validate(overrides))
+    with _rcLock:
+        with trace_stage('rcParams', 'style'):
+            saved = {key: dict.__getitem__(mpl.rcParams, key) for key in style}
+            dict.update(mpl.rcParams, style)
+        try:
+            yield
+        finally:
+            dict.update(mpl.rcParams, saved)
+
+def use_style(name, overrides = None):
+    '''
+    Decorator, which runs the decorated plot function within style_context.
+    The style is compiled once at decoration time.
+    :param name: string, name of a style profile
+    :param overrides: dict of additional rcParams
+    '''
+    style = compileStyle(name, overrides)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with style_context(style):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+if __name__ == '__main__':
+
+    pass
@@ -8,12 +8,19 @@
 # tested with python 3.7.6
 ##########################################################################################
 
-import sys
+import hashlib
 import numpy as np
 import datetime
+from collections import OrderedDict
+
+from mathtextCache import install as installMathtextCache
+from binnedHistograms import BinnedHistogram
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
+# share the parsed mathtext layouts between all figures of the process
+installMathtextCache()
+
 def ensure_dir(dir):
     if not os.path.exists(dir):
         os.makedirs(dir)
@@ -77,26 +84,124 @@ def getPcolorBoxCoordinates(X, type = 'linear', unitWidth = None):
         maxExp = np.log10(X[-1])
         Xcoords = np.logspace(minExp - dx / 2.0, maxExp + dx / 2.0, len(X) + 1)
     else:
-        print("Error: Unknown type encountered.")
-        sys.exit(1)
+        raise ValueError("Unknown type '{}' encountered.".format(type))
+    return Xcoords
+
+# LRU cache of already computed box coordinates, see getPcolorBoxCoordinatesCached
+_boxCoordinatesCache = OrderedDict()
+BOX_COORDINATES_CACHE_SIZE = 256
+
+def getPcolorBoxCoordinatesCached(X, type = 'linear', unitWidth = None,
+                                  maxsize = BOX_COORDINATES_CACHE_SIZE):
+    '''
+    Memoized version of getPcolorBoxCoordinates.
+    Within a parameter sweep (e.g. over many colormaps) the box coordinates are requested
+    over and over again for the very same axis arrays. Here the results are cached with
+    least recently used (LRU) eviction, keyed by a hash of the array bytes (together with
+    its dtype and shape), the type and the unitWidth.
+    :param maxsize: int, maximal number of cached coordinate arrays.
+    :returns Xcoords: numpy ndarray, as returned by getPcolorBoxCoordinates. The returned
+        array is shared between calls and hence marked read-only.
+    Raises a ValueError for arrays of size 1 without unitWidth and for unknown types.
+    '''
+    X = np.ascontiguousarray(X)
+    digest = hashlib.sha1(X.tobytes()).hexdigest()
+    key = (digest, X.dtype.str, X.shape, type, unitWidth)
+
+    Xcoords = _boxCoordinatesCache.get(key)
+    if Xcoords is not None:
+        _boxCoordinatesCache.move_to_end(key)
+        return Xcoords
+
+    if (X.size == 1) and not unitWidth:
+        raise ValueError("No unitWidth specified to handle array of size 1.")
+
+    Xcoords = getPcolorBoxCoordinates(X, type = type, unitWidth = unitWidth)
+    Xcoords.flags.writeable = False
+
+    _boxCoordinatesCache[key] = Xcoords
+    while len(_boxCoordinatesCache) > maxsize:
+        _boxCoordinatesCache.popitem(last = False)
     return Xcoords
 
+def clearPcolorBoxCoordinatesCache():
+    _boxCoordinatesCache.clear()
+
+def getPcolorBoxCoordinatesBatch(X, type = 'linear', unitWidth = None):
+    '''
+    Vectorized version of getPcolorBoxCoordinates for a whole stack of axes.
+    :param X: numpy ndarray of shape (n_axes, N), i.e. one axis array per row.
+        A 1D array of shape (N,) is treated as a single axis.
+    :param type: string, specifying the axis scaling type ('linear' or 'log')
+    :param unitWidth: float, the box width which is only used for axes of size N = 1.
+    :returns Xcoords: numpy ndarray of shape (n_axes, N + 1) (or (N + 1,) for 1D input)
+    In contrast to getPcolorBoxCoordinates the spacing of X is not assumed to be uniform.
+    Interior box edges are placed at the midpoints between neighboring values and the
+    outer edges are extended by half of the first and last spacing, respectively.
+    For type = 'log' the midpoints are taken in log10 space, i.e. geometric means.
+    For uniformly spaced axes this reproduces the getPcolorBoxCoordinates result.
+    '''
+    X = np.asarray(X, dtype = float)
+    squeeze = (X.ndim == 1)
+    X = np.atleast_2d(X)
+    if X.ndim != 2:
+        raise ValueError("Expected a 1D or 2D array, got shape {}.".format(X.shape))
+    if type not in ('linear', 'log'):
+        raise ValueError("Unknown type '{}' encountered.".format(type))
+
+    if X.shape[1] == 1:
+        if not unitWidth:
+            raise ValueError("No unitWidth specified to handle axes of size 1.")
+        Xcoords = np.concatenate((X - unitWidth / 2.0, X + unitWidth / 2.0), axis = 1)
+        return Xcoords[0] if squeeze else Xcoords
+
+    if type == 'log':
+        if np.any(X <= 0.0):
+            raise ValueError("Logarithmic axes require strictly positive values.")
+        X = np.log10(X)
+
+    midpoints = (X[:, 1:] + X[:, :-1]) / 2.0
+    first = X[:, :1] - (X[:, 1:2] - X[:, :1]) / 2.0
+    last = X[:, -1:] + (X[:, -1:] - X[:, -2:-1]) / 2.0
+    Xcoords = np.concatenate((first, midpoints, last), axis = 1)
+
+    if type == 'log':
+        Xcoords = 10.0 ** Xcoords
+    return Xcoords[0] if squeeze else Xcoords
+
+# number of pcolormesh / imshow cells above which the data is rasterized on save
+RASTERIZE_CELL_THRESHOLD = 64 * 64
+
+def applyRasterizationPolicy(artist, threshold = RASTERIZE_CELL_THRESHOLD):
+    '''
+    Rasterizes a pcolormesh (QuadMesh) or imshow (AxesImage) artist if it holds more
+    than threshold data cells.
+    In vector outputs (pdf, svg, eps) pcolormesh emits one vector patch per cell, which
+    makes large matrices (n >> 64) extremely slow to write and to open. A rasterized
+    artist is instead embedded as a single bitmap, rendered at the dpi passed to savefig,
+    whereas the axes, ticks, labels and the colorbar outline stay vector graphics.
+    :param artist: matplotlib artist providing get_array() and set_rasterized()
+    :param threshold: int, maximal number of cells drawn as vector graphics.
+        Use threshold = None to never rasterize.
+    :returns rasterized: bool, whether the artist is rasterized.
+    '''
+    if threshold is None:
+        return False
+    # the first two dimensions are the cells (images may carry RGB(A) channels)
+    nCells = int(np.prod(np.shape(artist.get_array())[:2]))
+    rasterized = nCells > threshold
+    artist.set_rasterized(rasterized)
+    return rasterized
+
 def getHistogramCoordinates(X, n_bins, density = True):
     '''
-    Creates (x, y) data pairs of the histogram data using
-    numpy's histogram function.
+    Creates (x, y) data pairs of the histogram data, binned as by
+    numpy's histogram function (see binnedHistograms.BinnedHistogram).
 
     Numpy's histogram normed keyword is deprecated and has been replaced
     by density = True / False.
     '''
-    hist, bin_edges = np.histogram(X, bins = n_bins, density = density)
-    bin_centers = (bin_edges[1:] + bin_edges[0:-1]) / 2.0
-    assert hist.shape == bin_centers.shape, "Shape assertion failed."
-
-    res = np.zeros((n_bins, 2))
-    res[:, 0] = bin_centers
-    res[:, 1] = hist
-    return res
+    return BinnedHistogram.fromData(X, bins = n_bins).getCoordinates(density)
 
 if __name__ == '__main__':
 
@@ -11,11 +11,15 @@
 # Creates 1d normal random samples and saves them to the disk as *.dat and *.npy files.
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import datetime
 import platform
 import numpy as np
 
+from sampleStore import save_samples
+
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
@@ -44,9 +48,9 @@ if __name__ == '__main__':
 
     # save samples to file
     outname = f'normal_samples_np_seed_{seed_value}'
-    np.save(os.path.join(RAWDIR, outname), sample_A)
+    save_samples(os.path.join(RAWDIR, outname), sample_A)
     if CREATE_TXT:
-        np.savetxt(os.path.join(RAWDIR, outname + '.txt'), sample_A, fmt = '%.8f')
+        save_samples(os.path.join(RAWDIR, outname), sample_A, fmt = 'txt')
 
     sample_B = np.random.normal(loc = 1.4, scale = 0.45, size = n_samples)
     print("sample_B.shape =", sample_B.shape)
@@ -57,6 +61,6 @@ if __name__ == '__main__':
 
     # save samples to file
     outname = f'normal_samples_AB_np_seed_{seed_value}'
-    np.save(os.path.join(RAWDIR, outname), data)
+    save_samples(os.path.join(RAWDIR, outname), data)
     if CREATE_TXT:
-        np.savetxt(os.path.join(RAWDIR, outname + '.txt'), data, fmt = '%.8f')
+        save_samples(os.path.join(RAWDIR, outname), data, fmt = 'txt')
@@ -8,13 +8,17 @@
 # tested with python 3.7.6 and matplotlib 3.4.2
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import datetime
 import platform
-import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
+from renderCache import render_cache
+from sampleStore import load_samples
+
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
@@ -45,6 +49,7 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
+@render_cache()
 def create_boxplot(X, outname, outdir = './', xLabel = None, yLabel = None,
 	pColors = None, datestamp = True, savePDF = True, savePNG = False):
     '''
@@ -120,9 +125,9 @@ if __name__ == '__main__':
     print("running python", platform.python_version())
     print("using mpl.__version__ =", mpl.__version__)
 
-    filename = r'normal_samples_AB_np_seed_987654321.npy'
+    filename = r'normal_samples_AB_np_seed_987654321'
 
-    data = np.load(os.path.join(RAWDIR, filename))
+    data = load_samples(os.path.join(RAWDIR, filename))
     print("data.shape =", data.shape)
 
     outname = 'mpl_AB_categorical_boxplot'
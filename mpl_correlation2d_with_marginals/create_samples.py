@@ -12,11 +12,18 @@
 # random samples using inverse transform sampling (ITS).
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import datetime
 import numpy as np
 import scipy
-from scipy.stats import norm
+
+from sampleStore import save_samples
+from sampleStore import load_samples
+from sampleGenerator import generate_samples
+from sampleGenerator import correlatedNormalChunk
+from sampleGenerator import independentNormalChunk
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -26,11 +33,7 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(RAWDIR, exist_ok = True)
 
-def inverseTransformSamplingJoint(n_samples, mu1, sigma1, mu2, sigma2):
-    u = np.random.uniform(size = n_samples)
-    x1 = norm.ppf(u, loc = mu1, scale = sigma1)
-    x2 = norm.ppf(u, loc = mu2, scale = sigma2)
-    return x1, x2
+CREATE_TXT = False
 
 if __name__ == '__main__':
 
@@ -40,29 +43,29 @@ if __name__ == '__main__':
     # set parameters
     n_samples = 20000
 
-    mu1, sigma1 = 87.25, 8.124
-    mu2, sigma2 = 125.75, 11.25
+    params = {'mu1': 87.25, 'sigma1': 8.124,
+              'mu2': 125.75, 'sigma2': 11.25}
 
     seed_value = 987654321
 
+    # the chunks are drawn in parallel, where the samples only depend on the seed
+    # (and the chunk size), but not on the number of worker processes
+    n_workers = os.cpu_count()
+
     ######################################################################################
     # 01 - Create fully correlated Gaussian samples using the inverse transform method
-    samples = np.zeros((n_samples, 2))
-
-    np.random.seed(seed_value)
-
-    samples[:, 0], samples[:, 1] = \
-        inverseTransformSamplingJoint(n_samples, mu1, sigma1, mu2, sigma2)
-    outname = f'GaussianSamples_correlated_seed_{seed_value:d}.txt'
-    np.savetxt(os.path.join(RAWDIR, outname), samples, fmt = '%.8f')
+    outname = f'GaussianSamples_correlated_seed_{seed_value:d}'
+    generate_samples(os.path.join(RAWDIR, outname), n_samples, correlatedNormalChunk,
+                     seed = seed_value, params = params, n_workers = n_workers)
+    if CREATE_TXT:
+        samples = load_samples(os.path.join(RAWDIR, outname))
+        save_samples(os.path.join(RAWDIR, outname), samples, fmt = 'txt')
 
     ######################################################################################
     # 02 - Create two independent Gaussian random realizations
-
-    np.random.seed(seed_value) # reset the seed value
-
-    samples = np.zeros((n_samples, 2))
-    samples[:, 0] = norm.rvs(loc = mu1, scale = sigma1, size = n_samples)
-    samples[:, 1] = norm.rvs(loc = mu2, scale = sigma2, size = n_samples)
-    outname = f'GaussianSamples_uncorrelated_seed_{seed_value:d}.txt'
-    np.savetxt(os.path.join(RAWDIR, outname), samples, fmt = '%.8f')
+    outname = f'GaussianSamples_uncorrelated_seed_{seed_value:d}'
+    generate_samples(os.path.join(RAWDIR, outname), n_samples, independentNormalChunk,
+                     seed = seed_value, params = params, n_workers = n_workers)
+    if CREATE_TXT:
+        samples = load_samples(os.path.join(RAWDIR, outname))
+        save_samples(os.path.join(RAWDIR, outname), samples, fmt = 'txt')
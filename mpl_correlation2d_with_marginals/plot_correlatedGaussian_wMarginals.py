@@ -11,6 +11,8 @@
 # provided create_samples.py script
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import datetime
 import numpy as np
@@ -21,6 +23,14 @@ from matplotlib.ticker import FuncFormatter
 import scipy
 from scipy.stats import norm
 
+from renderCache import render_cache
+from sampleStore import load_samples
+from sampleStore import iter_sample_chunks
+from binnedHistograms import BinnedHistogram
+from binnedHistograms import BinnedHistogram2d
+from convert_pdf2svg import convert_pdf2svg
+from renderTrace import traced
+
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
@@ -29,6 +39,12 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
+# Streaming mode: the samples are read chunk by chunk from disk and accumulated into
+# fixed grid histograms, where the joint distribution is drawn as density image.
+# Memory usage and output size are then independent of the number of samples.
+STREAMING = False
+JOINT_BINS = 250
+
 def cleanFormatter(x, pos = None):
     '''
     will format 0.0 as 0 and
@@ -36,9 +52,19 @@ def cleanFormatter(x, pos = None):
     '''
     return '{:g}'.format(x)
 
+@traced()
+@render_cache()
 def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
          titlestr = None, drawLegend = True, xFormat = None, yFormat = None,
-         savePDF = True, savePNG = False, datestamp = True):
+         savePDF = True, savePNG = False, datestamp = True, histograms = None):
+    '''
+    :param X: numpy ndarray of shape (n_samples, 2), samples to scatter, or None if
+        histograms are given
+    :param histograms: None or a 3-tuple (joint, histX, histY) of the accumulated
+        BinnedHistogram2d and the BinnedHistogram of the marginals (streaming mode).
+        The joint distribution is then drawn as density image instead of scattering
+        every single sample.
+    '''
 
     mpl.rcParams['xtick.top'] = False
     mpl.rcParams['xtick.bottom'] = True
@@ -105,22 +131,43 @@ def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
 
     lineWidth = 1.0
 
-    ax1.scatter(X[:, 0], X[:, 1],
-                s = 12.0,
-                marker = '.',
-                lw = lineWidth,
-                facecolor = pColors[0],
-                edgecolor = 'None',
-                zorder = 11,
-                alpha = 0.18)
-
-    marginX.hist(X[:, 0], histtype = 'stepfilled',
-                 orientation = 'vertical',
-                 color = pColors[1],
-                 range = (55, 125.0),
-                 bins = 45,
-                 density = True,
-                 label = r'sampling')
+    if histograms is None:
+        ax1.scatter(X[:, 0], X[:, 1],
+                    s = 12.0,
+                    marker = '.',
+                    lw = lineWidth,
+                    facecolor = pColors[0],
+                    edgecolor = 'None',
+                    zorder = 11,
+                    alpha = 0.18)
+
+        marginX.hist(X[:, 0], histtype = 'stepfilled',
+                     orientation = 'vertical',
+                     color = pColors[1],
+                     range = (55, 125.0),
+                     bins = 45,
+                     density = True,
+                     label = r'sampling')
+    else:
+        joint, histX, histY = histograms
+        # density image fading from transparent to the scatter color, empty bins are
+        # left transparent
+        cmap = mpl.colors.LinearSegmentedColormap.from_list('density',
+            [mpl.colors.to_rgba(pColors[0], 0.0), mpl.colors.to_rgba(pColors[0], 1.0)])
+        cmap.set_bad(alpha = 0.0)
+        ax1.imshow(np.ma.masked_equal(joint.counts.T, 0),
+                   extent = joint.extent,
+                   origin = 'lower',
+                   aspect = 'auto',
+                   interpolation = 'nearest',
+                   cmap = cmap,
+                   zorder = 11)
+
+        marginX.stairs(histX.density(), histX.edges,
+                       orientation = 'vertical',
+                       fill = True,
+                       color = pColors[1],
+                       label = r'sampling')
 
     marginX.plot(marginalX[:, 0], marginalX[:, 1],
                  lw = 1.25,
@@ -129,13 +176,20 @@ def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
 
     marginX.invert_yaxis() 
 
-    marginY.hist(X[:, 1], histtype = 'stepfilled',
-                 orientation = 'horizontal',
-                 color = pColors[1],
-                 bins = 45,
-                 range = (75.0, 175.0),
-                 density = True,
-                 label = r'sampling')
+    if histograms is None:
+        marginY.hist(X[:, 1], histtype = 'stepfilled',
+                     orientation = 'horizontal',
+                     color = pColors[1],
+                     bins = 45,
+                     range = (75.0, 175.0),
+                     density = True,
+                     label = r'sampling')
+    else:
+        marginY.stairs(histY.density(), histY.edges,
+                       orientation = 'horizontal',
+                       fill = True,
+                       color = pColors[1],
+                       label = r'sampling')
 
     marginY.plot(marginalY[:, 1], marginalY[:, 0],
                  lw = 1.25,
@@ -209,7 +263,7 @@ def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
         leg.draw_frame(False)
 
         # set the linewidth of the legend object
-        for legobj in leg.legendHandles:
+        for legobj in leg.legend_handles:
             legobj.set_linewidth(2.25)
 
         leg2 = marginY.legend(# bbox_to_anchor = [0.7, 0.8],
@@ -220,7 +274,7 @@ def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
                               ncol = 1)
         leg2.draw_frame(False)
 
-        for legobj in leg2.legendHandles:
+        for legobj in leg2.legend_handles:
             legobj.set_linewidth(2.25)
 
     ######################################################################################
@@ -276,9 +330,9 @@ def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
     for ax in axes:
 
         for tick in ax.xaxis.get_major_ticks():
-            tick.label.set_fontsize(labelfontsize)
+            tick.label1.set_fontsize(labelfontsize)
         for tick in ax.yaxis.get_major_ticks():
-            tick.label.set_fontsize(labelfontsize)
+            tick.label1.set_fontsize(labelfontsize)
 
         ax.tick_params('both', length = 2.5, width = 0.5, which = 'major', pad = 2.0)
         ax.tick_params('both', length = 1.5, width = 0.35, which = 'minor', pad = 2.0)
@@ -312,25 +366,48 @@ if __name__ == '__main__':
     mu1, sigma1 = 87.25, 8.124
     mu2, sigma2 = 125.75, 11.25
 
-    X = np.genfromtxt(os.path.join(RAWDIR, 'GaussianSamples_correlated_seed_987654321.txt'))
-    sample1, sample2 = X[:, 0], X[:, 1]
-
-    ######################################################################################
-    # inspect random samples
-    print("sample1.shape =", sample1.shape)
-    print("sample2.shape =", sample2.shape)
-
-    print("np.min(sample1) =", np.min(sample1))
-    print("np.max(sample1) =", np.max(sample1))
-    print("np.min(sample2) =", np.min(sample2))
-    print("np.max(sample2) =", np.max(sample2))
-    ######################################################################################
-
-    # check correlation by computing the Pearson correlation coefficient
-    rhoPearson = scipy.stats.pearsonr(sample1, sample2)    
-    print("rho(Pearson) =", rhoPearson)
-
-    rhoString = r'$\rho = {}$'.format(np.round(rhoPearson[0], 4))
+    samplesFile = os.path.join(RAWDIR, 'GaussianSamples_correlated_seed_987654321')
+
+    if STREAMING:
+        # same ranges and bins as in the non-streaming Plot call below
+        X = None
+        joint = BinnedHistogram2d.fromRange((48.0, 123.0), (78.0, 177.0), JOINT_BINS)
+        histX = BinnedHistogram.fromRange((55.0, 125.0), 45)
+        histY = BinnedHistogram.fromRange((75.0, 175.0), 45)
+        for chunk in iter_sample_chunks(samplesFile):
+            joint.update(chunk)
+            histX.update(chunk[:, 0])
+            histY.update(chunk[:, 1])
+        histograms = (joint, histX, histY)
+        print("binned samples =", joint.counts.sum())
+
+        # (rho of the samples within the joint histogram range, whereas the
+        # non-streaming branch below computes rho of all samples)
+        rho = joint.getPearson()
+        print("rho(Pearson) =", rho)
+    else:
+        # loads the .npy samples (or text samples of earlier versions)
+        X = load_samples(samplesFile)
+        histograms = None
+        sample1, sample2 = X[:, 0], X[:, 1]
+
+        ##################################################################################
+        # inspect random samples
+        print("sample1.shape =", sample1.shape)
+        print("sample2.shape =", sample2.shape)
+
+        print("np.min(sample1) =", np.min(sample1))
+        print("np.max(sample1) =", np.max(sample1))
+        print("np.min(sample2) =", np.min(sample2))
+        print("np.max(sample2) =", np.max(sample2))
+        ##################################################################################
+
+        # check correlation by computing the Pearson correlation coefficient
+        rhoPearson = scipy.stats.pearsonr(sample1, sample2)
+        print("rho(Pearson) =", rhoPearson)
+        rho = rhoPearson[0]
+
+    rhoString = r'$\rho = {}$'.format(np.round(rho, 4))
 
     ######################################################################################
     # create analytical poisson distributions
@@ -370,9 +447,10 @@ if __name__ == '__main__':
                    outdir = OUTDIR,
                    pColors = pColors,
                    xFormat = xFormat,
-                   yFormat = yFormat)
+                   yFormat = yFormat,
+                   histograms = histograms)
 
-    cmd = 'pdf2svg ' + os.path.join(OUTDIR, outname + '.pdf') + \
-          ' ' + os.path.join(OUTDIR, outname + '.svg')
-    print(cmd)
-    os.system(cmd)
+    # convert the pdf figure to svg (pdf2svg subprocess without a shell)
+    for result in convert_pdf2svg([os.path.join(OUTDIR, outname + '.pdf')],
+                                  outdir = OUTDIR):
+        print(result.status, '{:.3f} s'.format(result.seconds), result.svg)
@@ -11,6 +11,8 @@
 # provided create_samples.py script
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import datetime
 import numpy as np
@@ -21,6 +23,12 @@ from matplotlib.ticker import FuncFormatter
 import scipy
 from scipy.stats import norm
 
+from renderCache import render_cache
+from sampleStore import load_samples
+from pointAggregation import aggregated_scatter
+from convert_pdf2svg import convert_pdf2svg
+from renderTrace import traced
+
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
@@ -36,6 +44,8 @@ def cleanFormatter(x, pos = None):
     '''
     return '{:g}'.format(x)
 
+@traced()
+@render_cache()
 def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
          titlestr = None, drawLegend = True, xFormat = None, yFormat = None,
          savePDF = True, savePNG = False, datestamp = True):
@@ -105,14 +115,14 @@ def Plot(X, marginalX, marginalY, params, outname, outdir, pColors,
 
     lineWidth = 1.0
 
-    ax1.scatter(X[:, 0], X[:, 1],
-                s = 12.0,
-                marker = '.',
-                lw = lineWidth,
-                facecolor = pColors[0],
-                edgecolor = 'None',
-                zorder = 11,
-                alpha = 0.18)
+    aggregated_scatter(ax1, X[:, 0], X[:, 1],
+                       s = 12.0,
+                       marker = '.',
+                       lw = lineWidth,
+                       facecolor = pColors[0],
+                       edgecolor = 'None',
+                       zorder = 11,
+                       alpha = 0.18)
 
     marginX.hist(X[:, 0], histtype = 'stepfilled',
                  orientation = 'vertical',
@@ -312,7 +322,8 @@ if __name__ == '__main__':
     mu1, sigma1 = 87.25, 8.124
     mu2, sigma2 = 125.75, 11.25
 
-    X = np.genfromtxt(os.path.join(RAWDIR, 'GaussianSamples_uncorrelated_seed_987654321.txt'))
+    # loads the .npy samples (or text samples of earlier versions)
+    X = load_samples(os.path.join(RAWDIR, 'GaussianSamples_uncorrelated_seed_987654321'))
     sample1, sample2 = X[:, 0], X[:, 1]
 
     ######################################################################################
@@ -372,7 +383,7 @@ if __name__ == '__main__':
                    xFormat = xFormat,
                    yFormat = yFormat)
 
-    cmd = 'pdf2svg ' + os.path.join(OUTDIR, outname + '.pdf') + \
-          ' ' + os.path.join(OUTDIR, outname + '.svg')
-    print(cmd)
-    os.system(cmd)
+    # convert the pdf figure to svg (pdf2svg subprocess without a shell)
+    for result in convert_pdf2svg([os.path.join(OUTDIR, outname + '.pdf')],
+                                  outdir = OUTDIR):
+        print(result.status, '{:.3f} s'.format(result.seconds), result.svg)
@@ -5,20 +5,173 @@
 # contact: khx0@posteo.net
 # date: 2021-05-11
 # file: available_fonts.py
-# tested with python 3.7.6 in conjunction with mpl version 3.4.2
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
 ##########################################################################################
 
+'''
+Font availability listing and font resolution for the template scripts.
+
+The templates request font families like 'Myriad Pro' (or 'Helvetica'), which are
+missing on many machines. Every process then pays for the font manager's fallback
+search (repeated for every font size in use) and emits a findfont warning for each of
+them. Instead, the configured families are resolved once against the installed fonts:
+    ##############################################
+    sys.path.append('../')
+    from mpl_fonts.available_fonts import resolve_families
+    # other code ...
+    resolve_families(['Myriad Pro'])   # --> ['DejaVu Sans'] if Myriad Pro is missing
+    # other code ...
+    ##############################################
+The resolution is persisted to a json file in the matplotlib cache directory, which is
+keyed by the modification times of the font directories (and the matplotlib version),
+such that installing or removing fonts invalidates it.
+Worker processes (e.g. of parallelSweep.run_sweep) call warm_up once at start, which
+loads the resolution and primes the font lookups and the mathtext fonts, such that the
+first figure of every worker is not slow:
+    ##############################################
+    run_sweep(jobs, initializer = warm_up)
+    ##############################################
+'''
+
+import os
+import sys
+sys.path.append('../')
+import json
 import platform
 import matplotlib as mpl
 import matplotlib.font_manager
 import numpy as np
 
+from atomicWrite import atomic_write
+
+FONT_CACHE_FILE = os.path.join(mpl.get_cachedir(), 'mpl-benchmarks-font-resolution.json')
+
+# generic family names, which are resolved by matplotlib itself
+GENERIC_FAMILIES = ('serif', 'sans-serif', 'cursive', 'fantasy', 'monospace')
+
+# font families requested by the template scripts
+CONFIGURED_FAMILIES = ('Myriad Pro', 'Helvetica')
+
+# font sizes in use by the template scripts
+WARM_UP_SIZES = (5.0, 7.0, 7.5, 8.0, 9.0, 10.0)
+
+_resolution = None
+
 def number_of_digits(n: int) -> int:
     '''
     Returns the number of digits of a given integer n.
     '''
     return int(np.floor(np.log10(np.abs(n)) + 1))
 
+def _getCacheKey():
+    '''
+    Returns the key of the font resolution cache, which consists of the matplotlib
+    version and the modification times of all directories containing known fonts.
+    '''
+    fontManager = mpl.font_manager.fontManager
+    fontDirs = {os.path.dirname(font.fname) for font in fontManager.ttflist}
+    mtimes = {}
+    for fontDir in sorted(fontDirs):
+        try:
+            mtimes[fontDir] = os.path.getmtime(fontDir)
+        except OSError:
+            mtimes[fontDir] = None
+    return {'mpl': mpl.__version__, 'dirs': mtimes}
+
+def _loadResolution(cachefile):
+    '''
+    Returns the dict of available family names {name: bool} from the cache file,
+    or None if the cache file is missing, unreadable or stale.
+    '''
+    try:
+        with open(cachefile, 'r') as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if data.get('key') != _getCacheKey():
+        return None
+    return data.get('families')
+
+def _storeResolution(cachefile, families):
+    try:
+        # write and rename, such that concurrent workers never read a partial file
+        with atomic_write(cachefile) as tmpfile:
+            with open(tmpfile, 'w') as fh:
+                json.dump({'key': _getCacheKey(), 'families': families}, fh, indent = 1)
+    except OSError:
+        pass
+
+def getAvailableFamilies(cachefile = FONT_CACHE_FILE):
+    '''
+    Returns the availability {name: bool} of the CONFIGURED_FAMILIES and of all
+    family names installed for the given matplotlib installation, using the on-disk
+    cache if it is up to date.
+    '''
+    global _resolution
+    if _resolution is None:
+        families = _loadResolution(cachefile) if cachefile else None
+        if families is None:
+            fontManager = mpl.font_manager.fontManager
+            # (afm fonts are only used with ps.useafm / pdf.use14corefonts)
+            families = {font.name: True for font in fontManager.ttflist}
+            for name in CONFIGURED_FAMILIES:
+                families.setdefault(name, False)
+            if cachefile:
+                _storeResolution(cachefile, families)
+        _resolution = families
+    return _resolution
+
+def resolve_families(families, fallback = None, cachefile = FONT_CACHE_FILE):
+    '''
+    Returns the installed subset of the requested font families.
+    :param families: list of font family names, e.g. ['Myriad Pro']
+    :param fallback: list of fallback families used if none of the requested families
+        is installed. Defaults to matplotlib's default sans-serif family list.
+    :returns resolved: list of installed family names in the requested order
+    '''
+    available = getAvailableFamilies(cachefile)
+    resolved = [name for name in families
+                if name in GENERIC_FAMILIES or available.get(name, False)]
+    if not resolved:
+        if fallback is None:
+            fallback = mpl.rcParamsDefault['font.sans-serif']
+        resolved = [name for name in fallback if available.get(name, False)]
+    return resolved
+
+def clear_cache(cachefile = FONT_CACHE_FILE):
+    '''
+    Removes the persisted and the in-memory font resolution.
+    '''
+    global _resolution
+    _resolution = None
+    if os.path.exists(cachefile):
+        os.remove(cachefile)
+
+def warm_up(families = CONFIGURED_FAMILIES, sizes = WARM_UP_SIZES,
+            mathtext_fontsets = ('cm',)):
+    '''
+    Per process warm up, e.g. as initializer of the pool workers.
+    Resolves the font families (from the on-disk cache if possible), primes the font
+    manager's lookup cache for the resolved families at the given sizes and loads the
+    mathtext fonts of the given fontsets.
+    :returns resolved: dict {family: resolved family list}
+    '''
+    from matplotlib.mathtext import MathTextParser
+
+    resolved = {}
+    fontManager = mpl.font_manager.fontManager
+    for name in families:
+        resolved[name] = resolve_families([name])
+        with mpl.rc_context({'font.family': 'sans-serif',
+                             'font.sans-serif': resolved[name]}):
+            for size in sizes:
+                fontManager.findfont(mpl.font_manager.FontProperties(size = size))
+    parser = MathTextParser('path')
+    for fontset in mathtext_fontsets:
+        with mpl.rc_context({'mathtext.fontset': fontset}):
+            parser.parse(r'$x_{i}^{2} \, \mathrm{label} \, 10^{-3}$', dpi = 72)
+    return resolved
+
 if __name__ == '__main__':
 
     print("python version =", platform.python_version())
@@ -27,10 +180,8 @@ if __name__ == '__main__':
     print("mpl.matplotlib_fname() =", mpl.matplotlib_fname())
     print("mpl.get_configdir() =", mpl.get_configdir())
 
-    mpl.font_manager.findSystemFonts()
-
     # print fonts which are available for the given matplotlib installation
-    flist = mpl.font_manager.get_fontconfig_fonts()
+    flist = sorted(mpl.font_manager.findSystemFonts())
 
     n_digits = number_of_digits(len(flist))
 
@@ -39,3 +190,6 @@ if __name__ == '__main__':
         print("font #", str(i + 1).zfill(n_digits), "-->", fname)
 
     print(f'{len(flist)} fonts detected in total')
+
+    for name in CONFIGURED_FAMILIES:
+        print(name, "-->", resolve_families([name]))
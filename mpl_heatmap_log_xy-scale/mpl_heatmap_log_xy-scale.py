@@ -21,9 +21,15 @@ import matplotlib.cm as cm
 from matplotlib import ticker
 
 from mplUtils import getFigureProps
+from mplUtils import applyRasterizationPolicy
+from mplUtils import RASTERIZE_CELL_THRESHOLD
 from mplUtils import getPcolorBoxCoordinates
 
 from axisPadding import getLogAxisPadding
+from syntheticFields import getProductField
+from figureExport import save_figure
+from mplStyles import use_style
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -34,29 +40,13 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
+@traced()
+@use_style('pcolor', {'font.sans-serif': ['Helvetica']})
 def plot_pcolor(X, Y, Z, params, fProps, 
     xFormat, yFormat, zFormat, zColor, outname, outdir,
     titlestr = None, show_cBar = True, showlabels = True, grid = False, 
-    saveSVG = False, savePDF = True, savePNG = False, datestamp = True):
-
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 8.0})
-    mpl.rc('axes', linewidth = 0.5)
-
-    # mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Myriad Pro']})
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Helvetica']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    mpl.rcParams['text.latex.preamble'] = \
-        r'\usepackage{cmbright}' + \
-        r'\usepackage{amsmath}'
+    saveSVG = False, savePDF = True, savePNG = False, datestamp = True,
+    rasterizeThreshold = RASTERIZE_CELL_THRESHOLD):
 
     ######################################################################################
     # set up figure
@@ -129,10 +119,13 @@ def plot_pcolor(X, Y, Z, params, fProps,
             cb_labels = np.arange(zFormat[1], zFormat[2], zFormat[3])
             cb1.set_ticks(cb_labels)
 
-    ax1.pcolormesh(X, Y, Z,
-                   cmap = cMap,
-                   norm = cNorm,
-                   edgecolors = 'none')
+    mesh = ax1.pcolormesh(X, Y, Z,
+                          cmap = cMap,
+                          norm = cNorm,
+                          edgecolors = 'none')
+
+    # rasterize large meshes in vector outputs (axes, ticks and labels stay vector)
+    applyRasterizationPolicy(mesh, rasterizeThreshold)
 
     ######################################################################################
     # z-max / z-min annotation
@@ -202,18 +195,9 @@ def plot_pcolor(X, Y, Z, params, fProps,
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf',
-                  dpi = 300,
-                  transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png',
-                  dpi = 600,
-                  transparent = False)
-    if saveSVG:
-        cmd = 'pdf2svg ' + os.path.join(outdir, outname + '.pdf') + \
-              ' ' + os.path.join(outdir, outname + '.svg')
-        os.system(cmd)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    save_figure(f, os.path.join(outdir, outname), formats)
     ######################################################################################
     # close handles
     plt.cla()
@@ -237,17 +221,16 @@ if __name__ == '__main__':
     # create dummy data
 
     n_datapoints = 31
-    Z = np.zeros((n_datapoints, n_datapoints))
-    print('Z.shape =', Z.shape)
 
     xVals = np.logspace(1, 3, n_datapoints)
     yVals = np.logspace(-3, -1, n_datapoints)
 
-    # fill Z matrix
-    for i in range(len(yVals)):
-        for j in range(len(xVals)):
-            Z[i, j] = np.sin(np.pi * np.log(yVals[i])) * \
-                      np.cos(np.pi * np.log(xVals[j]) - np.pi / 2.0)
+    # fill Z matrix (rows correspond to the y values)
+    Z = getProductField(xVals, yVals,
+                        fx = lambda x: np.cos(np.pi * np.log(x) - np.pi / 2.0),
+                        fy = lambda y: np.sin(np.pi * np.log(y)),
+                        indexing = 'xy')
+    print('Z.shape =', Z.shape)
 
     Z_min = np.min(Z)
     Z_max = np.max(Z)
@@ -8,6 +8,8 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.4.2
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import platform
 import datetime
@@ -18,6 +20,9 @@ from matplotlib.ticker import FuncFormatter
 
 from scipy.stats import norm
 
+from binnedHistograms import BinnedHistogram
+from renderTrace import traced
+
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -55,6 +60,7 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
+@traced()
 def Plot(bins, values, outname, outdir, pColors, labelString = None,
          titlestr = None, params = None, xFormat = None, yFormat = None,
          savePDF = True, savePNG = False, datestamp = True):
@@ -92,9 +98,9 @@ def Plot(bins, values, outname, outdir, pColors, labelString = None,
     labelfontsize = 6.0
 
     for tick in ax1.xaxis.get_major_ticks():
-        tick.label.set_fontsize(labelfontsize)
+        tick.label1.set_fontsize(labelfontsize)
     for tick in ax1.yaxis.get_major_ticks():
-        tick.label.set_fontsize(labelfontsize)
+        tick.label1.set_fontsize(labelfontsize)
 
     ax1.tick_params('both', length = 2.5, width = 0.5, which = 'major', pad = 3.0)
     ax1.tick_params('both', length = 1.5, width = 0.25, which = 'minor', pad = 3.0)
@@ -115,20 +121,20 @@ def Plot(bins, values, outname, outdir, pColors, labelString = None,
 
     ######################################################################################
     # CENTER PIECE (not center fold)
-    # This way of calling mpl's hist function is suitable for plotting already
-    # binned data, as it is the case here.
-    # The key is using the weights keyword in the hist command as below.
+    # The data is already binned, so instead of letting mpl's hist function bin the
+    # bin positions again (using the values as weights), the bars are drawn directly
+    # from the bin edges and values.
 
-    ax1.hist(bins[:-1], bins, weights = values,
+    hist = BinnedHistogram.fromCounts(bins, values)
+    hist.bar(ax1,
              color = pColors['opaque_standard_blue'],
              edgecolor = 'k',
              linewidth = 1.0)
 
-    # For further explanations, please see:
-    # https://matplotlib.org/3.1.1/api/_as_gen/matplotlib.pyplot.hist.html
-    # e.g. using
-    #   counts, bins = np.histogram(data)
-    #   plt.hist(bins[:-1], bins, weights=counts)
+    # This is equivalent to (but does not bin the data a second time)
+    #   ax1.hist(bins[:-1], bins, weights = values, ...)
+    # For a step line instead of bars use hist.stairs(ax1, ...), see
+    # https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.stairs.html
     ######################################################################################
 
 
@@ -8,6 +8,8 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.4.2
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import platform
 import datetime
@@ -15,6 +17,8 @@ import numpy as np
 import matplotlib as mpl
 
 from mpl_imshow_AB_panel import plot_AB_panel
+from parallelSweep import run_sweep
+from mpl_fonts.available_fonts import warm_up
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -34,9 +38,12 @@ if __name__ == '__main__':
 
     wspace_values = [0.0, 0.015, 0.025, 0.05]
 
+    # one plot job per wspace value, which are fanned out over the available cores
+    jobs = []
+
     for i, wspace in enumerate(wspace_values):
         print(i, wspace)
-        # call plot function
+        # assemble plot job
         outname = f'mpl_imshow_AB_panel_{i:02d}_wspace_{wspace:0.2}'
         outname += '_Python_' + platform.python_version() + \
                 '_mpl_' + mpl.__version__
@@ -50,7 +57,7 @@ if __name__ == '__main__':
             'B_bottom_left': image_size_label,
         }
 
-        plot_AB_panel(
+        jobs.append((plot_AB_panel, dict(
             data = data,
             cmaps = ['gray', 'viridis'],
             outname = outname,
@@ -63,5 +70,10 @@ if __name__ == '__main__':
             wspace = wspace,
             anno_dict = anno_dict,
             dpi = 300,
-        )
- 
\ No newline at end of file
+        )))
+
+    # call plot function
+    outnames = run_sweep(jobs, n_workers = os.cpu_count(), initializer = warm_up)
+
+    for outname in outnames:
+        print("written:", outname)
@@ -8,6 +8,8 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.4.2
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import platform
 import datetime
@@ -15,6 +17,9 @@ import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 
+from renderCache import render_cache
+from renderTrace import traced
+
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -28,6 +33,8 @@ os.makedirs(OUTDIR, exist_ok = True)
 # TODO support non square matrix sizes
 # TODO think about different A B matrix sizes, and how to handle things then
 
+@traced()
+@render_cache()
 def plot_AB_panel(data, cmaps, outname, outdir,
     fig_width_img = 4.0, top_height_frac = 0.0, bottom_height_frac = 0.0, 
     left_width_frac = 0.0, right_width_frac = 0.0, wspace = 0.0,
@@ -216,7 +223,7 @@ def plot_AB_panel(data, cmaps, outname, outdir,
     plt.cla()
     plt.clf()
     plt.close()
-    return None
+    return outname
 
 if __name__ == '__main__':
 
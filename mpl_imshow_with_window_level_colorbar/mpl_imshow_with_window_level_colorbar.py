@@ -18,11 +18,15 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.cm as cm
-from matplotlib.ticker import FuncFormatter
 
 from mplUtils import getPcolorBoxCoordinates
 from mplUtils import getFigureProps
-from ticker import cleanFormatter
+from tickFormatters import CleanFormatter
+from syntheticFields import getRampField
+from figureExport import save_figure
+from mplStyles import use_style
+from renderCache import render_cache
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -33,6 +37,8 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
+@traced()
+@use_style('pcolor')
 def plot_pcolor(X, Y, Z, titlestr, fProps, xFormat, yFormat, zFormat, zColor, show_cBar,
                 outname, outdir, showlabels, params = None, grid = False, saveSVG = False,
                 savePDF = True, savePNG = False, datestamp = True):
@@ -50,23 +56,6 @@ def plot_pcolor(X, Y, Z, titlestr, fProps, xFormat, yFormat, zFormat, zColor, sh
     assert xBoxCoords.shape == (len(X) + 1,), "Error: Shape assertion failed."
     assert yBoxCoords.shape == (len(Y) + 1,), "Error: Shape assertion failed."
 
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 8.0})
-    mpl.rc('axes', linewidth = 0.5)
-
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Myriad Pro']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    fontparams = {'text.latex.preamble': [r'\usepackage{cmbright}',
-                                          r'\usepackage{amsmath}']}
-    mpl.rcParams.update(fontparams)
     ######################################################################################
     # set up figure
     fWidth, fHeight, lFrac, rFrac, bFrac, tFrac =\
@@ -202,7 +191,7 @@ def plot_pcolor(X, Y, Z, titlestr, fProps, xFormat, yFormat, zFormat, zColor, sh
         sys.exit(1)
 
     # tick label formatting
-    majorFormatter = FuncFormatter(cleanFormatter)
+    majorFormatter = CleanFormatter()
     ax1.xaxis.set_major_formatter(majorFormatter)
     ax1.yaxis.set_major_formatter(majorFormatter)
 
@@ -216,16 +205,12 @@ def plot_pcolor(X, Y, Z, titlestr, fProps, xFormat, yFormat, zFormat, zColor, sh
                  linewidth = 0.2)
         ax1.grid(True, which = 'minor')
 
+@traced()
+@use_style('image')
+@render_cache()
 def plot_image(img, fProps, zFormat, zColor, outname, outdir, show_colorbar = False,
     savePDF = True, savePNG = False, saveSVG = False, datestamp = True):
 
-    mpl.rcParams['ytick.left'] = False
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = False
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
     ######################################################################################
     # set up figure
     fWidth, fHeight, lFrac, rFrac, bFrac, tFrac =\
@@ -334,14 +319,9 @@ def plot_image(img, fProps, zFormat, zColor, outname, outdir, show_colorbar = Fa
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf', dpi = 300, transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
-    if saveSVG:
-        cmd = 'pdf2svg ' + os.path.join(outdir, outname + '.pdf') + \
-              ' ' + os.path.join(outdir, outname + '.svg')
-        os.system(cmd)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    save_figure(f, os.path.join(outdir, outname), formats)
     ######################################################################################
     # close handles
     plt.cla()
@@ -359,13 +339,9 @@ def test_01(cMap = cm.gray):
     nPxs_y = 32
 
     # fill image matrix
-    img = np.zeros((nPxs_x, nPxs_y))
-
     # first array dimension corresponds to the x axis
     # second array dimension corresponds to the y axis
-    for j in range(nPxs_y):     # iterate over y values
-        for i in range(nPxs_x): # iterate over x values
-            img[i, j] = 0.2 * i # xVals[i]
+    img = getRampField(np.arange(nPxs_x), np.arange(nPxs_y), slope = 0.2)
  
     v_min = np.min(img)
     v_max = np.max(img)
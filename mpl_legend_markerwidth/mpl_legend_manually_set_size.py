@@ -19,6 +19,9 @@ from matplotlib import pyplot as plt
 from matplotlib import ticker
 
 from mplUtils import getFigureProps
+from figureExport import save_figure
+from mplStyles import use_style
+from renderTrace import traced
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -27,27 +30,11 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
+@traced()
+@use_style('clean', {'legend.fontsize': 5.0})
 def Plot(X, Y, Z, labels, outname, outdir, pColors, titlestr = None,
          grid = False, saveSVG = False, savePDF = True, savePNG = False, datestamp = True):
 
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 5.0})
-    mpl.rc('axes', linewidth = 0.5)
-
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Myriad Pro']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    mpl.rcParams['text.latex.preamble'] = \
-        r'\usepackage{cmbright}' + \
-        r'\usepackage{amsmath}'
-
     ######################################################################################
     # set up figure
     fWidth, fHeight, lFrac, rFrac, bFrac, tFrac =\
@@ -162,15 +149,9 @@ def Plot(X, Y, Z, labels, outname, outdir, pColors, titlestr = None,
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf', dpi = 300, transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
-    if saveSVG:
-        cmd = 'pdf2svg ' + os.path.join(outdir, outname + '.pdf') + \
-              ' ' + os.path.join(outdir, outname + '.svg')
-        print(cmd)
-        os.system(cmd)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    save_figure(f, os.path.join(outdir, outname), formats)
     ######################################################################################
     # close handles
     plt.cla()
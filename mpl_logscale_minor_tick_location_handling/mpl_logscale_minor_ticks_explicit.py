@@ -14,7 +14,8 @@
 for the minor tick locations in logarithmic axis scaling independent of the axis limits.
 This script shows how to do this for a logarithmic x-axis.
 In this version C script, the major ticks are set using the ticker.LogLocator class.
-The minor ticks are created using the getLogTicksBase10 function from the ticker module.
+The minor ticks are created using the getLogTicksBase10 function from the ticker module
+(through the CachedLogTickLocator, which memoizes the tick arrays).
 In this way the minor ticks are cropped, such that the newly chosen minor tick
 locations become independent from the ax1.set_xlim(xmin, xmax) satement.
 For aesthetic reasons I often prefer not to have minor tick marks towards
@@ -35,7 +36,10 @@ from matplotlib import pyplot as plt
 from matplotlib import ticker
 from matplotlib.ticker import LogFormatter
 
-from ticker import getLogTicksBase10
+from ticker import CachedLogTickLocator
+from figureExport import save_figure
+from mplStyles import use_style
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -67,26 +71,11 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
+@traced()
+@use_style('clean', {'legend.fontsize': 9.0})
 def Plot(X, outname, outdir, pColors, showlabels = True, titlestr = None,
-         grid = False, savePDF = True, savePNG = False, datestamp = True):
-
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 9.0})
-    mpl.rc('axes', linewidth = 0.5)
-
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Myriad Pro']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    mpl.rcParams['text.latex.preamble'] = \
-        r'\usepackage{cmbright}' + \
-        r'\usepackage{amsmath}'
+         grid = False, savePDF = True, savePNG = False, saveSVG = False,
+         datestamp = True):
 
     ######################################################################################
     # set up figure
@@ -155,11 +144,9 @@ def Plot(X, outname, outdir, pColors, showlabels = True, titlestr = None,
     # 1 Set major ticks using LogLocator.
     ax1.xaxis.set_major_locator(ticker.LogLocator(base = 10.0, numticks = 10))
 
-    # 2 Create ticks manually (explicit).
-    xMinorTicks = getLogTicksBase10(1.0e-12, 1.0e-6)
-
-    # 3 Set minor ticks using the FixedLocator.
-    ax1.xaxis.set_minor_locator(ticker.FixedLocator((xMinorTicks)))
+    # 2 Create ticks explicitly, restricted to [1.0e-12, 1.0e-6].
+    # 3 Set minor ticks using the (caching) CachedLogTickLocator.
+    ax1.xaxis.set_minor_locator(CachedLogTickLocator(limits = (1.0e-12, 1.0e-6)))
 
     # 4 Use the NullFormatter for minor ticks without tick labels.
     ax1.xaxis.set_minor_formatter(mpl.ticker.NullFormatter())
@@ -196,10 +183,9 @@ def Plot(X, outname, outdir, pColors, showlabels = True, titlestr = None,
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf', dpi = 300, transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    save_figure(f, os.path.join(outdir, outname), formats)
     ######################################################################################
     # close handles
     plt.cla()
@@ -229,9 +215,5 @@ if __name__ == '__main__':
     returnname = Plot(X = X,
                       outname = outname,
                       outdir = OUTDIR,
-                      pColors = colorVals)
-
-    if convert2svg:
-        cmd = 'pdf2svg ' + os.path.join(OUTDIR, returnname + '.pdf') + \
-            ' ' + os.path.join(OUTDIR, returnname + '.svg')
-        os.system(cmd)
+                      pColors = colorVals,
+                      saveSVG = convert2svg)
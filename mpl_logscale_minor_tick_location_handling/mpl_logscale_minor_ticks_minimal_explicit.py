@@ -35,6 +35,7 @@ from matplotlib import ticker
 from matplotlib.ticker import LogFormatter
 
 from ticker import getLogTicksBase10
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -45,6 +46,7 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
+@traced()
 def plot_minimal(X, filename):
 
     f, ax1 = plt.subplots(1)
@@ -8,6 +8,8 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.4.2
 ##########################################################################################
 
+import sys
+sys.path.append('../../')
 import os
 import math
 import datetime
@@ -16,6 +18,8 @@ import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 
+from pointAggregation import aggregated_scatter
+
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -62,14 +66,14 @@ if __name__ == '__main__':
     '''
 
     # scatter plot 1
-    p1 = ax1.scatter(X[:, 0], X[:, 1],
-                     marker = 'o',
-                     s = 50,
-                     facecolors = 'None',
-                     alpha = 1.0,
-                     linewidth = 1.0,
-                     edgecolors = 'C0',
-                     zorder = 2)
+    p1 = aggregated_scatter(ax1, X[:, 0], X[:, 1],
+                            marker = 'o',
+                            s = 50,
+                            facecolors = 'None',
+                            alpha = 1.0,
+                            linewidth = 1.0,
+                            edgecolors = 'C0',
+                            zorder = 2)
 
     pHandles = [p1]
     labels_1 = [r'scatter 1']
@@ -81,14 +85,14 @@ if __name__ == '__main__':
     plt.gca().add_artist(leg_1)
     ######################################################################################
     # scatter plot 2
-    p2 = ax1.scatter(X[:, 0], X[:, 2],
-                     marker = 'o',
-                     s = 50,
-                     facecolors = 'None',
-                     alpha = 1.0,
-                     linewidth = 1.0,
-                     edgecolors = 'C3',
-                     zorder = 2)
+    p2 = aggregated_scatter(ax1, X[:, 0], X[:, 2],
+                            marker = 'o',
+                            s = 50,
+                            facecolors = 'None',
+                            alpha = 1.0,
+                            linewidth = 1.0,
+                            edgecolors = 'C3',
+                            zorder = 2)
 
     pHandles = [p2]
     labels_2 = [r'scatter 2']
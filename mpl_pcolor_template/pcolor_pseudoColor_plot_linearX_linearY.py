@@ -18,11 +18,13 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.cm as cm
-from matplotlib.ticker import FuncFormatter
 
 from mplUtils import getFigureProps
 from mplUtils import getPcolorBoxCoordinates
-from ticker import cleanFormatter
+from tickFormatters import CleanFormatter
+from figureExport import save_figure
+from mplStyles import use_style
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -33,27 +35,12 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
+@traced()
+@use_style('pcolor')
 def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, outdir,
                 showlabels = True, show_cBar = True, titlestr = None, grid = False, saveSVG = False,
                 savePDF = True, savePNG = False, datestamp = True):
 
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 8.0})
-    mpl.rc('axes', linewidth = 0.5)
-
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Myriad Pro']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    mpl.rcParams['text.latex.preamble'] = \
-        r'\usepackage{cmbright}' + \
-        r'\usepackage{amsmath}'
     ######################################################################################
     # set up figure
     fWidth, fHeight, lFrac, rFrac, bFrac, tFrac =\
@@ -183,7 +170,7 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
         sys.exit(1)
 
     # tick label formatting
-    majorFormatter = FuncFormatter(cleanFormatter)
+    majorFormatter = CleanFormatter()
     ax1.xaxis.set_major_formatter(majorFormatter)
     ax1.yaxis.set_major_formatter(majorFormatter)
 
@@ -200,14 +187,9 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf', dpi = 300, transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
-    if saveSVG:
-        cmd = 'pdf2svg ' + os.path.join(outdir, outname + '.pdf') + \
-              ' ' + os.path.join(outdir, outname + '.svg')
-        os.system(cmd)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    save_figure(f, os.path.join(outdir, outname), formats)
     ######################################################################################
     # close handles
     plt.cla()
@@ -18,11 +18,21 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.cm as cm
-from matplotlib.ticker import FuncFormatter
 
-from mplUtils import getPcolorBoxCoordinates
+from mplUtils import getPcolorBoxCoordinatesCached
 from mplUtils import getFigureProps
-from ticker import cleanFormatter
+from mplUtils import applyRasterizationPolicy
+from mplUtils import RASTERIZE_CELL_THRESHOLD
+from tickFormatters import CleanFormatter
+from parallelSweep import run_sweep
+from mpl_fonts.available_fonts import warm_up
+from syntheticFields import getRampField
+from figureExport import save_figure
+from mplStyles import use_style
+from renderCache import render_cache
+from colormapSweep import ColormapSweep
+from colormapSweep import getFigureKey
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -33,40 +43,27 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
-def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, outdir,
-                show_cBar = True, titlestr = None, showlabels = True, params = None,
-                grid = False, saveSVG = False, savePDF = True, savePNG = False, datestamp = True):
-
+def build_pcolor_figure(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor,
+                        show_cBar = True, titlestr = None, params = None, grid = False,
+                        rasterizeThreshold = RASTERIZE_CELL_THRESHOLD):
+    '''
+    Builds the figure, axes, QuadMesh and colorbar scaffold shared by plot_pcolor and
+    plot_pcolor_batch (see plot_pcolor for the arguments).
+    :returns f, ax1, mesh, cb1, cbLabel: figure, axes, QuadMesh, colorbar and colorbar
+        label annotation (cb1 and cbLabel are None for show_cBar = False)
+    '''
     # retrieve box coordinates for pcolormesh plotting
     if params:
         width_X, height_Y = params[0], params[1]
-        xBoxCoords = getPcolorBoxCoordinates(X, unitWidth = width_X)
-        yBoxCoords = getPcolorBoxCoordinates(Y, unitWidth = height_Y)
-        xyRatio = width_X / height_Y
+        xBoxCoords = getPcolorBoxCoordinatesCached(X, unitWidth = width_X)
+        yBoxCoords = getPcolorBoxCoordinatesCached(Y, unitWidth = height_Y)
     else:
-        xBoxCoords = getPcolorBoxCoordinates(X)
-        yBoxCoords = getPcolorBoxCoordinates(Y)
+        xBoxCoords = getPcolorBoxCoordinatesCached(X)
+        yBoxCoords = getPcolorBoxCoordinatesCached(Y)
 
     assert xBoxCoords.shape == (len(X) + 1,), "Shape assertion failed."
     assert yBoxCoords.shape == (len(Y) + 1,), "Shape assertion failed."
 
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 8.0})
-    mpl.rc('axes', linewidth = 0.5)
-
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Myriad Pro']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    mpl.rcParams['text.latex.preamble'] = \
-        r'\usepackage{cmbright}' + \
-        r'\usepackage{amsmath}'
     ######################################################################################
     # set up figure
     fWidth, fHeight, lFrac, rFrac, bFrac, tFrac =\
@@ -80,10 +77,7 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
     f.subplots_adjust(bottom = bFrac, top = tFrac)
     ######################################################################################
     tick_fontsize = 8.0
-    for tick in ax1.xaxis.get_major_ticks():
-        tick.label.set_fontsize(tick_fontsize)
-    for tick in ax1.yaxis.get_major_ticks():
-        tick.label.set_fontsize(tick_fontsize)
+    ax1.tick_params('both', labelsize = tick_fontsize, which = 'major')
 
     ax1.tick_params('both', length = 2.5, width = 0.5, which = 'major', pad = 3.0)
     ax1.tick_params('both', length = 1.5, width = 0.25, which = 'minor', pad = 3.0)
@@ -94,25 +88,32 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
     ######################################################################################
     # labeling
     if titlestr:
-        plt.title(titlestr)
+        ax1.set_title(titlestr)
     ax1.set_xlabel(xFormat[7], fontsize = 8.0)
     ax1.set_ylabel(yFormat[7], fontsize = 8.0)
     ax1.xaxis.labelpad = 2.0
     ax1.yaxis.labelpad = 4.0
     ######################################################################################
 
-    ######################################################################################
-    # color map settings
-    cMap = zColor[0]
     cNorm = mpl.colors.Normalize(vmin = zColor[1], vmax = zColor[2])
-    scalarMap = cm.ScalarMappable(norm = cNorm, cmap = cMap)
-    print("Colormap colornorm limits =", scalarMap.get_clim())
+
+    mesh = ax1.pcolormesh(xBoxCoords,
+                          yBoxCoords,
+                          Z.T,
+                          cmap = zColor[0],
+                          norm = cNorm,
+                          edgecolors = 'None')
+
+    # rasterize large meshes in vector outputs (axes, ticks and labels stay vector)
+    applyRasterizationPolicy(mesh, rasterizeThreshold)
+
     ######################################################################################
     # colorbar
+    cb1, cbLabel = None, None
     if show_cBar:
         # add_axes(left, bottom, width, height), all between [0, 1]
         # relative to the figure size
-        
+
         # reference color bar width gauge
         cbWidthFrac = 0.03 / fWidth * 2.4
 
@@ -122,10 +123,9 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
         cax.tick_params('both', length = 1.5, width = 0.25, which = 'minor')
         cax.tick_params(axis = 'both', which = 'major', pad = 2)
 
-        cb1 = mpl.colorbar.ColorbarBase(cax,
-                                        cmap = cMap,
-                                        norm = cNorm,
-                                        orientation = 'vertical')
+        # the colorbar is attached to the mesh, such that it follows every norm and
+        # colormap swap of the mesh (see plot_pcolor_batch) without being rebuilt
+        cb1 = f.colorbar(mesh, cax = cax, orientation = 'vertical')
 
         ##################################################################################
         # color bar labels
@@ -136,11 +136,11 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
         #               fontsize = 6)
         # which creats a vertical color bar label along the color bar.
         ##################################################################################
-        ax1.annotate(zColor[3],
-                     xy = (1.175, 1.06),
-                     xycoords = 'axes fraction',
-                     fontsize = 8.0,
-                     horizontalalignment = 'right')
+        cbLabel = ax1.annotate(zColor[3],
+                               xy = (1.175, 1.06),
+                               xycoords = 'axes fraction',
+                               fontsize = 8.0,
+                               horizontalalignment = 'right')
         ##################################################################################
 
         cb1.outline.set_linewidth(0.5)
@@ -157,38 +157,26 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
         # cb1.ax.minorticks_on()
         #################################################################################
 
-    ax1.pcolormesh(xBoxCoords, 
-                   yBoxCoords, 
-                   Z.T,
-                   cmap = cMap,
-                   norm = cNorm,
-                   edgecolors = 'None')
-
     #####################################################################################
     # axis formatting
-    if xFormat[0] == 'auto':
-        pass
     if xFormat[0] == 'linear':
         major_x_ticks = np.arange(xFormat[3], xFormat[4], xFormat[5])
         minor_x_ticks = np.arange(xFormat[3], xFormat[4], xFormat[6])
         ax1.set_xticks(major_x_ticks)
         ax1.set_xticks(minor_x_ticks, minor = True)
         ax1.set_xlim(xFormat[1], xFormat[2])
-
     elif xFormat[0] == 'log':
         ax1.set_xscale('log')
-        ax1.xaxis.set_major_locator(ticker.LogLocator(base = 10.0, numticks = 8))
-        ax1.xaxis.set_minor_locator(ticker.LogLocator(base = 10.0, numticks = 8,
+        ax1.xaxis.set_major_locator(mpl.ticker.LogLocator(base = 10.0, numticks = 8))
+        ax1.xaxis.set_minor_locator(mpl.ticker.LogLocator(base = 10.0, numticks = 8,
                                     subs = [2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]))
         for label in ax1.xaxis.get_ticklabels()[1::2]:
             label.set_visible(False)
         ax1.set_xlim(xFormat[1], xFormat[2])
-    else:
+    elif xFormat[0] != 'auto':
         print("Error: Unknown xFormat[0] type encountered.")
         sys.exit(1)
     #####################################################################################
-    if yFormat[0] == 'auto':
-        pass
     if yFormat[0] == 'linear':
         major_y_ticks = np.arange(yFormat[3], yFormat[4], yFormat[5])
         minor_y_ticks = np.arange(yFormat[3], yFormat[4], yFormat[6])
@@ -197,18 +185,18 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
         ax1.set_ylim(yFormat[1], yFormat[2]) # ymin, ymax
     elif yFormat[0] == 'log':
         ax1.set_yscale('log')
-        ax1.yaxis.set_major_locator(ticker.LogLocator(base = 10.0, numticks = 8))
-        ax1.yaxis.set_minor_locator(ticker.LogLocator(base = 10.0, numticks = 8,
+        ax1.yaxis.set_major_locator(mpl.ticker.LogLocator(base = 10.0, numticks = 8))
+        ax1.yaxis.set_minor_locator(mpl.ticker.LogLocator(base = 10.0, numticks = 8,
                                     subs = [2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]))
         for label in ax1.yaxis.get_ticklabels()[1::2]:
             label.set_visible(False)
-        ax1.set_ylim(yFormat[1], yFormat[2]) # xmin, xmax
-    else:
+        ax1.set_ylim(yFormat[1], yFormat[2]) # ymin, ymax
+    elif yFormat[0] != 'auto':
         print("Error: Unknown yFormat[0] type encountered.")
         sys.exit(1)
 
     # tick label formatting
-    majorFormatter = FuncFormatter(cleanFormatter)
+    majorFormatter = CleanFormatter()
     ax1.xaxis.set_major_formatter(majorFormatter)
     ax1.yaxis.set_major_formatter(majorFormatter)
 
@@ -222,24 +210,102 @@ def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, out
                  linewidth = 0.2)
         ax1.grid(True, which = 'minor')
     ######################################################################################
+    return f, ax1, mesh, cb1, cbLabel
+
+@traced()
+@use_style('pcolor')
+@render_cache()
+def plot_pcolor(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor, outname, outdir,
+                show_cBar = True, titlestr = None, showlabels = True, params = None,
+                grid = False, saveSVG = False, savePDF = True, savePNG = False, datestamp = True,
+                rasterizeThreshold = RASTERIZE_CELL_THRESHOLD):
+
+    f, ax1, mesh, cb1, cbLabel = \
+        build_pcolor_figure(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor,
+                            show_cBar = show_cBar, titlestr = titlestr, params = params,
+                            grid = grid, rasterizeThreshold = rasterizeThreshold)
+    print("Colormap colornorm limits =", mesh.get_clim())
+    ######################################################################################
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf', dpi = 300, transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
-    if saveSVG:
-        cmd = 'pdf2svg ' + os.path.join(outdir, outname + '.pdf') + \
-              ' ' + os.path.join(outdir, outname + '.svg')
-        os.system(cmd)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    save_figure(f, os.path.join(outdir, outname), formats)
     ######################################################################################
     # close handles
-    plt.cla()
-    plt.clf()
-    plt.close()
+    plt.close(f)
     return outname
 
+@traced()
+@use_style('pcolor')
+def plot_pcolor_batch(X, Y, panels, fProps, xFormat, yFormat, zFormat, outdir,
+                      show_cBar = True, titlestr = None, params = None, grid = False,
+                      saveSVG = False, savePDF = True, savePNG = False, datestamp = True,
+                      rasterizeThreshold = RASTERIZE_CELL_THRESHOLD, skipUnchanged = True):
+    '''
+    Batch variant of plot_pcolor for many panels which share the same axes layout.
+    :param panels: sequence of (Z, zColor, outname) tuples. All Z arrays must have the
+        shape (len(X), len(Y)), zColor and outname are used as in plot_pcolor.
+    :param rasterizeThreshold: int, number of mesh cells above which the mesh is
+        rasterized in the vector outputs (see mplUtils.applyRasterizationPolicy).
+    :returns outnames: list of the written outnames, in the order of panels.
+    The figure, axes, QuadMesh and colorbar scaffold is built only once from the first
+    panel. For every further panel only the QuadMesh array, its norm and its colormap
+    are swapped before the figure is written to file, such that the artist tree is never
+    rebuilt. This is considerably faster than calling plot_pcolor in a loop, e.g. when
+    sweeping many colormaps over the same data.
+    :param skipUnchanged: bool, if True, panels whose outputs were written by a previous
+        call for identical inputs are not written again (see colormapSweep).
+    '''
+    if len(panels) == 0:
+        return []
+    arguments = dict(locals())
+
+    ######################################################################################
+    # set up figure scaffold (only once for all panels)
+    Z, zColor, _ = panels[0]
+    f, ax1, mesh, cb1, cbLabel = \
+        build_pcolor_figure(X, Y, Z, fProps, xFormat, yFormat, zFormat, zColor,
+                            show_cBar = show_cBar, titlestr = titlestr, params = params,
+                            grid = grid, rasterizeThreshold = rasterizeThreshold)
+
+    ######################################################################################
+    # swap data, norm and colormap per panel and save to file
+    # (only the changed state is swapped, an unchanged norm keeps the colorbar ticks)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('svg', saveSVG))
+               if save]
+    key = getFigureKey(plot_pcolor_batch, arguments,
+                       exclude = ('panels', 'outdir', 'skipUnchanged'))
+    sweep = ColormapSweep(f, [mesh], outdir, formats, key = key,
+                          skipUnchanged = skipUnchanged)
+    lastZ = panels[0][0]
+    for Z, zColor, outname in panels:
+
+        assert Z.shape == (len(X), len(Y)), "Shape assertion failed."
+
+        if Z is not lastZ:
+            mesh.set_array(np.reshape(Z.T, mesh.get_array().shape))
+            lastZ = Z
+        if mesh.get_clim() != (zColor[1], zColor[2]):
+            mesh.set_norm(mpl.colors.Normalize(vmin = zColor[1], vmax = zColor[2]))
+            # a norm swap resets the colorbar locator, hence the ticks are set again
+            if show_cBar and zFormat[0] == 'linear':
+                cb_labels = np.arange(zFormat[1], zFormat[2], zFormat[3])
+                cb1.set_ticks(cb_labels)
+        print("Colormap colornorm limits =", mesh.get_clim())
+        if show_cBar:
+            cbLabel.set_text(zColor[3])
+
+        if datestamp:
+            outname += '_' + today
+        sweep.render(zColor[0], outname, data = (Z, zColor[1:]))
+    outnames = sweep.outnames
+    ######################################################################################
+    # close handles
+    plt.close(f)
+    return outnames
+
 def test_01(cMaps = [cm.viridis]):
 
     print("/////////////////////////////////////////////////////////////////////////////")
@@ -261,12 +327,9 @@ def test_01(cMaps = [cm.viridis]):
     height_Y = n_pxs_y * pixelHeight
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
     # first array dimension corresponds to the x axis
     # second array dimension corresponds to the y axis
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     assert xVals.shape == yVals.shape, "Shape assertion failed."
     assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
@@ -298,7 +361,8 @@ def test_01(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 9.05, 2.0, 1.0, r'y axis label')
     zFormat = ('linear', 0.0, 1.85, 0.20)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -309,19 +373,19 @@ def test_01(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
+
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
 
-    return None
+    return outnames
 
 def test_02(cMaps = [cm.viridis]):
 
@@ -344,11 +408,7 @@ def test_02(cMaps = [cm.viridis]):
     height_Y = n_pxs_y * pixelHeight
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     zVals -= 1.0 / 3.0
 
@@ -382,7 +442,8 @@ def test_02(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 9.05, 2.0, 1.0, r'y axis label')
     zFormat = ('linear', -0.4, 1.85, 0.20)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -393,26 +454,28 @@ def test_02(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
 
-    return None
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
 
-def test_03(cMaps = [cm.viridis]):
+    return outnames
+
+def test_03(cMaps = [cm.viridis], n_workers = 1):
 
     print("/////////////////////////////////////////////////////////////////////////////")
     print("Running test 03 /////////////////////////////////////////////////////////////")
 
     # create synthetic image array data
+    # one batch plot job per matrix size n, which are fanned out over n_workers processes
+    jobs = []
 
     for n in np.arange(1, 10 + 1, 1): # (from, to (excluding), increment)
 
@@ -431,11 +494,7 @@ def test_03(cMaps = [cm.viridis]):
         height_Y = n_pxs_y * pixelHeight
 
         # fill matrix
-        zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-        for j in range(n_pxs_y):     # iterate over y values
-            for i in range(n_pxs_x): # iterate over x values
-                zVals[i, j] = 0.2 * xVals[i]
+        zVals = getRampField(xVals, yVals, slope = 0.2)
 
         assert xVals.shape == yVals.shape, "Shape assertion failed."
         assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
@@ -472,7 +531,8 @@ def test_03(cMaps = [cm.viridis]):
 
         zFormat = ('linear', -0.4, 1.85, 0.20)
 
-        # loop over color maps
+        # assemble one panel per color map
+        panels = []
         for cMap in cMaps:
 
             zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -483,20 +543,23 @@ def test_03(cMaps = [cm.viridis]):
             outname += '_Python_' + platform.python_version() + \
                        '_mpl_' + mpl.__version__
 
-            # call plot function
-            outname = plot_pcolor(X = xVals,
-                                  Y = yVals,
-                                  Z = zVals,
-                                  params = [width_X, height_Y],
-                                  fProps = fProps,
-                                  xFormat = xFormat,
-                                  yFormat = yFormat,
-                                  zFormat = zFormat,
-                                  zColor = zColor,
-                                  outname = outname,
-                                  outdir = OUTDIR)
-
-    return None
+            panels.append((zVals, zColor, outname))
+
+        # batch plot job (one figure scaffold for all color maps)
+        jobs.append((plot_pcolor_batch, {'X': xVals,
+                                         'Y': yVals,
+                                         'panels': panels,
+                                         'params': [width_X, height_Y],
+                                         'fProps': fProps,
+                                         'xFormat': xFormat,
+                                         'yFormat': yFormat,
+                                         'zFormat': zFormat,
+                                         'outdir': OUTDIR}))
+
+    # one list of outnames per batch job
+    outnames = run_sweep(jobs, n_workers = n_workers, initializer = warm_up)
+
+    return [outname for batch in outnames for outname in batch]
 
 def test_04(cMaps = [cm.viridis]):
 
@@ -517,11 +580,7 @@ def test_04(cMaps = [cm.viridis]):
     height_Y = n_pxs_y * pixelHeight
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     assert xVals.shape == yVals.shape, "Shape assertion failed."
     assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
@@ -553,7 +612,8 @@ def test_04(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 1.001 * float(ymax), 8.0, 4.0, r'y axis label')
     zFormat = ('linear', 0.0, 6.85, 1.0)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -564,19 +624,19 @@ def test_04(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
 
-    return None
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
+
+    return outnames
 
 def test_05(cMaps = [cm.viridis]):
 
@@ -597,11 +657,7 @@ def test_05(cMaps = [cm.viridis]):
     height_Y = n_pxs_y * pixelHeight
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     assert xVals.shape == yVals.shape, "Shape assertion failed."
     assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
@@ -635,7 +691,8 @@ def test_05(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 1.001 * float(ymax), 16.0, 8.0, r'y axis label')
     zFormat = ('linear', 0.0, 12.62, 2.0)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -646,19 +703,19 @@ def test_05(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
+
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
 
-    return None
+    return outnames
 
 def test_06(cMaps = [cm.viridis]):
 
@@ -679,11 +736,7 @@ def test_06(cMaps = [cm.viridis]):
     height_Y = n_pxs_y * pixelHeight
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     assert xVals.shape == yVals.shape, "Shape assertion failed."
     assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
@@ -715,7 +768,8 @@ def test_06(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 1.001 * ymax, 32.0, 16.0, r'y axis label')
     zFormat = ('linear', 0.0, 25.42, 4.0)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -726,19 +780,19 @@ def test_06(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
+
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
 
-    return None
+    return outnames
 
 def test_07(cMaps = [cm.viridis]):
 
@@ -760,11 +814,7 @@ def test_07(cMaps = [cm.viridis]):
     xyRatio = width_X / height_Y # for non-square (image / data) matrices
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
 
@@ -795,7 +845,8 @@ def test_07(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 1.001 * ymax, 10.0, 5.0, r'y axis label')
     zFormat = ('linear', 0.0, 6.21, 2.0)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -806,18 +857,20 @@ def test_07(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              params = [width_X, height_Y],
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
+
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 params = [width_X, height_Y],
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
+
+    return outnames
 
 def test_08(cMaps = [cm.viridis]):
 
@@ -839,11 +892,7 @@ def test_08(cMaps = [cm.viridis]):
     xyRatio = width_X / height_Y # for non-square (image / data) matrices
 
     # fill matrix
-    zVals = np.zeros((n_pxs_x, n_pxs_y))
-
-    for j in range(n_pxs_y):     # iterate over y values
-        for i in range(n_pxs_x): # iterate over x values
-            zVals[i, j] = 0.2 * xVals[i]
+    zVals = getRampField(xVals, yVals, slope = 0.2)
 
     assert zVals.shape == (n_pxs_x, n_pxs_y), "Shape assertion failed."
 
@@ -874,7 +923,8 @@ def test_08(cMaps = [cm.viridis]):
     yFormat = ('linear', ylim_left, ylim_right, 0.0, 1.001 * ymax, 10.0, 5.0, r'y axis label')
     zFormat = ('linear', 0.0, 3.01, 1.0)
 
-    # loop over color maps
+    # assemble one panel per color map
+    panels = []
     for cMap in cMaps:
 
         zColor = (cMap, zmin, zmax, r'z label (cbar)')
@@ -885,33 +935,33 @@ def test_08(cMaps = [cm.viridis]):
         outname += '_Python_' + platform.python_version() + \
                    '_mpl_' + mpl.__version__
 
-        # call plot function
-        outname = plot_pcolor(X = xVals,
-                              Y = yVals,
-                              Z = zVals,
-                              params = [width_X, height_Y],
-                              fProps = fProps,
-                              xFormat = xFormat,
-                              yFormat = yFormat,
-                              zFormat = zFormat,
-                              zColor = zColor,
-                              outname = outname,
-                              outdir = OUTDIR)
+        panels.append((zVals, zColor, outname))
 
-if __name__ == '__main__':
-
-    test_01(cMaps = [cm.viridis])
-
-    test_02(cMaps = [cm.viridis])
+    # call batch plot function (one figure scaffold for all color maps)
+    outnames = plot_pcolor_batch(X = xVals,
+                                 Y = yVals,
+                                 panels = panels,
+                                 params = [width_X, height_Y],
+                                 fProps = fProps,
+                                 xFormat = xFormat,
+                                 yFormat = yFormat,
+                                 zFormat = zFormat,
+                                 outdir = OUTDIR)
 
-    test_03(cMaps = [cm.viridis])
+    return outnames
 
-    test_04(cMaps = [cm.viridis])
-
-    test_05(cMaps = [cm.viridis])
+if __name__ == '__main__':
 
-    test_06(cMaps = [cm.viridis])
+    # the test cases are independent of each other and are run in parallel
+    # (use n_workers = 1 to run them serially in this process)
+    tests = [test_01, test_02, test_03, test_04, test_05, test_06, test_07, test_08]
 
-    test_07(cMaps = [cm.viridis])
+    results = run_sweep([(test, {'cMaps': [cm.viridis]}) for test in tests],
+                        n_workers = os.cpu_count(),
+                        initializer = warm_up)
 
-    test_08(cMaps = [cm.viridis])
+    # the written outnames are passed back in the order of the tests
+    for test, outnames in zip(tests, results):
+        print(test.__name__ + ':')
+        for outname in outnames:
+            print('    ' + outname)
@@ -18,12 +18,18 @@ but often works good enough.
 '''
 
 import os
+import sys
 import platform
 import datetime
 import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 
+sys.path.append('../')
+from figureExport import save_all
+from mplStyles import use_style
+from renderTrace import traced
+
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -54,27 +60,12 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
+@traced()
+@use_style('clean', {'legend.fontsize': 7.5,
+                     'font.sans-serif': ['Helvetica']})
 def Plot(X, outname, outdir, pColors, titlestr = None,
          grid = False, saveEPS = True, savePDF = True, savePNG = False, datestamp = True):
 
-    mpl.rcParams['xtick.top'] = False
-    mpl.rcParams['xtick.bottom'] = True
-    mpl.rcParams['ytick.right'] = False
-    mpl.rcParams['xtick.direction'] = 'out'
-    mpl.rcParams['ytick.direction'] = 'out'
-
-    mpl.rc('font', **{'size': 10})
-    mpl.rc('legend', **{'fontsize': 7.5})
-    mpl.rc('axes', linewidth = 0.5)
-
-    mpl.rc('font', **{'family' : 'sans-serif', 'sans-serif' : ['Helvetica']})
-    mpl.rcParams['pdf.fonttype'] = 42
-    mpl.rcParams['text.usetex'] = False
-    mpl.rcParams['mathtext.fontset'] = 'cm'
-    mpl.rcParams['text.latex.preamble'] = \
-        r'\usepackage{cmbright}' + \
-        r'\usepackage{amsmath}'
-
     ######################################################################################
     # set up figure
     fWidth, fHeight, lFrac, rFrac, bFrac, tFrac =\
@@ -138,12 +129,10 @@ def Plot(X, outname, outdir, pColors, titlestr = None,
     # save to file
     if datestamp:
         outname += '_' + today
-    if savePDF: # save to file using pdf backend
-        f.savefig(os.path.join(outdir, outname) + '.pdf', dpi = 300, transparent = True)
-    if savePNG:
-        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
-    if saveEPS:
-        f.savefig(os.path.join(outdir, outname) + '.eps', format ='eps', dpi = 600)
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG), ('eps', saveEPS))
+               if save]
+    # prints the time spent in each backend
+    save_all(f, os.path.join(outdir, outname), formats, verbose = True)
     ######################################################################################
     # close handles
     plt.cla()
@@ -18,6 +18,8 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 
 from mplUtils import getHistogramCoordinates
+from pointAggregation import aggregated_scatter
+from renderTrace import traced
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
@@ -49,6 +51,7 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
+@traced()
 def Plot(X, Y, outname, outdir, pColors, titlestr = None,
          grid = False, saveEPS = False, savePDF = True, savePNG = False, datestamp = True):
 
@@ -93,9 +96,9 @@ def Plot(X, Y, outname, outdir, pColors, titlestr = None,
 
     labelfontsize = 8.0
     for tick in ax1.xaxis.get_major_ticks():
-        tick.label.set_fontsize(labelfontsize)
+        tick.label1.set_fontsize(labelfontsize)
     for tick in ax1.yaxis.get_major_ticks():
-        tick.label.set_fontsize(labelfontsize)
+        tick.label1.set_fontsize(labelfontsize)
 
     ax1.tick_params('both', length = 3.5, width = 0.5, which = 'major', pad = 3.0)
     ax1.tick_params('both', length = 2.0, width = 0.25, which = 'minor', pad = 3.0)
@@ -126,13 +129,13 @@ def Plot(X, Y, outname, outdir, pColors, titlestr = None,
              clip_on = True,
              zorder = 1)
 
-    ax1.scatter(Y[:, 0], Y[:, 1],
-                s = 20,
-                lw = 0.5,
-                facecolor = 'None',
-                edgecolor = pColors[0],
-                zorder = 2,
-                label = r'sampled data')
+    aggregated_scatter(ax1, Y[:, 0], Y[:, 1],
+                       s = 20,
+                       lw = 0.5,
+                       facecolor = 'None',
+                       edgecolor = pColors[0],
+                       zorder = 2,
+                       label = r'sampled data')
 
     # legend
     leg = ax1.legend(handlelength = 1.5,
@@ -16,12 +16,19 @@
 ##########################################################################################
 
 import os
+import sys
 import platform
 import datetime
 import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 
+sys.path.append('../')
+from mpl_string_formatter import str_format_power_of_ten_exponent
+from tickFormatters import formatPowerOfTen
+from pointAggregation import aggregated_scatter
+from renderTrace import traced
+
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
@@ -29,27 +36,6 @@ OUTDIR = os.path.join(BASEDIR, 'out')
 
 os.makedirs(OUTDIR, exist_ok = True)
 
-def str_format_power_of_ten(text: str) -> str:
-    '''
-    Assumes a scientific formatted input string of the type 1.27e-05
-    and will output $1.27 x 10^{-5}$ with proper power of ten formatting.
-    '''
-    index = text.index('e')
-    mantisse, exponent = text[:index], text[(index + 1):]
-    exponent = exponent.lstrip('0+') # strip learding plus sign and zeros from the exponent
-    label = mantisse + r'$ \times\mathdefault{10^{' +  exponent + '}}$'
-    return label
-
-def str_format_power_of_ten_exponent(text):
-    '''
-    Assumes a scientific formatted input string of the type 1.27e-05
-    and will output the exponent only, e.g. $x 10^{-5}$ with proper power of ten formatting.
-    '''
-    index = text.index('e')
-    exponent = text[(index + 1):]
-    label = r'$\mathdefault{\times \, 10^{' +  exponent + '}}$'
-    return label
-
 def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac = 0.9):
     '''
     True size scaling auxiliary function to setup mpl plots with a desired size.
@@ -71,6 +57,7 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
+@traced()
 def Plot(X, outname, outdir, pColors, titlestr = None,
          grid = True, drawLegend = False, xFormat = None, yFormat = None, str_format_func = None,
          savePDF = True, savePNG = False, datestamp = True):
@@ -129,13 +116,13 @@ def Plot(X, outname, outdir, pColors, titlestr = None,
 
     lineWidth = 1.0
 
-    ax1.scatter(X[:, 0], X[:, 1],
-                s = 20.0,
-                lw = lineWidth,
-                facecolor = pColors[0],
-                edgecolor = 'None',
-                zorder = 4,
-                clip_on = False)
+    aggregated_scatter(ax1, X[:, 0], X[:, 1],
+                       s = 20.0,
+                       lw = lineWidth,
+                       facecolor = pColors[0],
+                       edgecolor = 'None',
+                       zorder = 4,
+                       clip_on = False)
 
     ax1.plot(X[:, 0], X[:, 1],
              color = pColors[0],
@@ -229,11 +216,12 @@ def Plot(X, outname, outdir, pColors, titlestr = None,
     dy = np.abs(ymax - ymin) # y value span  
     y_offset = 0.06 * dy # 6 per cent of y extent
 
+    # all data labels are formatted at once
+    labels = str_format_func(X[:, 1])
+
     for i in range(n_datapoints - 1):
 
-        label = f'{int(X[i, 1]):.2e}'
-        label = str_format_func(label)
-        ax1.annotate(label,
+        ax1.annotate(labels[i],
                      xy = (X[i, 0], X[i, 1] - y_offset),
                      xycoords = 'data',
                      fontsize = 6.0,
@@ -243,9 +231,7 @@ def Plot(X, outname, outdir, pColors, titlestr = None,
                      clip_on = False)
 
     # manually set label for the last data point
-    label = f'{int(X[-1, 1]):.2e}'
-    label = str_format_func(label)
-    ax1.annotate(label,
+    ax1.annotate(labels[-1],
                  xy = (X[-1, 0] - 1.3, X[-1, 1]),
                  xycoords = 'data',
                  fontsize = 6.0,
@@ -304,10 +290,10 @@ if __name__ == '__main__':
     yFormat = (0.0, 1.077e6, 0.0, 1.077e6, 2.0e5, 1.0e5)
     pColors = ['k']
 
-    # set data label str format functions
+    # set data label str format functions (mapping the array of values to the labels)
     data_label_str_formatters = [
-        lambda x: x,
-        str_format_power_of_ten
+        lambda values: [f'{int(value):.2e}' for value in values],
+        lambda values: formatPowerOfTen(values, precision = 3, omitUnitMantissa = False)
     ]
 
     for i, data_label_str_formatter in enumerate(data_label_str_formatters):
@@ -8,6 +8,8 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.4.2
 ##########################################################################################
 
+import sys
+sys.path.append('../')
 import os
 import platform
 import datetime
@@ -17,6 +19,10 @@ from matplotlib import pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.cm as cm
 
+from colormapSweep import ColormapSweep
+from colormapSweep import getFigureKey
+from renderTrace import traced
+
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -47,9 +53,14 @@ def getFigureProps(width, height, lFrac = 0.17, rFrac = 0.9, bFrac = 0.17, tFrac
     fHeight = axesHeight / (tFrac - bFrac)
     return fWidth, fHeight, lFrac, rFrac, bFrac, tFrac
 
-def Plot(X, params, outname, outdir, cMap, titlestr = None,
-         grid = True, savePDF = True, savePNG = False, datestamp = True):
-
+def setup_colorbar_figure(cb_label, cMap):
+    '''
+    Sets the rcParams and builds the standalone colorbar figure shared by Plot and
+    plot_colorbar_sweep.
+    :param cb_label: string, colorbar label
+    :param cMap: colormap of the colorbar
+    :returns f, ax1, cb1: figure, (invisible) placeholder axes and colorbar
+    '''
     mpl.rcParams['xtick.top'] = False
     mpl.rcParams['xtick.bottom'] = False
     mpl.rcParams['ytick.right'] = False
@@ -80,46 +91,12 @@ def Plot(X, params, outname, outdir, cMap, titlestr = None,
     f.set_size_inches(fWidth, fHeight)
     f.subplots_adjust(left = lFrac, right = rFrac)
     f.subplots_adjust(bottom = bFrac, top = tFrac)
-    ######################################################################################
-
-    major_x_ticks = np.arange(0.0, 1.1, 0.5)
-    minor_x_ticks = np.arange(0.0, 1.1, 0.1)
-    ax1.set_xticks(major_x_ticks)
-    ax1.set_xticks(minor_x_ticks, minor = True)
-
-    major_y_ticks = np.arange(0.0, 1.1, 0.5)
-    minor_y_ticks = np.arange(0.0, 1.1, 0.1)
-    ax1.set_yticks(major_y_ticks)
-    ax1.set_yticks(minor_y_ticks, minor = True)
-
-    labelfontsize = 10.0
-    for tick in ax1.xaxis.get_major_ticks():
-        tick.label.set_fontsize(labelfontsize)
-    for tick in ax1.yaxis.get_major_ticks():
-        tick.label.set_fontsize(labelfontsize)
-
-    ax1.tick_params('both', length = 5.5, width = 0.5, which = 'major', pad = 3.0)
-    ax1.tick_params('both', length = 3.0, width = 0.25, which = 'minor', pad = 3.0)
-
-    ax1.tick_params(axis = 'x', which = 'major', pad = 3.0)
-    ax1.tick_params(axis = 'y', which = 'major', pad = 3.0, zorder = 10)
-
-    ######################################################################################
-    # colormap settings
-    cmap_min = 0.0
-    cmap_max = 1.0
-    print('cmap_min = ', cmap_min)
-    print('cmap_max = ', cmap_max)
-    cNorm = mpl.colors.Normalize(vmin = cmap_min, vmax = cmap_max)
-    ######################################################################################
-    # plot (dummy) data
-    ax1.imshow(X, cmap = cMap, vmin = cmap_min, vmax = cmap_max)
-    plt.gca().set_visible(False)
+    # (the main axes only serve as placeholder and are not shown)
+    ax1.set_visible(False)
     ######################################################################################
     # colorbar
     # add_axes(left, bottom, width, height) all between [0, 1] relative to the figure size
-
-    cb_label = params[0]
+    cNorm = mpl.colors.Normalize(vmin = 0.0, vmax = 1.0)
 
     cax = f.add_axes([lFrac, bFrac, (rFrac - lFrac), (tFrac - bFrac)])
 
@@ -141,6 +118,15 @@ def Plot(X, params, outname, outdir, cMap, titlestr = None,
     cb1.ax.tick_params(labelsize = 10.0)
     cb1.ax.minorticks_on()
     # cb1.solids.set_rasterized(True)
+    return f, ax1, cb1
+
+@traced()
+def Plot(X, params, outname, outdir, cMap, titlestr = None,
+         grid = True, savePDF = True, savePNG = False, datestamp = True):
+
+    f, ax1, cb1 = setup_colorbar_figure(params[0], cMap)
+    # plot (dummy) data on the invisible placeholder axes
+    ax1.imshow(X, cmap = cMap, vmin = 0.0, vmax = 1.0)
 
     ######################################################################################
     # save to file
@@ -152,14 +138,41 @@ def Plot(X, params, outname, outdir, cMap, titlestr = None,
         f.savefig(os.path.join(outdir, outname) + '.png', dpi = 600, transparent = False)
     ######################################################################################
     # close handles
-    plt.cla()
-    plt.clf()
-    plt.close()
+    plt.close(f)
     return outname
 
-if __name__ == '__main__':
+@traced()
+def plot_colorbar_sweep(params, cMaps, outnames, outdir, savePDF = True,
+                        savePNG = False, datestamp = True):
+    '''
+    Colormap sweep variant of Plot, which writes one standalone colorbar per colormap.
+    :param cMaps: sequence of colormaps
+    :param outnames: sequence of output names, one per colormap
+    :returns outnames: list of the (dated) output names, in the order of cMaps
+    The figure and the colorbar (including its ticks and labels) are built only once,
+    where only the colormap of the colorbar is swapped for every further colormap (see
+    colormapSweep.ColormapSweep). Outputs, which are unchanged since the last run, are
+    not written again.
+    '''
+    assert len(cMaps) == len(outnames), "Length assertion failed."
+    arguments = dict(locals())
 
-    X = np.array([[0, 1]])
+    # (only once for all colormaps)
+    f, ax1, cb1 = setup_colorbar_figure(params[0], cMaps[0])
+
+    ######################################################################################
+    # swap the colormap per output and save to file
+    if datestamp:
+        outnames = [outname + '_' + today for outname in outnames]
+    formats = [fmt for fmt, save in (('pdf', savePDF), ('png', savePNG)) if save]
+    sweep = ColormapSweep(f, [cb1.mappable], outdir, formats,
+                          key = getFigureKey(plot_colorbar_sweep, arguments,
+                                             exclude = ('cMaps', 'outnames', 'outdir')))
+    for cMap, outname in zip(cMaps, outnames):
+        sweep.render(cMap, outname)
+    return sweep.close()
+
+if __name__ == '__main__':
 
     cb_label = r'color bar label $\, z$'
 
@@ -175,16 +188,11 @@ if __name__ == '__main__':
                 'mpl_standalone_colorbar_magma',
                 'mpl_standalone_colorbar_gray']
 
-    assert len(cMaps) == len(outnames), "Length assertion failed."
-
-    for i, cMap in enumerate(cMaps):
-
-        outname = outnames[i]
-        outname += '_Python_' + platform.python_version() + \
-               '_mpl_' + mpl.__version__
+    outnames = [outname + '_Python_' + platform.python_version() + \
+                '_mpl_' + mpl.__version__ for outname in outnames]
 
-        outname = Plot(X = X,
-                       params = [cb_label],
-                       outname = outname,
-                       outdir = OUTDIR,
-                       cMap = cMap)
+    # one figure and colorbar for all colormaps (see plot_colorbar_sweep)
+    outnames = plot_colorbar_sweep(params = [cb_label],
+                                   cMaps = cMaps,
+                                   outnames = outnames,
+                                   outdir = OUTDIR)
@@ -8,31 +8,43 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.3.4
 ##########################################################################################
 
+from functools import lru_cache
+
 def cleanFormatter(x, pos = None):
     '''
     will format 0.0 as 0 and
     will format 1.0 as 1
+    and, as the cache does not distinguish -0.0 from 0.0, will format -0.0 as 0
     '''
+    return _cleanLabel(x + 0.0)
+
+@lru_cache(maxsize = 4096)
+def _cleanLabel(x):
     return '{:g}'.format(x)
 
+@lru_cache(maxsize = 4096)
 def str_format_power_of_ten(text: str) -> str:
     '''
     Assumes a scientific formatted input string of the type 1.27e-05
     and will output $1.27 x 10^{-5}$ with proper power of ten formatting.
+    The labels are memoized, see also tickFormatters.py for vectorized tick formatters.
     '''
-    index = text.index('e')
-    mantisse, exponent = text[:index], text[(index + 1):]
+    mantisse, separator, exponent = text.partition('e')
+    if not separator:
+        raise ValueError("no exponent in {!r}".format(text))
     exponent = exponent.lstrip('0+') # strip learding plus sign and zeros from the exponent
     label = mantisse + r'$ \times\mathdefault{10^{' +  exponent + '}}$'
     return label
 
+@lru_cache(maxsize = 4096)
 def str_format_power_of_ten_exponent(text):
     '''
     Assumes a scientific formatted input string of the type 1.27e-05
     and will output the exponent only, e.g. $x 10^{-5}$ with proper power of ten formatting.
     '''
-    index = text.index('e')
-    exponent = text[(index + 1):]
+    separator, exponent = text.partition('e')[1:]
+    if not separator:
+        raise ValueError("no exponent in {!r}".format(text))
     label = r'$\mathdefault{\times \, 10^{' +  exponent + '}}$'
     return label
 
@@ -0,0 +1,230 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: parallelSweep.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Process pool driver for the parameter sweeps of the template scripts.
+
+Most template modules end in serial loops like
+    for cMap in cMaps:
+        plot_pcolor(...)
+or
+    for n in np.arange(1, 10 + 1, 1):
+        plot_pcolor(...)
+which only use a single core. Instead of calling the plot function directly, collect
+one (func, kwargs) job per loop iteration and hand the job list to run_sweep:
+    ##############################################
+    from parallelSweep import run_sweep
+    # other code ...
+    jobs = [(plot_pcolor, {'X': xVals, ..., 'outname': outname}) for ...]
+    outnames = run_sweep(jobs, n_workers = 8)
+    # other code ...
+    ##############################################
+The plot functions are executed in worker processes using the non-interactive Agg
+backend. Each worker is initialised exactly once. The return values (for the templates
+these are the written outnames) are passed back to the parent in the order of the
+submitted jobs, independent of the order in which the workers finish them.
+
+The job functions must be defined on module level (such that they can be pickled) and
+the calling script must guard its sweep by if __name__ == '__main__':, since the
+workers are started using the 'spawn' method.
+
+Long sweeps (tens of thousands of figures) slowly grow the memory of the workers (see
+memoryGuard.py). run_bounded_sweep samples the memory of every worker every
+check_every jobs and replaces a worker by a fresh process, as soon as its RSS exceeds
+memory_budget (in MB):
+    ##############################################
+    from parallelSweep import run_bounded_sweep
+    # other code ...
+    sweep = run_bounded_sweep(jobs, n_workers = 8, memory_budget = 1024.0)
+    outnames = sweep.results
+    # other code ...
+    ##############################################
+Every worker holds at most one job at a time, while the remaining jobs are queued in
+the calling process, such that recycling a worker never drops queued work. A job,
+whose worker died (e.g. killed by the out of memory killer), is run once more by a
+fresh worker.
+'''
+
+import os
+import multiprocessing
+from collections import deque
+from collections import namedtuple
+from concurrent.futures import wait
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from memoryGuard import MemoryGuard
+from memoryGuard import MEMORY_GUARD_EVERY
+from memoryGuard import getRSS
+from memoryGuard import formatMemoryReport
+
+# results in the order of the jobs, reports as list of memoryGuard.MemoryReport and
+# recycled as number of replaced workers
+BoundedSweepResult = namedtuple('BoundedSweepResult', ['results', 'reports', 'recycled'])
+
+# memory guard of a worker process of run_bounded_sweep
+_guard = None
+
+def _init_worker(backend, initializer, initargs):
+    '''
+    Runs once per worker process before the first job is executed.
+    '''
+    import matplotlib
+    matplotlib.use(backend)
+    if initializer is not None:
+        initializer(*initargs)
+
+def _run_job(func, kwargs):
+    return func(**kwargs)
+
+def _init_guarded_worker(backend, initializer, initargs, check_every, trace_malloc):
+    global _guard
+    _init_worker(backend, initializer, initargs)
+    _guard = MemoryGuard(every = check_every, traceMalloc = trace_malloc)
+
+def _run_guarded_job(func, kwargs):
+    '''
+    Runs the job and returns its result together with the RSS of the worker and the
+    memory report (or None, if no sample was due).
+    '''
+    result = func(**kwargs)
+    report = _guard.record()
+    return result, getRSS(), report
+
+def run_sweep(jobs, n_workers = None, backend = 'Agg', initializer = None, initargs = (),
+              max_tasks_per_child = None):
+    '''
+    Executes a list of plot jobs in a pool of worker processes.
+    :param jobs: sequence of (func, kwargs) tuples, where func is a module level function
+        and kwargs a dict of its keyword arguments.
+    :param n_workers: int, number of worker processes. Defaults to os.cpu_count().
+        For n_workers = 1 the jobs are run serially in the calling process.
+    :param backend: string, matplotlib backend used by every worker process.
+    :param initializer: callable, optional additional per process setup function (e.g.
+        a font cache warm up), which is called once in every worker with initargs.
+    :param max_tasks_per_child: int, if given, every worker is replaced by a fresh
+        process after this many jobs (use 1 to run every job in its own process). The
+        jobs are then run in worker processes also for n_workers = 1.
+    :returns results: list of the job return values in the order of jobs.
+    '''
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    # only the requested n_workers = 1 runs serially, fewer jobs than workers still
+    # run in (initialized) worker processes
+    if n_workers <= 1 and max_tasks_per_child is None:
+        return [_run_job(func, kwargs) for func, kwargs in jobs]
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers = max(1, min(n_workers, len(jobs))),
+                             mp_context = context,
+                             initializer = _init_worker,
+                             initargs = (backend, initializer, initargs),
+                             max_tasks_per_child = max_tasks_per_child) as executor:
+        futures = [executor.submit(_run_job, func, kwargs) for func, kwargs in jobs]
+        results = [future.result() for future in futures]
+
+    return results
+
+def run_bounded_sweep(jobs, n_workers = None, memory_budget = None,
+                      check_every = MEMORY_GUARD_EVERY, trace_malloc = False,
+                      backend = 'Agg', initializer = None, initargs = (), verbose = True):
+    '''
+    Executes a list of plot jobs in worker processes, which are replaced by fresh
+    processes, when their memory exceeds the budget.
+    :param jobs: sequence of (func, kwargs) tuples (see run_sweep)
+    :param n_workers: int, number of worker processes. Defaults to os.cpu_count().
+    :param memory_budget: float, RSS in MB, above which a worker is replaced after its
+        current job. None never replaces workers (only reports their memory).
+    :param check_every: int, number of jobs per worker between two memory reports
+    :param trace_malloc: bool, if True, the reports include the source lines with the
+        largest growth (using tracemalloc, which slows down the workers)
+    :param backend, initializer, initargs: see run_sweep
+    :param verbose: bool, if True, the reports and replaced workers are printed
+    :returns sweep: BoundedSweepResult (results, reports, recycled)
+    '''
+    jobs = list(jobs)
+    if not jobs:
+        return BoundedSweepResult([], [], 0)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(jobs)))
+
+    context = multiprocessing.get_context('spawn')
+
+    def getExecutor():
+        return ProcessPoolExecutor(max_workers = 1,
+                                   mp_context = context,
+                                   initializer = _init_guarded_worker,
+                                   initargs = (backend, initializer, initargs,
+                                               check_every, trace_malloc))
+
+    results = [None] * len(jobs)
+    reports = []
+    recycled = 0
+    queue = deque(range(len(jobs)))
+    retried = set()
+    running = {}
+    executors = [getExecutor() for k in range(n_workers)]
+
+    def submit(slot):
+        index = queue.popleft()
+        func, kwargs = jobs[index]
+        running[executors[slot].submit(_run_guarded_job, func, kwargs)] = (slot, index)
+
+    def recycle(slot):
+        executors[slot].shutdown()
+        executors[slot] = getExecutor()
+
+    try:
+        for slot in range(n_workers):
+            submit(slot)
+        while running:
+            done = wait(running, return_when = FIRST_COMPLETED)[0]
+            for future in done:
+                slot, index = running.pop(future)
+                try:
+                    results[index], rss, report = future.result()
+                except BrokenProcessPool:
+                    if index in retried:
+                        raise
+                    retried.add(index)
+                    queue.appendleft(index)
+                    recycle(slot)
+                    recycled += 1
+                    if verbose:
+                        print("Worker died running job {}, resubmitted.".format(index))
+                    submit(slot)
+                    continue
+                if report is not None:
+                    reports.append(report)
+                    if verbose:
+                        print(formatMemoryReport(report))
+                if memory_budget is not None and rss is not None and rss > memory_budget:
+                    recycle(slot)
+                    recycled += 1
+                    if verbose:
+                        print("Worker replaced at RSS {:.1f} MB > {:.1f} MB.".format(
+                              rss, memory_budget))
+                if queue:
+                    submit(slot)
+    finally:
+        for executor in executors:
+            executor.shutdown(cancel_futures = True)
+
+    return BoundedSweepResult(results, reports, recycled)
+
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,220 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: pointAggregation.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Aggregated rendering of large scatter plots.
+
+ax.scatter draws (and writes to pdf / svg) one marker path per point, which dominates
+the rendering time and the output size for large point sets. Above a given number of
+points, aggregated_scatter instead bins the points into an image at the resolution of
+the output (using np.bincount) and composites this image into the axes at draw time:
+    ##############################################
+    from pointAggregation import aggregated_scatter
+    # other code ...
+    p = aggregated_scatter(ax1, X[:, 0], X[:, 1],
+                           s = 12.0,
+                           facecolor = pColors[0],
+                           edgecolor = 'None',
+                           alpha = 0.18,
+                           label = r'sampling')
+    # other code ...
+    ##############################################
+Every pixel is colored as if the covering markers were drawn on top of each other,
+i.e. with an opacity of 1 - (1 - alpha)^count for count overlapping markers of opacity
+alpha (markers are approximated by filled discs of the marker size). For given point
+values, every pixel is instead colored by the mean value of its points using cmap and
+norm.
+The returned handle is an (empty) PathCollection with the scatter's style and label,
+such that legends, the legend handles and the tick styling are unchanged. Below the
+threshold aggregated_scatter is equivalent to ax.scatter.
+'''
+
+import numpy as np
+import matplotlib as mpl
+import matplotlib.artist
+import matplotlib.colors
+from matplotlib.markers import MarkerStyle
+from matplotlib.transforms import Affine2D
+
+# number of points above which the points are aggregated
+AGGREGATION_THRESHOLD = 100000
+
+# maximal marker radius in pixels (larger markers are clipped to this radius)
+MAX_SPREAD_RADIUS = 16
+
+def aggregatePoints(px, py, shape, weights = None):
+    '''
+    Returns the number of points (or the sum of weights) per pixel.
+    :param px: numpy ndarray, horizontal pixel coordinates
+    :param py: numpy ndarray, vertical pixel coordinates (0 is the bottom row)
+    :param shape: (height, width) of the image
+    :param weights: numpy ndarray of point weights or None
+    :returns image: numpy ndarray of the given shape
+    '''
+    height, width = shape
+    px = np.asarray(px, dtype = float)
+    py = np.asarray(py, dtype = float)
+    # (non-finite coordinates compare False and are masked before the integer cast)
+    inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    flat = np.floor(py[inside]).astype(np.intp) * width + \
+        np.floor(px[inside]).astype(np.intp)
+    if weights is not None:
+        weights = np.asarray(weights, dtype = float)[inside]
+    return np.bincount(flat, weights = weights,
+                       minlength = width * height).reshape(height, width)
+
+def getDiscOffsets(radius):
+    '''
+    Returns the integer pixel offsets (dy, dx) covered by a disc of the given radius.
+    '''
+    r = int(np.ceil(radius))
+    dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+    covered = dx ** 2 + dy ** 2 <= max(radius, 0.5) ** 2
+    return list(zip(dy[covered].tolist(), dx[covered].tolist()))
+
+def spreadImage(image, radius):
+    '''
+    Sums image over a disc of the given radius around every pixel, i.e. every point
+    then covers all pixels of its marker.
+    '''
+    if radius < 1.0:
+        return image
+    r = int(np.ceil(radius))
+    padded = np.pad(image, r)
+    height, width = image.shape
+    spread = np.zeros(image.shape, dtype = padded.dtype)
+    for dy, dx in getDiscOffsets(radius):
+        spread += padded[r + dy:r + dy + height, r + dx:r + dx + width]
+    return spread
+
+class AggregatedPoints(mpl.artist.Artist):
+    '''
+    Artist, which draws points as image aggregated at the renderer's resolution.
+    '''
+
+    def __init__(self, x, y, color, alpha = 1.0, size = 20.0, values = None,
+                 cmap = None, norm = None, markerRadius = 0.5):
+        super().__init__()
+        self.x = np.asarray(x, dtype = float).ravel()
+        self.y = np.asarray(y, dtype = float).ravel()
+        self.values = None if values is None else np.asarray(values, dtype = float).ravel()
+        self.color = mpl.colors.to_rgba(color, alpha)
+        self.pointAlpha = 1.0 if alpha is None else alpha
+        self.size = size
+        # marker radius in units of sqrt(size), i.e. 0.5 for 'o'
+        self.markerRadius = markerRadius
+        self.cmap = mpl.colormaps[cmap or mpl.rcParams['image.cmap']] \
+            if not isinstance(cmap, mpl.colors.Colormap) else cmap
+        self.norm = norm
+        if self.values is not None and self.norm is None:
+            self.norm = mpl.colors.Normalize(np.nanmin(self.values),
+                                             np.nanmax(self.values))
+
+    def getRGBA(self, renderer):
+        '''
+        Returns the aggregated RGBA image (uint8, first row at the bottom) covering the
+        axes bounding box, together with the image magnification.
+        '''
+        bbox = self.axes.bbox
+        magnification = renderer.get_image_magnification()
+        width = max(int(np.ceil(bbox.width * magnification)), 1)
+        height = max(int(np.ceil(bbox.height * magnification)), 1)
+
+        points = self.axes.transData.transform(np.column_stack([self.x, self.y]))
+        px = (points[:, 0] - bbox.x0) * magnification
+        py = (points[:, 1] - bbox.y0) * magnification
+        radius = self.markerRadius * np.sqrt(self.size) * renderer.points_to_pixels(1.0) \
+            * magnification
+        radius = min(radius, MAX_SPREAD_RADIUS)
+
+        counts = spreadImage(aggregatePoints(px, py, (height, width)), radius)
+        rgba = np.zeros((height, width, 4))
+        if self.values is None:
+            rgba[:, :, :3] = self.color[:3]
+            rgba[:, :, 3] = 1.0 - (1.0 - self.color[3]) ** counts
+        else:
+            sums = spreadImage(aggregatePoints(px, py, (height, width), self.values),
+                               radius)
+            covered = counts > 0
+            rgba[covered] = self.cmap(self.norm(sums[covered] / counts[covered]))
+            rgba[:, :, 3] *= self.pointAlpha
+        return (rgba * 255.0 + 0.5).astype(np.uint8), magnification
+
+    def draw(self, renderer):
+        if not self.get_visible() or len(self.x) == 0:
+            return
+        image, magnification = self.getRGBA(renderer)
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(self.axes.bbox)
+        gc.set_gid(self.get_gid())
+        bbox = self.axes.bbox
+        if renderer.option_scale_image() and magnification != 1.0:
+            transform = Affine2D().scale(1.0 / magnification)
+            renderer.draw_image(gc, bbox.x0, bbox.y0, image, transform)
+        else:
+            renderer.draw_image(gc, bbox.x0, bbox.y0, image)
+        gc.restore()
+        self.stale = False
+
+def aggregated_scatter(ax, x, y, threshold = AGGREGATION_THRESHOLD, values = None,
+                       **kwargs):
+    '''
+    Drop-in replacement of ax.scatter(x, y, **kwargs), which aggregates the points
+    into an image for more than threshold points.
+    :param ax: matplotlib axes instance
+    :param threshold: int, number of points above which the points are aggregated
+    :param values: numpy ndarray of point values (mean mode) or None (count mode)
+    :param kwargs: keyword arguments of ax.scatter (s, color, facecolor, edgecolor,
+        alpha, cmap, norm, zorder, clip_on, label, ...)
+    :returns handle: PathCollection, the scatter itself or its (empty) legend proxy
+    '''
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.size <= threshold:
+        if values is not None:
+            kwargs['c'] = values
+        return ax.scatter(x, y, **kwargs)
+
+    cmap = kwargs.pop('cmap', None)
+    norm = kwargs.pop('norm', None)
+    # empty collection carrying the style and the label of the scatter
+    proxy = ax.scatter([], [], **kwargs)
+    # (the colors of the collection already include alpha)
+    color = (0.0, 0.0, 0.0, 0.0)
+    for colors in (proxy.get_facecolor(), proxy.get_edgecolor()):
+        if len(colors) and colors[0][3] > 0.0:
+            color = colors[0]
+            break
+    size = kwargs.get('s', mpl.rcParams['lines.markersize'] ** 2)
+    marker = MarkerStyle(kwargs.get('marker', mpl.rcParams['scatter.marker']))
+    vertices = marker.get_path().transformed(marker.get_transform()).vertices
+    artist = AggregatedPoints(x, y, color,
+                              alpha = kwargs.get('alpha') if values is not None else None,
+                              size = np.max(size),
+                              values = values,
+                              cmap = cmap,
+                              norm = norm,
+                              markerRadius = np.max(np.abs(vertices)) if len(vertices)
+                                  else 0.5)
+    artist.set_zorder(proxy.get_zorder())
+    artist.set_clip_on(kwargs.get('clip_on', True))
+    artist.set_label('_nolegend_')
+    ax.add_artist(artist)
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    if np.any(finite):
+        ax.update_datalim([[np.min(x[finite]), np.min(y[finite])],
+                           [np.max(x[finite]), np.max(y[finite])]])
+        ax.autoscale_view()
+    return proxy
+
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,460 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: renderCache.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Persistent, content addressed cache of rendered template figures.
+
+The template scripts are mostly rerun on unchanged inputs, where every figure is
+rendered again from scratch. With the render cache enabled, the output files of a
+decorated plot function are stored under a key, which is the hash of
+    - all input arguments (numpy arrays by dtype, shape and content, colormaps by their
+      lookup table, nested lists, tuples and dicts like fProps, xFormat, yFormat,
+      zFormat and zColor by value),
+    - the rcParams in effect,
+    - the matplotlib version and
+    - the source of the module defining the plot function and of the modules of the
+      repository it uses (directly or through other modules of the repository, e.g.
+      mplUtils, ticker or figureExport).
+If a matching entry exists, its pdf / png / svg files are copied to the requested
+output directory and the plot function is not called at all:
+    ##############################################
+    from renderCache import render_cache
+    # other code ...
+    @use_style('pcolor')
+    @render_cache()
+    def plot_pcolor(X, Y, Z, ..., outname, outdir, ...):
+        ...
+        return outname
+    ##############################################
+The decorated function has to write its files to os.path.join(outdir, name + '.' + fmt)
+and to return name. Functions passed as arguments are hashed by their qualified name,
+except lambdas and nested functions, which are hashed by their code, defaults and
+closure. Calls with arguments, which can not be hashed by value (e.g. plain objects
+without a deterministic repr), are passed through without caching.
+Dated output names (datestamp = True) are cached per day.
+
+The cache is disabled by default, i.e. the decorator then simply calls the plot
+function. It is enabled by setting the environment variable MPL_RENDER_CACHE = 1 or
+by calling enable(). The cache size is bounded (RENDER_CACHE_MAXBYTES), where the least
+recently used entries are evicted first. Entries of a plot function (e.g. after
+updating matplotlib's fonts, which are not part of the key) are removed by
+invalidate(plot_function).
+'''
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import inspect
+import datetime
+import threading
+import types
+from functools import wraps
+from collections import namedtuple
+import numpy as np
+import matplotlib as mpl
+import matplotlib.colors
+
+RENDER_CACHE_DIR = os.path.join(mpl.get_cachedir(), 'mpl-benchmarks-render-cache')
+RENDER_CACHE_MAXBYTES = 512 * 1024 ** 2
+
+# output formats, which are collected after rendering
+RENDER_CACHE_FORMATS = ('pdf', 'png', 'svg', 'eps')
+
+# rcParams without influence on the written files
+_IGNORED_RCPARAMS = ('backend', 'backend_fallback', 'interactive', 'toolbar',
+                     'figure.raise_window', 'savefig.directory', 'timezone')
+
+_ENTRY_FILE = 'entry.json'
+
+REPODIR = os.path.dirname(os.path.abspath(__file__))
+
+RenderCacheInfo = namedtuple('RenderCacheInfo', ['hits', 'misses', 'entries', 'bytes',
+                                                 'maxbytes'])
+
+_settings = {
+    'enabled': os.environ.get('MPL_RENDER_CACHE', '0') not in ('', '0'),
+    'cachedir': RENDER_CACHE_DIR,
+    'maxbytes': RENDER_CACHE_MAXBYTES,
+}
+_stats = {'hits': 0, 'misses': 0}
+_lock = threading.Lock()
+_sourceHashes = {}
+# total size of the entries per cache directory in bytes, as counted by this process
+_usage = {}
+
+class _Uncacheable(Exception):
+    pass
+
+def enable(cachedir = None, maxbytes = None):
+    '''
+    Enables the render cache for all decorated plot functions of the process.
+    :param cachedir: string, cache directory. Defaults to RENDER_CACHE_DIR.
+    :param maxbytes: int, maximal total size of the cached files in bytes
+    '''
+    with _lock:
+        _settings['enabled'] = True
+        if cachedir is not None:
+            _settings['cachedir'] = cachedir
+        if maxbytes is not None:
+            _settings['maxbytes'] = maxbytes
+
+def disable():
+    '''
+    Disables the render cache (the cached files are kept).
+    '''
+    with _lock:
+        _settings['enabled'] = False
+
+def _update(h, obj):
+    '''
+    Feeds a canonical representation of obj to the hash object h.
+    Raises _Uncacheable for objects, which can not be hashed by value.
+    '''
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        h.update('{}:{!r};'.format(type(obj).__name__, obj).encode())
+    elif isinstance(obj, bytes):
+        h.update(b'bytes:' + obj + b';')
+    elif isinstance(obj, np.generic):
+        _update(h, obj.item())
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            h.update('objarray:{};'.format(obj.shape).encode())
+            _update(h, obj.tolist())
+        else:
+            h.update('array:{}:{};'.format(obj.dtype.str, obj.shape).encode())
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update('{}:{};'.format(type(obj).__name__, len(obj)).encode())
+        for item in obj:
+            _update(h, item)
+    elif isinstance(obj, (set, frozenset)):
+        h.update('{}:{};'.format(type(obj).__name__, len(obj)).encode())
+        for item in sorted(obj, key = repr):
+            _update(h, item)
+    elif isinstance(obj, dict):
+        h.update('dict:{};'.format(len(obj)).encode())
+        for key in sorted(obj, key = repr):
+            _update(h, key)
+            _update(h, obj[key])
+    elif isinstance(obj, mpl.colors.Colormap):
+        h.update('cmap:{}:{};'.format(obj.name, obj.N).encode())
+        _update(h, obj(np.linspace(0.0, 1.0, obj.N)))
+        _update(h, [obj.get_under(), obj.get_over(), obj.get_bad()])
+    elif isinstance(obj, types.FunctionType) and '<' in obj.__qualname__:
+        # (lambdas and nested functions share their qualified name)
+        h.update('function:{}.{};'.format(obj.__module__, obj.__qualname__).encode())
+        _updateCode(h, obj.__code__)
+        _update(h, [obj.__defaults__, obj.__kwdefaults__])
+        try:
+            _update(h, [cell.cell_contents for cell in obj.__closure__ or ()])
+        except ValueError: # (empty cell)
+            raise _Uncacheable(obj.__qualname__)
+    elif isinstance(obj, types.CodeType):
+        _updateCode(h, obj)
+    elif callable(obj) and hasattr(obj, '__qualname__'):
+        h.update('callable:{}.{};'.format(obj.__module__, obj.__qualname__).encode())
+    else:
+        text = repr(obj)
+        if ' at 0x' in text:
+            raise _Uncacheable(type(obj).__name__)
+        h.update('{}:{};'.format(type(obj).__name__, text).encode())
+
+def _updateCode(h, code):
+    h.update(b'code:' + code.co_code + b';')
+    _update(h, [code.co_names, code.co_varnames])
+    for const in code.co_consts:
+        _update(h, const)
+
+def _isRepoFile(path):
+    return isinstance(path, str) and \
+        os.path.realpath(path).startswith(REPODIR + os.sep)
+
+def _getRepoModules(namespace):
+    '''
+    Returns the source files of the modules of the repository used by the module
+    namespace namespace (a module dict), directly or through other modules of the
+    repository, as dict of file name and module dict.
+    '''
+    found, pending = {}, [namespace]
+    while pending:
+        for value in list(pending.pop().values()):
+            if isinstance(value, types.ModuleType):
+                module = value
+            else:
+                modulename = getattr(value, '__module__', None)
+                module = sys.modules.get(modulename) if isinstance(modulename, str) \
+                    else None
+            path = getattr(module, '__file__', None)
+            if _isRepoFile(path) and path not in found:
+                found[path] = vars(module)
+                pending.append(vars(module))
+    return found
+
+def _getSourceHash(func):
+    '''
+    Returns the hash of the source file of the module defining func (respectively of
+    the code object, if the source is not available) and of the source files of the
+    modules of the repository it uses (see _getRepoModules).
+    '''
+    func = inspect.unwrap(func)
+    # (keyed by the function object, such that re-imported templates are hashed again)
+    key = func
+    if key not in _sourceHashes:
+        h = hashlib.sha1()
+        try:
+            with open(inspect.getsourcefile(func), 'rb') as fh:
+                h.update(fh.read())
+        except (OSError, TypeError):
+            h.update(repr(func.__code__.co_code).encode())
+        modules = _getRepoModules(func.__globals__)
+        for path in sorted(modules, key = os.path.basename):
+            try:
+                with open(path, 'rb') as fh:
+                    h.update(os.path.basename(path).encode() + b':' + fh.read())
+            except OSError:
+                pass
+        _sourceHashes[key] = h.hexdigest()
+    return _sourceHashes[key]
+
+def getValueKey(obj):
+    '''
+    Returns the hash (hex string) of obj by value, as used for the arguments of the
+    cached plot functions, or None if obj can not be hashed by value.
+    '''
+    h = hashlib.sha1()
+    try:
+        _update(h, obj)
+    except _Uncacheable:
+        return None
+    return h.hexdigest()
+
+def getRenderKey(func, args, kwargs, exclude = ('outdir',)):
+    '''
+    Returns the cache key (hex string) of the call func(*args, **kwargs) for the
+    rcParams in effect, or None if one of the arguments can not be hashed by value.
+    :param exclude: names of arguments, which are not part of the key
+    '''
+    try:
+        return _getKey(func, _bind(func, args, kwargs), exclude)
+    except _Uncacheable:
+        return None
+
+def _bind(func, args, kwargs):
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound
+
+def _getKey(func, bound, exclude):
+    h = hashlib.sha1()
+    _update(h, [mpl.__version__, func.__module__, func.__qualname__, _getSourceHash(func)])
+    for name, value in bound.arguments.items():
+        if name in exclude:
+            continue
+        _update(h, name)
+        _update(h, value)
+    if bound.arguments.get('datestamp'):
+        _update(h, datetime.date.today().isoformat())
+    rcParams = [(key, repr(value)) for key, value in sorted(dict.items(mpl.rcParams))
+                if key not in _IGNORED_RCPARAMS]
+    _update(h, rcParams)
+    return h.hexdigest()
+
+def _readEntry(entrydir):
+    try:
+        with open(os.path.join(entrydir, _ENTRY_FILE), 'r') as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+def _listEntries(cachedir):
+    '''
+    Returns the list of (last access time, size, entry directory, entry) tuples.
+    '''
+    entries = []
+    try:
+        names = os.listdir(cachedir)
+    except OSError:
+        return entries
+    for name in names:
+        entrydir = os.path.join(cachedir, name)
+        if name.startswith('.'):
+            continue
+        entry = _readEntry(entrydir)
+        if entry is None:
+            continue
+        try:
+            atime = os.path.getmtime(os.path.join(entrydir, _ENTRY_FILE))
+        except OSError:
+            continue
+        entries.append((atime, entry['bytes'], entrydir, entry))
+    return entries
+
+def _evict(cachedir, maxbytes):
+    '''
+    Removes the least recently used entries until the total size is below maxbytes.
+    :returns total: int, total size of the remaining entries in bytes
+    '''
+    entries = sorted(_listEntries(cachedir), key = lambda item: item[0])
+    total = sum(item[1] for item in entries)
+    for atime, size, entrydir, entry in entries:
+        if total <= maxbytes:
+            break
+        shutil.rmtree(entrydir, ignore_errors = True)
+        total -= size
+    return total
+
+def _account(cachedir, size, maxbytes):
+    '''
+    Adds size bytes to the total size of the cache and evicts entries, once the total
+    exceeds maxbytes. The total is counted from the entries on disk once per process
+    (and after every eviction) and incremented by the stored entries in between, i.e.
+    entries stored by other processes are only counted after the next eviction.
+    '''
+    with _lock:
+        if cachedir not in _usage:
+            _usage[cachedir] = sum(item[1] for item in _listEntries(cachedir))
+        else:
+            _usage[cachedir] += size
+        if _usage[cachedir] > maxbytes:
+            _usage[cachedir] = _evict(cachedir, maxbytes)
+
+def _restore(entrydir, entry, outdir):
+    '''
+    Copies the files of a cache entry to outdir and marks the entry as recently used.
+    :returns restored: bool, False if any of the files is missing
+    '''
+    try:
+        for filename in entry['files']:
+            shutil.copyfile(os.path.join(entrydir, filename),
+                            os.path.join(outdir, filename))
+        os.utime(os.path.join(entrydir, _ENTRY_FILE))
+    except OSError:
+        return False
+    return True
+
+def _store(cachedir, key, func, outname, outdir, start):
+    '''
+    Copies the files written by the plot function (outname.fmt, modified after start)
+    to a new cache entry.
+    :returns size: int, size of the stored entry in bytes (0 if nothing was stored)
+    '''
+    files = []
+    for fmt in RENDER_CACHE_FORMATS:
+        filename = outname + '.' + fmt
+        path = os.path.join(outdir, filename)
+        if os.path.isfile(path) and os.path.getmtime(path) >= start:
+            files.append(filename)
+    if not files:
+        return 0
+    entrydir = os.path.join(cachedir, key)
+    # assemble the entry in a temporary directory and rename it, such that concurrent
+    # workers never see a partial entry
+    tmpdir = os.path.join(cachedir, '.{}.{}.tmp'.format(key, os.getpid()))
+    try:
+        os.makedirs(tmpdir, exist_ok = True)
+        size = 0
+        for filename in files:
+            shutil.copyfile(os.path.join(outdir, filename), os.path.join(tmpdir, filename))
+            size += os.path.getsize(os.path.join(tmpdir, filename))
+        entry = {'function': '{}.{}'.format(func.__module__, func.__qualname__),
+                 'outname': outname, 'files': files, 'bytes': size}
+        with open(os.path.join(tmpdir, _ENTRY_FILE), 'w') as fh:
+            json.dump(entry, fh, indent = 1)
+        os.rename(tmpdir, entrydir)
+    except OSError:
+        # e.g. the same entry has been stored by another worker in the meantime
+        shutil.rmtree(tmpdir, ignore_errors = True)
+        return 0
+    return size
+
+def render_cache(exclude = ('outdir',)):
+    '''
+    Decorator, which caches the output files of the decorated plot function.
+    The decorated function is expected to take the argument outdir and to return the
+    basename of its output files. Place it below use_style, such that the style
+    profile is part of the rcParams in effect.
+    :param exclude: names of arguments, which are not part of the cache key
+    '''
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _settings['enabled']:
+                return func(*args, **kwargs)
+            bound = _bind(func, args, kwargs)
+            try:
+                key = _getKey(func, bound, exclude)
+            except _Uncacheable:
+                return func(*args, **kwargs)
+            outdir = bound.arguments['outdir']
+            cachedir = _settings['cachedir']
+            entrydir = os.path.join(cachedir, key)
+
+            entry = _readEntry(entrydir)
+            if entry is not None and _restore(entrydir, entry, outdir):
+                with _lock:
+                    _stats['hits'] += 1
+                return entry['outname']
+
+            with _lock:
+                _stats['misses'] += 1
+            # (file systems with coarse timestamps)
+            start = time.time() - 1.0
+            outname = func(*args, **kwargs)
+            if isinstance(outname, str):
+                size = _store(cachedir, key, func, outname, outdir, start)
+                if size:
+                    _account(cachedir, size, _settings['maxbytes'])
+            return outname
+        return wrapper
+
+    return decorator
+
+def invalidate(func = None):
+    '''
+    Removes the cache entries of the plot function func, or all entries for func = None.
+    :returns removed: int, number of removed entries
+    '''
+    if func is not None:
+        func = inspect.unwrap(func)
+        name = '{}.{}'.format(func.__module__, func.__qualname__)
+    removed = 0
+    for atime, size, entrydir, entry in _listEntries(_settings['cachedir']):
+        if func is None or entry['function'] == name:
+            shutil.rmtree(entrydir, ignore_errors = True)
+            removed += 1
+    with _lock:
+        _usage.pop(_settings['cachedir'], None)
+    return removed
+
+def getRenderCacheInfo():
+    '''
+    :returns info: RenderCacheInfo (hits, misses, entries, bytes, maxbytes)
+    '''
+    entries = _listEntries(_settings['cachedir'])
+    with _lock:
+        return RenderCacheInfo(_stats['hits'], _stats['misses'], len(entries),
+                               sum(item[1] for item in entries), _settings['maxbytes'])
+
+def clearRenderCache():
+    '''
+    Removes all cache entries and resets the hit and miss counters.
+    '''
+    invalidate()
+    with _lock:
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,246 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: renderClient.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+Client of the render daemon (see renderDaemon.py).
+
+This module only uses the standard library, such that submitting a job takes a few
+milliseconds instead of the 1 - 2 s of importing matplotlib, pyplot and scipy and of
+resolving fonts, which every template script otherwise pays on its own.
+
+--- Example invocations ---
+Start the daemon once (e.g. in another terminal) by
+$python renderDaemon.py
+and then submit render jobs, which name a template script (relative to the repository
+root), one of its plot functions and the keyword arguments as JSON, e.g.
+$python renderClient.py mpl_imshow_AB_panel/mpl_imshow_AB_panel.py plot_AB_panel \\
+    --kwargs '{"data": [{"__npy__": "A.npy"}, {"__npy__": "B.npy"}], ...}'
+where the outputs are written to --outdir (defaults to the current directory). Numpy
+arrays are passed as {"__ndarray__": nested list, "dtype": "float64"}, as
+{"__npy__": path of a .npy file} or as {"__call__": "module.function", "args": [...]}
+(computed by the daemon, see batchJobs.py). Several jobs are submitted from a JSON
+file holding one job dict (with the keys template, function and kwargs) or a list of
+job dicts by
+$python renderClient.py --jobs jobs.json
+-------------------------------------------------------------------------------
+$python renderClient.py --ping
+$python renderClient.py --shutdown
+-------------------------------------------------------------------------------
+From python, jobs are submitted using
+    ##############################################
+    from renderClient import submit
+    # other code ...
+    responses = submit([{'template': 'mpl_imshow_template/mpl_imshow_template.py',
+                         'function': 'plot_image',
+                         'kwargs': {'img': img, ..., 'outdir': outdir}}])
+    # other code ...
+    ##############################################
+where numpy arrays are encoded automatically. Every response is a dict with the keys
+ok (bool), result (the return value of the plot function) and seconds (render time),
+or error and traceback for failed jobs.
+'''
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import subprocess
+
+# environment variable overriding the default socket path
+RENDER_DAEMON_SOCKET_ENV = 'MPL_RENDER_DAEMON_SOCKET'
+
+def getDefaultSocket():
+    '''
+    Returns the default socket path, which lies in $XDG_RUNTIME_DIR (if set) or in a
+    private directory of the user within the temporary directory (created with mode
+    0700 by the daemon, see renderDaemon.makeSocketDir).
+    '''
+    runtimedir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtimedir and os.path.isdir(runtimedir):
+        return os.path.join(runtimedir, 'mpl-render-daemon.sock')
+    return os.path.join(tempfile.gettempdir(),
+                        'mpl-render-daemon-{}'.format(getattr(os, 'getuid', lambda: 0)()),
+                        'daemon.sock')
+
+RENDER_DAEMON_SOCKET = os.environ.get(RENDER_DAEMON_SOCKET_ENV) or getDefaultSocket()
+
+REPODIR = os.path.dirname(os.path.abspath(__file__))
+
+def _encode(obj):
+    '''
+    JSON encoding of numpy arrays and scalars (without importing numpy).
+    '''
+    if hasattr(obj, 'tolist') and hasattr(obj, 'dtype'):
+        if getattr(obj, 'ndim', 0) == 0:
+            return obj.item()
+        return {'__ndarray__': obj.tolist(), 'dtype': str(obj.dtype)}
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError("Object of type {} is not JSON serializable.".format(
+                    type(obj).__name__))
+
+def encodeMessage(message):
+    return (json.dumps(message, default = _encode) + '\n').encode('utf-8')
+
+def decodeMessage(line):
+    return json.loads(line.decode('utf-8'))
+
+def checkOwner(path):
+    '''
+    Raises a PermissionError, if path is not owned by the current user (such that jobs
+    are never sent to a daemon of another user).
+    '''
+    if hasattr(os, 'getuid') and os.stat(path).st_uid != os.getuid():
+        raise PermissionError("{} is not owned by the current user.".format(path))
+
+def connect(socketPath = RENDER_DAEMON_SOCKET, timeout = None):
+    '''
+    :returns sock: socket connected to the render daemon
+    :raises PermissionError: if the socket is not owned by the current user
+    '''
+    checkOwner(socketPath)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socketPath)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+def request(messages, socketPath = RENDER_DAEMON_SOCKET, timeout = None):
+    '''
+    Sends the messages over one connection and returns the responses in order.
+    '''
+    messages = list(messages)
+    with connect(socketPath, timeout) as sock:
+        sock.sendall(b''.join(encodeMessage(message) for message in messages))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as fh:
+            responses = [decodeMessage(line) for line in fh]
+    if len(responses) != len(messages):
+        raise ConnectionError("The render daemon answered {} of {} requests.".format(
+                              len(responses), len(messages)))
+    return responses
+
+def submit(jobs, socketPath = RENDER_DAEMON_SOCKET, timeout = None, cwd = None):
+    '''
+    Submits render jobs to the daemon.
+    :param jobs: sequence of dicts with the keys template (path of the template script,
+        relative to the repository root), function (name of its plot function) and
+        kwargs (dict of keyword arguments). A relative kwargs['outdir'] is relative to cwd
+        and relative __npy__ paths are relative to job['basedir'] (defaults to cwd).
+    :param cwd: string, directory of relative output directories. Defaults to
+        os.getcwd().
+    :returns responses: list of response dicts in the order of jobs
+    '''
+    cwd = os.path.abspath(cwd or os.getcwd())
+    messages = [dict(job, command = 'render', cwd = job.get('cwd', cwd)) for job in jobs]
+    return request(messages, socketPath, timeout)
+
+def ping(socketPath = RENDER_DAEMON_SOCKET, timeout = 5.0):
+    '''
+    :returns status: dict of the daemon status (pid, uptime, jobs, rss, ...) or None if
+        no daemon is listening on socketPath
+    '''
+    try:
+        return request([{'command': 'ping'}], socketPath, timeout)[0]
+    except (OSError, ValueError):
+        return None
+
+def shutdown(socketPath = RENDER_DAEMON_SOCKET, timeout = 5.0):
+    return request([{'command': 'shutdown'}], socketPath, timeout)[0]
+
+def start_daemon(socketPath = RENDER_DAEMON_SOCKET, timeout = 60.0):
+    '''
+    Starts the render daemon in the background (unless it is already running) and
+    waits until it accepts connections.
+    :returns status: dict, see ping
+    '''
+    status = ping(socketPath)
+    if status is not None:
+        return status
+    subprocess.Popen([sys.executable, os.path.join(REPODIR, 'renderDaemon.py'),
+                      '--socket', socketPath],
+                     stdin = subprocess.DEVNULL, stdout = subprocess.DEVNULL,
+                     stderr = subprocess.DEVNULL, start_new_session = True)
+    stop = time.time() + timeout
+    while time.time() < stop:
+        time.sleep(0.1)
+        status = ping(socketPath)
+        if status is not None:
+            return status
+    raise TimeoutError("The render daemon did not start within {} s.".format(timeout))
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Render daemon client.')
+    parser.add_argument('template', nargs = '?',
+                        help = 'template script, relative to the repository root')
+    parser.add_argument('function', nargs = '?', help = 'plot function of the template')
+    parser.add_argument('--kwargs', default = '{}',
+                        help = 'keyword arguments of the plot function as JSON')
+    parser.add_argument('--outdir', default = None,
+                        help = 'output directory (default: current directory)')
+    parser.add_argument('--jobs', default = None,
+                        help = 'JSON file of one job or a list of jobs')
+    parser.add_argument('--socket', default = RENDER_DAEMON_SOCKET,
+                        help = 'socket of the daemon (default: %(default)s)')
+    parser.add_argument('--start', action = 'store_true',
+                        help = 'start the daemon, unless it is running')
+    parser.add_argument('--ping', action = 'store_true', help = 'print the daemon status')
+    parser.add_argument('--shutdown', action = 'store_true', help = 'stop the daemon')
+    args = parser.parse_args()
+
+    if args.start:
+        print(json.dumps(start_daemon(args.socket)))
+    if args.ping or args.shutdown:
+        status = ping(args.socket) if args.ping else shutdown(args.socket)
+        print(json.dumps(status))
+        sys.exit(0 if status is not None else 1)
+
+    if args.jobs is not None:
+        with open(args.jobs, 'r') as fh:
+            jobs = json.load(fh)
+        if isinstance(jobs, dict):
+            jobs = [jobs]
+    elif args.template is not None and args.function is not None:
+        jobs = [{'template': args.template, 'function': args.function,
+                 'kwargs': json.loads(args.kwargs)}]
+    elif args.start:
+        sys.exit(0)
+    else:
+        parser.error('either template and function or --jobs are required')
+
+    for job in jobs:
+        kwargs = job.setdefault('kwargs', {})
+        if args.outdir is not None or 'outdir' not in kwargs:
+            kwargs['outdir'] = args.outdir or os.getcwd()
+
+    try:
+        responses = submit(jobs, args.socket)
+    except OSError as exc:
+        print("No render daemon at {} ({}), start it by python renderDaemon.py".format(
+              args.socket, exc))
+        sys.exit(2)
+
+    failed = 0
+    for job, response in zip(jobs, responses):
+        if response['ok']:
+            print("{} {:.3f} s".format(response['result'], response['seconds']))
+        else:
+            failed += 1
+            print("{}.{} failed ({})".format(job['template'], job['function'],
+                                             response['error']))
+            print(response.get('traceback', ''))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,295 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: renderDaemon.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Long lived local render server for the template plot functions.
+
+Every template run as python script.py first imports matplotlib, pyplot, numpy and
+scipy and resolves its fonts, which takes 1 - 2 s and often longer than rendering a
+small panel. The render daemon pays these costs once: it preloads the shared modules
+(RENDER_DAEMON_PRELOAD), draws and saves a small warm up figure for every style
+profile of mplStyles (resolving the fonts of all formats) and then serves render jobs
+on a Unix socket, one JSON object per line. A job names a template script (relative
+to the repository root), one of its plot functions and the keyword arguments, such
+that the latency per figure drops to its draw and save time:
+
+--- Example invocations ---
+$python renderDaemon.py
+$python renderDaemon.py --socket /tmp/render.sock --preload \\
+    mpl_imshow_template/mpl_imshow_template.py
+Jobs are submitted by the client, see renderClient.py:
+$python renderClient.py mpl_imshow_template/mpl_imshow_template.py plot_image \\
+    --kwargs '{...}' --outdir out
+-------------------------------------------------------------------------------
+
+The templates are imported on their first job and imported again, when the script has
+been modified since (see templateBenchmarks.loadTemplate). Jobs are rendered one after
+the other (pyplot is not thread safe) within a fresh rcParams context, where all
+figures are closed afterwards, such that a job can not leak its settings or figures
+into the following jobs. Only scripts within the repository are served and the socket
+is only accessible by its owner. By default, it lies in $XDG_RUNTIME_DIR or in a
+private directory of the user (see renderClient.getDefaultSocket) and the client only
+connects to sockets owned by the current user.
+The keyword arguments are evaluated by the daemon (see batchJobs.evaluateArguments),
+i.e. {"__npy__": path} and {"__call__": ...} inputs are loaded respectively computed
+in the daemon and never transferred through the socket.
+'''
+
+import os
+import io
+import time
+import signal
+import argparse
+import importlib
+import threading
+import traceback
+import socketserver
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+from renderClient import RENDER_DAEMON_SOCKET
+from renderClient import connect
+from renderClient import encodeMessage
+from renderClient import decodeMessage
+from templateBenchmarks import REPODIR
+from templateBenchmarks import loadTemplate
+from batchJobs import evaluateArguments
+from memoryGuard import getRSS
+from mplStyles import STYLES
+from mplStyles import style_context
+
+# shared modules imported at start up (optional ones are skipped if unavailable)
+RENDER_DAEMON_PRELOAD = ('scipy.stats', 'mplUtils', 'figureExport', 'renderCache',
+                         'colormapSweep', 'binnedHistograms', 'pointAggregation',
+                         'sampleStore', 'syntheticFields', 'ticker', 'tickFormatters',
+                         'axisPadding')
+
+# formats written by the warm up figures
+RENDER_DAEMON_WARMUP_FORMATS = ('png', 'pdf', 'svg')
+
+def preload(modules = RENDER_DAEMON_PRELOAD):
+    '''
+    Imports the modules.
+    :returns missing: list of the modules, which could not be imported
+    '''
+    missing = []
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            missing.append(module)
+    return missing
+
+def warm_up(formats = RENDER_DAEMON_WARMUP_FORMATS):
+    '''
+    Draws and saves a figure with tick labels, text and mathtext for every style profile,
+    which resolves and loads the fonts of the styles for all formats.
+    '''
+    for name in STYLES:
+        with style_context(name):
+            f, ax1 = plt.subplots(1, figsize = (2.0, 2.0))
+            ax1.plot([0.0, 1.0], [0.0, 1.0], label = r'label')
+            ax1.set_xlabel(r'$x$ label')
+            ax1.set_ylabel(r'$\mu_1 = 1.0$')
+            ax1.legend()
+            for fmt in formats:
+                f.savefig(io.BytesIO(), format = fmt)
+            plt.close(f)
+
+def makeSocketDir(socketPath):
+    '''
+    Creates the directory of the socket (with mode 0700), unless it exists.
+    :raises PermissionError: if the directory is owned by another user and not sticky
+        (such as /tmp), i.e. if it could be used to intercept the jobs
+    '''
+    directory = os.path.dirname(os.path.abspath(socketPath))
+    os.makedirs(directory, mode = 0o700, exist_ok = True)
+    stat = os.stat(directory)
+    if hasattr(os, 'getuid') and stat.st_uid != os.getuid() and \
+       not stat.st_mode & 0o1000:
+        raise PermissionError("The socket directory {} is not owned by the current "
+                              "user.".format(directory))
+
+def _removeStaleSocket(socketPath):
+    if not os.path.exists(socketPath):
+        return
+    try:
+        connect(socketPath, timeout = 1.0).close()
+    except OSError:
+        os.remove(socketPath)
+        return
+    raise RuntimeError("A render daemon is already listening on {}.".format(socketPath))
+
+def _terminate(signum, frame):
+    raise KeyboardInterrupt
+
+class _RenderHandler(socketserver.StreamRequestHandler):
+    '''
+    Answers every request line of a connection by one response line.
+    '''
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                message = decodeMessage(line)
+            except ValueError as exc:
+                message = {}
+                response = {'ok': False, 'error': 'invalid request ({})'.format(exc)}
+            else:
+                response = self.server.handle_message(message)
+            self.wfile.write(encodeMessage(response))
+            self.wfile.flush()
+            if message.get('command') == 'shutdown':
+                threading.Thread(target = self.server.shutdown).start()
+                return
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    '''
+    Render server listening on socketPath (connections are accepted concurrently,
+    while the jobs are rendered one after the other).
+    :param socketPath: string, path of the Unix socket
+    :param roots: sequence of directories, whose template scripts are served
+    :param templates: sequence of template scripts, which are imported at start up
+    :param verbose: bool, if True, every job is printed
+    '''
+    daemon_threads = True
+
+    def __init__(self, socketPath = RENDER_DAEMON_SOCKET, roots = (REPODIR,),
+                 templates = (), verbose = False):
+        self.socketPath = socketPath
+        self.roots = [os.path.realpath(root) for root in roots]
+        self.verbose = verbose
+        self.started = time.time()
+        self.jobs = 0
+        self.failed = 0
+        self.missing = preload()
+        warm_up()
+        for template in templates:
+            loadTemplate(self.resolveTemplate(template))
+        self._renderLock = threading.Lock()
+
+        makeSocketDir(socketPath)
+        _removeStaleSocket(socketPath)
+        umask = os.umask(0o177)
+        try:
+            socketserver.UnixStreamServer.__init__(self, socketPath, _RenderHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.socketPath):
+            os.remove(self.socketPath)
+
+    def resolveTemplate(self, template):
+        '''
+        Returns the absolute path of the template script (relative to the repository
+        root), if it lies within one of the served roots.
+        '''
+        path = os.path.realpath(os.path.join(REPODIR, template))
+        if not path.endswith('.py') or \
+           not any(path.startswith(root + os.sep) for root in self.roots):
+            raise ValueError("The template {} is not served.".format(template))
+        return path
+
+    def loadScript(self, path):
+        '''
+        Imports the served script path (see resolveTemplate and
+        templateBenchmarks.loadTemplate).
+        '''
+        return loadTemplate(self.resolveTemplate(path))
+
+    def getStatus(self):
+        return {'ok': True,
+                'pid': os.getpid(),
+                'uptime': time.time() - self.started,
+                'jobs': self.jobs,
+                'failed': self.failed,
+                'rss': getRSS(),
+                'matplotlib': mpl.__version__,
+                'missing': self.missing}
+
+    def handle_message(self, message):
+        command = message.get('command', 'render')
+        if command == 'render':
+            return self.render(message)
+        if command == 'ping':
+            return self.getStatus()
+        if command == 'shutdown':
+            return {'ok': True, 'pid': os.getpid()}
+        return {'ok': False, 'error': "unknown command '{}'".format(command)}
+
+    def render(self, job):
+        '''
+        Renders one job (see renderClient.submit).
+        :returns response: dict with the keys ok, result and seconds, or ok, error and
+            traceback for a failed job
+        '''
+        start = time.perf_counter()
+        try:
+            path = self.resolveTemplate(job['template'])
+            cwd = job.get('cwd', os.getcwd())
+            with self._renderLock:
+                kwargs = evaluateArguments(job.get('kwargs', {}), job.get('basedir', cwd),
+                                           loadScript = self.loadScript)
+                if 'outdir' in kwargs:
+                    kwargs['outdir'] = os.path.join(cwd, kwargs['outdir'])
+                func = getattr(loadTemplate(path), job['function'])
+                with mpl.rc_context():
+                    try:
+                        result = func(**kwargs)
+                    finally:
+                        plt.close('all')
+        except (Exception, SystemExit) as exc:
+            return self._getError(job, exc)
+        try:
+            encodeMessage(result)
+        except (TypeError, ValueError):
+            result = repr(result)
+        seconds = time.perf_counter() - start
+        self.jobs += 1
+        if self.verbose:
+            print("{}.{} -> {} ({:.3f} s)".format(job['template'], job['function'],
+                                                  result, seconds))
+        return {'ok': True, 'result': result, 'seconds': seconds}
+
+    def _getError(self, job, exc):
+        self.failed += 1
+        if self.verbose:
+            print("{}.{} failed ({}: {})".format(job.get('template'), job.get('function'),
+                                                type(exc).__name__, exc))
+        return {'ok': False,
+                'error': '{}: {}'.format(type(exc).__name__, exc),
+                'traceback': traceback.format_exc()}
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description = 'Render daemon of the templates.')
+    parser.add_argument('--socket', default = RENDER_DAEMON_SOCKET,
+                        help = 'path of the Unix socket (default: %(default)s)')
+    parser.add_argument('--preload', nargs = '+', default = (),
+                        help = 'template scripts imported at start up')
+    parser.add_argument('--verbose', action = 'store_true', help = 'print every job')
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, _terminate)
+    start = time.perf_counter()
+    server = RenderServer(args.socket, templates = args.preload, verbose = args.verbose)
+    print("Render daemon {} listening on {} (started in {:.2f} s)".format(
+          os.getpid(), args.socket, time.perf_counter() - start))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,366 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: renderTrace.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Opt-in per-stage instrumentation of the template plot functions.
+
+A slow plot function call (e.g. plot_pcolor) can be spent anywhere between the rcParams
+setup, the figure and axes creation, the tick configuration, the artists (pcolormesh,
+imshow, ...), the colorbar creation and savefig. With the trace enabled, every stage
+is recorded with its wall time, its self time (without nested stages), the CPU time of
+its thread and the net number of allocated memory blocks (sys.getallocatedblocks, and
+optionally the net traced bytes using tracemalloc). The trace is written as Chrome
+trace event file, which is opened by chrome://tracing, https://ui.perfetto.dev or
+https://www.speedscope.app:
+    ##############################################
+    from renderTrace import render_trace
+    from renderTrace import getStageSummary
+    from renderTrace import formatStageSummary
+    # other code ...
+    with render_trace('plot_pcolor.trace.json') as trace:
+        plot_pcolor(X, Y, Z, ...)
+    print(formatStageSummary(getStageSummary(trace.events)))
+    # other code ...
+    ##############################################
+While enabled, the matplotlib entry points listed in MATPLOTLIB_STAGES (rcParams
+assignments, figure and axes creation, locators and formatters, plotting methods,
+legends, colorbars, draw and savefig) are recorded automatically, i.e. the stages of
+every template are tagged without modifying it. The plot functions themselves and
+further stages are tagged using
+    ##############################################
+    from renderTrace import traced
+    from renderTrace import trace_stage
+    # other code ...
+    @traced()
+    @use_style('pcolor')
+    def plot_pcolor(...):
+        ...
+        with trace_stage('ticks'):
+            ...
+    ##############################################
+The trace is disabled by default. Then the matplotlib entry points are not patched,
+trace_stage returns a shared no-op context and traced only adds a single check per
+call. It is enabled by calling enable() (or using render_trace) or for the whole
+process by setting the environment variable MPL_RENDER_TRACE to the output path of the
+trace, which is then written at exit, e.g.
+$MPL_RENDER_TRACE=trace.json python mpl_imshow_template.py
+Processes sharing this variable (e.g. the workers of parallelSweep.run_sweep) should
+use a path containing {pid}, which is replaced by the process id.
+'''
+
+import os
+import sys
+import json
+import time
+import atexit
+import importlib
+import threading
+import tracemalloc
+from functools import wraps
+from contextlib import nullcontext
+from contextlib import contextmanager
+from collections import namedtuple
+from collections import OrderedDict
+
+from atomicWrite import atomic_write
+
+# environment variable holding the output path of the process wide trace
+RENDER_TRACE_ENV = 'MPL_RENDER_TRACE'
+
+# matplotlib entry points, which are recorded as stages while the trace is enabled, as
+# (module, class or None for module functions, attribute, stage name, category)
+_AXES_METHODS = ('plot', 'scatter', 'errorbar', 'fill_between', 'fill_betweenx', 'bar',
+                 'hist', 'stairs', 'boxplot', 'imshow', 'pcolor', 'pcolormesh',
+                 'contour', 'contourf', 'quiver')
+_AXIS_METHODS = ('set_major_locator', 'set_minor_locator', 'set_major_formatter',
+                 'set_minor_formatter', 'set_ticks', 'set_ticklabels', 'set_tick_params')
+MATPLOTLIB_STAGES = (
+    (('matplotlib', 'RcParams', '__setitem__', 'rcParams', 'style'),
+     ('matplotlib.pyplot', None, 'figure', 'figure', 'figure'),
+     ('matplotlib.figure', 'FigureBase', 'add_subplot', 'axes', 'figure'),
+     ('matplotlib.figure', 'FigureBase', 'add_axes', 'axes', 'figure')) +
+    tuple(('matplotlib.axis', 'Axis', method, 'ticks', 'ticks')
+          for method in _AXIS_METHODS) +
+    tuple(('matplotlib.axes', 'Axes', method, method, 'artists')
+          for method in _AXES_METHODS) +
+    (('matplotlib.axes', 'Axes', 'legend', 'legend', 'artists'),
+     ('matplotlib.figure', 'FigureBase', 'colorbar', 'colorbar', 'colorbar'),
+     ('matplotlib.colorbar', 'Colorbar', '__init__', 'colorbar', 'colorbar'),
+     ('matplotlib.figure', 'Figure', 'draw', 'draw', 'save'),
+     ('matplotlib.figure', 'Figure', 'savefig', 'savefig', 'save'))
+)
+
+# times in nanoseconds, blocks and bytes are net changes (bytes is None without
+# tracemalloc), tid is the native thread id
+TraceEvent = namedtuple('TraceEvent', ['name', 'category', 'start', 'wall', 'self',
+                                       'cpu', 'blocks', 'bytes', 'tid'])
+
+# aggregated times in seconds
+StageSummary = namedtuple('StageSummary', ['name', 'calls', 'wall', 'self', 'cpu',
+                                           'blocks'])
+
+_NULL_STAGE = nullcontext()
+
+_trace = None
+_lock = threading.Lock()
+_patches = []
+
+class _Trace:
+    '''
+    Events of one enabled trace.
+    '''
+
+    def __init__(self, memory, startedMalloc = False):
+        self.memory = memory
+        # (True if tracemalloc was started by enable and is hence stopped by disable)
+        self.startedMalloc = startedMalloc
+        self.events = []
+        self._local = threading.local()
+
+    def getStack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+class _Stage:
+    '''
+    Context of one recorded stage (the stages of a thread are properly nested).
+    '''
+    __slots__ = ('trace', 'name', 'category', 'start', 'cpu', 'blocks', 'bytes',
+                 'children')
+
+    def __init__(self, trace, name, category):
+        self.trace = trace
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.trace.getStack().append(self)
+        self.children = 0
+        self.bytes = tracemalloc.get_traced_memory()[0] if self.trace.memory else None
+        self.blocks = sys.getallocatedblocks()
+        self.cpu = time.thread_time_ns()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        stop = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self.cpu
+        blocks = sys.getallocatedblocks() - self.blocks
+        nbytes = tracemalloc.get_traced_memory()[0] - self.bytes \
+                 if self.bytes is not None else None
+        stack = self.trace.getStack()
+        stack.pop()
+        wall = stop - self.start
+        if stack:
+            stack[-1].children += wall
+        self.trace.events.append(TraceEvent(self.name, self.category, self.start, wall,
+                                            wall - self.children, cpu, blocks, nbytes,
+                                            threading.get_native_id()))
+        return False
+
+def trace_stage(name, category = 'template'):
+    '''
+    Context manager, which records the enclosed code as stage name (a no-op, while the
+    trace is disabled).
+    :param name: string, stage name
+    :param category: string, category of the stage (e.g. 'ticks' or 'save')
+    '''
+    trace = _trace
+    if trace is None:
+        return _NULL_STAGE
+    return _Stage(trace, name, category)
+
+def _wrapStage(func, name, category):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        trace = _trace
+        if trace is None:
+            return func(*args, **kwargs)
+        with _Stage(trace, name, category):
+            return func(*args, **kwargs)
+    return wrapper
+
+def traced(name = None, category = 'template'):
+    '''
+    Decorator, which records every call of the decorated function as stage.
+    Place it above use_style, such that the style setup is part of the stage.
+    :param name: string, stage name. Defaults to the function name.
+    :param category: string, category of the stage
+    '''
+
+    def decorator(func):
+        return _wrapStage(func, func.__name__ if name is None else name, category)
+
+    return decorator
+
+def _instrument():
+    '''
+    Wraps the matplotlib entry points of MATPLOTLIB_STAGES.
+    '''
+    for modulename, classname, attribute, name, category in MATPLOTLIB_STAGES:
+        owner = importlib.import_module(modulename)
+        if classname is not None:
+            owner = getattr(owner, classname)
+        if classname is None:
+            original = owner.__dict__[attribute]
+        else:
+            # (patch the class defining the method, such that subclasses are covered)
+            definer = next(cls for cls in owner.__mro__ if attribute in cls.__dict__)
+            original, owner = definer.__dict__[attribute], definer
+        wrapper = _wrapStage(original, name, category)
+        setattr(owner, attribute, wrapper)
+        _patches.append((owner, attribute, original, wrapper))
+
+def _uninstrument():
+    while _patches:
+        owner, attribute, original, wrapper = _patches.pop()
+        # (unless patched again by someone else in the meantime, where the wrapper is
+        # left in place and simply passes through)
+        if owner.__dict__.get(attribute) is wrapper:
+            setattr(owner, attribute, original)
+
+def enable(memory = False):
+    '''
+    Starts a new trace for all threads of the process.
+    :param memory: bool, if True, the net allocated bytes are recorded using tracemalloc
+        (which slows down all allocations). tracemalloc is stopped by disable, unless it
+        was already running before.
+    '''
+    global _trace
+    with _lock:
+        startedMalloc = memory and not tracemalloc.is_tracing()
+        if startedMalloc:
+            tracemalloc.start()
+        if not _patches:
+            _instrument()
+        _trace = _Trace(memory, startedMalloc)
+
+def disable():
+    '''
+    Stops the trace.
+    :returns events: list of TraceEvent tuples of the stopped trace
+    '''
+    global _trace
+    with _lock:
+        trace, _trace = _trace, None
+        _uninstrument()
+        if trace is None:
+            return []
+        if trace.startedMalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return list(trace.events)
+
+def getTraceEvents():
+    '''
+    :returns events: list of TraceEvent tuples recorded so far by the active trace
+    '''
+    trace = _trace
+    return [] if trace is None else list(trace.events)
+
+@contextmanager
+def render_trace(path = None, memory = False):
+    '''
+    Scoped trace, which yields the trace (with its list of TraceEvents in trace.events)
+    and optionally writes it to path on exit.
+    :param path: string, output path of the Chrome trace file (see save_trace)
+    :param memory: bool, see enable
+    '''
+    enable(memory = memory)
+    trace = _trace
+    try:
+        yield trace
+    finally:
+        disable()
+        if path is not None:
+            save_trace(path, trace.events)
+
+def getChromeTrace(events):
+    '''
+    Converts the events to the Chrome trace event format (complete events with
+    timestamps in microseconds relative to the first event).
+    :returns trace: dict, which is serialized as JSON
+    '''
+    pid = os.getpid()
+    origin = min((event.start for event in events), default = 0)
+    traceEvents = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                    'args': {'name': os.path.basename(sys.argv[0]) or 'python'}}]
+    # (parents precede their nested stages of the same start time)
+    for event in sorted(events, key = lambda event: (event.start, -event.wall)):
+        args = {'self_ms': event.self / 1.0e6,
+                'cpu_ms': event.cpu / 1.0e6,
+                'allocated_blocks': event.blocks}
+        if event.bytes is not None:
+            args['allocated_bytes'] = event.bytes
+        traceEvents.append({'name': event.name,
+                            'cat': event.category,
+                            'ph': 'X',
+                            'ts': (event.start - origin) / 1.0e3,
+                            'dur': event.wall / 1.0e3,
+                            'pid': pid,
+                            'tid': event.tid,
+                            'args': args})
+    return {'traceEvents': traceEvents, 'displayTimeUnit': 'ms'}
+
+def save_trace(path, events = None):
+    '''
+    Writes the events as Chrome trace file (opened by chrome://tracing, Perfetto or
+    speedscope).
+    :param path: string, output path, where {pid} is replaced by the process id
+    :param events: list of TraceEvents. Defaults to the events of the active trace.
+    :returns path: string, the written path
+    '''
+    if events is None:
+        events = getTraceEvents()
+    path = path.replace('{pid}', str(os.getpid()))
+    with atomic_write(path) as tmpfile:
+        with open(tmpfile, 'w') as fh:
+            json.dump(getChromeTrace(events), fh)
+    return path
+
+def getStageSummary(events = None):
+    '''
+    Aggregates the events per stage name.
+    :param events: list of TraceEvents. Defaults to the events of the active trace.
+    :returns summary: list of StageSummary tuples (name, calls, wall, self, cpu, blocks)
+        sorted by decreasing self time
+    '''
+    if events is None:
+        events = getTraceEvents()
+    totals = OrderedDict()
+    for event in events:
+        calls, wall, selfWall, cpu, blocks = totals.get(event.name, (0, 0, 0, 0, 0))
+        totals[event.name] = (calls + 1, wall + event.wall, selfWall + event.self,
+                              cpu + event.cpu, blocks + event.blocks)
+    summary = [StageSummary(name, calls, wall / 1.0e9, selfWall / 1.0e9, cpu / 1.0e9,
+                            blocks)
+               for name, (calls, wall, selfWall, cpu, blocks) in totals.items()]
+    return sorted(summary, key = lambda stage: -stage.self)
+
+def formatStageSummary(summary):
+    lines = ['{:<24s} {:>6s} {:>10s} {:>10s} {:>10s} {:>10s}'.format(
+             'stage', 'calls', 'wall [s]', 'self [s]', 'cpu [s]', 'blocks')]
+    for stage in summary:
+        lines.append('{:<24s} {:>6d} {:>10.4f} {:>10.4f} {:>10.4f} {:>10d}'.format(*stage))
+    return '\n'.join(lines)
+
+def _saveAtExit(path):
+    events = disable()
+    if events:
+        save_trace(path, events)
+
+if os.environ.get(RENDER_TRACE_ENV, ''):
+    enable()
+    atexit.register(_saveAtExit, os.environ[RENDER_TRACE_ENV])
+
+if __name__ == '__main__':
+
+    pass
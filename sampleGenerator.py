@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: sampleGenerator.py
+# tested with python 3.11.7 in conjunction with numpy 2.4.6
+##########################################################################################
+
+'''
+Chunked, parallel and reproducible generation of large random sample sets.
+
+Drawing all samples at once through the legacy global np.random state requires the
+whole sample set in memory and uses a single core. Here the samples are split into
+chunks of fixed size, where every chunk is drawn by its own np.random.Generator,
+seeded by the chunk's child of np.random.SeedSequence(seed).spawn(...). The chunks are
+drawn in worker processes (see parallelSweep.run_sweep) and written straight into a
+memory mapped .npy file (see sampleStore.create_samples_file):
+    ##############################################
+    from sampleGenerator import generate_samples
+    from sampleGenerator import correlatedNormalChunk
+    # other code ...
+    generate_samples(os.path.join(RAWDIR, 'GaussianSamples'), 10 ** 8,
+                     correlatedNormalChunk, seed = 987654321,
+                     params = {'mu1': 87.25, 'sigma1': 8.124,
+                               'mu2': 125.75, 'sigma2': 11.25})
+    # other code ...
+    ##############################################
+Since the chunk boundaries and the chunk seeds only depend on seed and chunksize, the
+generated samples are bit-identical for any number of worker processes.
+The chunk samplers are module level functions sampler(rng, n, **params), which return
+an array of shape (n, n_dims).
+'''
+
+import numpy as np
+from scipy.special import ndtri
+
+from sampleStore import create_samples_file
+from sampleStore import load_samples
+from parallelSweep import run_sweep
+
+# number of samples per chunk (i.e. per generator)
+SAMPLER_CHUNK_SIZE = 1000000
+
+def correlatedNormalChunk(rng, n, mu1, sigma1, mu2, sigma2):
+    '''
+    Fully correlated normal samples (x1, x2) by inverse transform sampling, where both
+    components are derived from the same uniform random number.
+    '''
+    z = ndtri(rng.random(n))
+    samples = np.empty((n, 2))
+    samples[:, 0] = mu1 + sigma1 * z
+    samples[:, 1] = mu2 + sigma2 * z
+    return samples
+
+def independentNormalChunk(rng, n, mu1, sigma1, mu2, sigma2):
+    '''
+    Independent normal samples (x1, x2).
+    '''
+    samples = np.empty((n, 2))
+    samples[:, 0] = rng.normal(loc = mu1, scale = sigma1, size = n)
+    samples[:, 1] = rng.normal(loc = mu2, scale = sigma2, size = n)
+    return samples
+
+def getChunkBounds(n_samples, chunksize = SAMPLER_CHUNK_SIZE):
+    '''
+    Returns the list of (start, stop) sample index ranges of all chunks.
+    '''
+    return [(start, min(start + chunksize, n_samples))
+            for start in range(0, n_samples, chunksize)]
+
+def _fillChunk(path, start, stop, seedSequence, sampler, params):
+    '''
+    Draws the samples [start, stop) and writes them into the .npy file path.
+    '''
+    rng = np.random.Generator(np.random.PCG64(seedSequence))
+    samples = load_samples(path, mmap_mode = 'r+')
+    samples[start:stop] = sampler(rng, stop - start, **params).reshape(
+        samples[start:stop].shape)
+    samples.flush()
+    return stop - start
+
+def generate_samples(basename, n_samples, sampler, seed, n_dims = 2, params = None,
+                     chunksize = SAMPLER_CHUNK_SIZE, n_workers = None):
+    '''
+    Draws n_samples samples using sampler and stores them in basename.npy.
+    :param basename: string, output path without file extension
+    :param n_samples: int, number of samples
+    :param sampler: module level function sampler(rng, n, **params)
+    :param seed: int, root seed of all chunk generators
+    :param n_dims: int, number of components per sample (use 1 for 1d samples)
+    :param params: dict of keyword arguments of sampler
+    :param chunksize: int, number of samples per chunk
+    :param n_workers: int, number of worker processes (see run_sweep)
+    :returns path: string, path of the written .npy file
+    '''
+    shape = (n_samples,) if n_dims == 1 else (n_samples, n_dims)
+    samples = create_samples_file(basename, shape)
+    path = samples.filename
+    del samples
+
+    bounds = getChunkBounds(n_samples, chunksize)
+    seedSequences = np.random.SeedSequence(seed).spawn(len(bounds))
+    jobs = [(_fillChunk, {'path': path, 'start': start, 'stop': stop,
+                          'seedSequence': seedSequence, 'sampler': sampler,
+                          'params': params or {}})
+            for (start, stop), seedSequence in zip(bounds, seedSequences)]
+    run_sweep(jobs, n_workers = n_workers)
+    return path
+
+if __name__ == '__main__':
+
+    pass
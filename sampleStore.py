@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: sampleStore.py
+# tested with python 3.11.7 in conjunction with numpy 2.4.6
+##########################################################################################
+
+'''
+Binary storage of the random samples used by the template scripts.
+
+The sample producers (create_samples.py) used to write their samples as '%.8f' text
+files, which are read back by np.genfromtxt. Parsing text is by far the slowest part of
+the corresponding templates once the number of samples grows. Here the samples are
+stored in numpy's binary .npy format instead, which is loaded as a read-only memory
+map, i.e. without parsing and without copying the data into memory:
+    ##############################################
+    from sampleStore import save_samples
+    from sampleStore import load_samples
+    # other code ...
+    save_samples(os.path.join(RAWDIR, 'GaussianSamples'), samples)
+    # other code ...
+    X = load_samples(os.path.join(RAWDIR, 'GaussianSamples'))
+    # other code ...
+    ##############################################
+The basename is given without file extension. load_samples picks the first existing
+file of the formats .npy, .npz and .txt, such that previously created text files still
+load (and are converted to .npy on first use with convert = True).
+Very large sample sets, which do not fit into memory, are written block by block into
+a memory map created by create_samples_file, and are processed block by block using
+iter_sample_chunks.
+'''
+
+import os
+import numpy as np
+
+from atomicWrite import atomic_write
+
+SAMPLE_FORMATS = ('npy', 'npz', 'txt')
+
+# number of samples per chunk of the .npz format and of iter_sample_chunks
+SAMPLE_CHUNK_SIZE = 1000000
+
+# format of the (legacy) text files
+TXT_FORMAT = '%.8f'
+
+def _chunkKey(k):
+    return 'chunk_{:05d}'.format(k)
+
+def _splitExtension(basename):
+    root, ext = os.path.splitext(basename)
+    if ext.lstrip('.') in SAMPLE_FORMATS:
+        return root, ext.lstrip('.')
+    return basename, None
+
+def getSamplesFile(basename):
+    '''
+    Returns the path of the stored samples basename, i.e. basename.npy, basename.npz or
+    basename.txt (in this order of preference), or the path itself, if basename already
+    carries one of these extensions.
+    :raises FileNotFoundError: if none of these files exists
+    '''
+    root, fmt = _splitExtension(basename)
+    candidates = [basename] if fmt else [root + '.' + fmt for fmt in SAMPLE_FORMATS]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError("No samples file found for '{}'.".format(basename))
+
+def save_samples(basename, samples, fmt = 'npy', chunksize = SAMPLE_CHUNK_SIZE):
+    '''
+    Writes the samples to basename + '.' + fmt.
+    :param basename: string, output path without file extension
+    :param samples: numpy ndarray of shape (n_samples,) or (n_samples, n_dims)
+    :param fmt: string, 'npy' (memory mappable), 'npz' (chunks of chunksize samples) or
+        'txt' (text, fmt TXT_FORMAT)
+    :param chunksize: int, number of samples per chunk of the npz format
+    :returns path: string, path of the written file
+    '''
+    if fmt not in SAMPLE_FORMATS:
+        raise ValueError("Unsupported sample format '{}' encountered.".format(fmt))
+    samples = np.asarray(samples)
+    path = basename + '.' + fmt
+    # write and rename, such that readers never load a partially written file
+    with atomic_write(path) as tmpfile:
+        if fmt == 'npy':
+            np.save(tmpfile, samples)
+        elif fmt == 'npz':
+            chunks = {_chunkKey(k): samples[start:start + chunksize]
+                      for k, start in enumerate(range(0, max(len(samples), 1),
+                                                      chunksize))}
+            np.savez(tmpfile, **chunks)
+        else:
+            np.savetxt(tmpfile, samples, fmt = TXT_FORMAT)
+    return path
+
+def create_samples_file(basename, shape, dtype = np.float64):
+    '''
+    Creates basename.npy for the given shape and dtype and returns it as writable
+    memory map, which is filled block by block by the caller (call flush() when done).
+    '''
+    return np.lib.format.open_memmap(basename + '.npy', mode = 'w+', dtype = dtype,
+                                     shape = shape)
+
+def load_samples(basename, mmap_mode = 'r', convert = False):
+    '''
+    Loads the samples stored at basename (see getSamplesFile).
+    :param mmap_mode: memory map mode of .npy files, 'r' returns a read-only view of
+        the file without copying, None loads the data into memory
+    :param convert: bool, if True, samples loaded from a text file are stored as .npy
+        next to it, such that subsequent loads are memory mapped
+    :returns samples: numpy ndarray
+    '''
+    path = getSamplesFile(basename)
+    root, fmt = _splitExtension(path)
+    if fmt == 'npy':
+        return np.load(path, mmap_mode = mmap_mode)
+    if fmt == 'npz':
+        with np.load(path) as data:
+            keys = sorted(data.files)
+            return np.concatenate([data[key] for key in keys]) if keys else np.empty(0)
+    samples = np.loadtxt(path)
+    if convert:
+        save_samples(root, samples, fmt = 'npy')
+        if mmap_mode is not None:
+            return np.load(root + '.npy', mmap_mode = mmap_mode)
+    return samples
+
+def iter_sample_chunks(basename, chunksize = SAMPLE_CHUNK_SIZE):
+    '''
+    Yields the stored samples in consecutive blocks of (at most) chunksize samples,
+    where the blocks of .npy files are views of the memory map.
+    '''
+    path = getSamplesFile(basename)
+    root, fmt = _splitExtension(path)
+    if fmt == 'npz':
+        with np.load(path) as data:
+            for key in sorted(data.files):
+                chunk = data[key]
+                for start in range(0, len(chunk), chunksize):
+                    yield chunk[start:start + chunksize]
+        return
+    samples = load_samples(path)
+    for start in range(0, len(samples), chunksize):
+        yield samples[start:start + chunksize]
+
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: syntheticFields.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+Synthetic 2d test fields (ramps, Gaussians, separable products and random fields)
+for the pcolormesh, imshow and heatmap templates.
+
+All fields are built by broadcasting the 1d axis arrays against each other instead of
+filling the matrix element by element in nested python loops.
+The indexing keyword follows the np.meshgrid convention:
+    indexing = 'ij' (default) returns Z with Z.shape == (len(xVals), len(yVals)),
+        i.e. the first array dimension corresponds to the x axis and the second array
+        dimension corresponds to the y axis (as used by the pcolormesh templates).
+    indexing = 'xy' returns Z with Z.shape == (len(yVals), len(xVals)),
+        i.e. the rows correspond to the y axis (as used by the heatmap templates).
+'''
+
+import numpy as np
+
+def _getAxisGrids(xVals, yVals, indexing = 'ij'):
+    '''
+    Returns the open (broadcastable) grids of the x and y axis values.
+    '''
+    xVals = np.asarray(xVals, dtype = float)
+    yVals = np.asarray(yVals, dtype = float)
+    if indexing == 'ij':
+        return xVals[:, np.newaxis], yVals[np.newaxis, :]
+    elif indexing == 'xy':
+        return xVals[np.newaxis, :], yVals[:, np.newaxis]
+    else:
+        raise ValueError("Unknown indexing '{}' encountered.".format(indexing))
+
+def _fill(shape, values):
+    '''
+    Broadcasts values into a newly allocated and writeable array of the given shape.
+    '''
+    Z = np.empty(shape)
+    Z[...] = values
+    return Z
+
+def getRampField(xVals, yVals, slope = 0.2, offset = 0.0, axis = 'x', indexing = 'ij'):
+    '''
+    Linear ramp along the x (axis = 'x') or y (axis = 'y') axis, i.e.
+    Z(x, y) = offset + slope * x   or   Z(x, y) = offset + slope * y.
+    Using the defaults this is the vectorized equivalent of
+        for j in range(n_pxs_y):     # iterate over y values
+            for i in range(n_pxs_x): # iterate over x values
+                zVals[i, j] = 0.2 * xVals[i]
+    '''
+    X, Y = _getAxisGrids(xVals, yVals, indexing)
+    shape = np.broadcast(X, Y).shape
+    if axis == 'x':
+        return _fill(shape, offset + slope * X)
+    elif axis == 'y':
+        return _fill(shape, offset + slope * Y)
+    else:
+        raise ValueError("Unknown axis '{}' encountered.".format(axis))
+
+def getGaussianField(xVals, yVals, x0 = 0.0, y0 = 0.0, sigma_x = 1.0, sigma_y = 1.0,
+                     amplitude = 1.0, indexing = 'ij'):
+    '''
+    Axis aligned 2d Gaussian
+    Z(x, y) = amplitude * exp(-(x - x0)^2 / (2 sigma_x^2) - (y - y0)^2 / (2 sigma_y^2)).
+    '''
+    X, Y = _getAxisGrids(xVals, yVals, indexing)
+    # the Gaussian factorizes, hence only two 1d exponentials need to be evaluated
+    gx = np.exp(-0.5 * ((X - x0) / sigma_x) ** 2)
+    gy = np.exp(-0.5 * ((Y - y0) / sigma_y) ** 2)
+    return amplitude * gx * gy
+
+def getProductField(xVals, yVals, fx, fy, indexing = 'ij'):
+    '''
+    Separable product field Z(x, y) = fx(x) * fy(y), where fx and fy are vectorized
+    (numpy ufunc like) functions of a single argument.
+    Example:
+    the heatmap templates fill their dummy data via
+        for i in range(len(yVals)):
+            for j in range(len(xVals)):
+                Z[i, j] = np.sin(np.pi * np.log(yVals[i])) * \\
+                          np.cos(np.pi * np.log(xVals[j]) - np.pi / 2.0)
+    which is equivalent to
+        Z = getProductField(xVals, yVals,
+                            fx = lambda x: np.cos(np.pi * np.log(x) - np.pi / 2.0),
+                            fy = lambda y: np.sin(np.pi * np.log(y)),
+                            indexing = 'xy')
+    '''
+    X, Y = _getAxisGrids(xVals, yVals, indexing)
+    return fx(X) * fy(Y)
+
+def getRandomField(n_x, n_y, seed = None, low = 0.0, high = 1.0):
+    '''
+    Uniformly distributed random field in [low, high) of shape (n_x, n_y).
+    Pass an integer seed for reproducible fields.
+    '''
+    rng = np.random.default_rng(seed)
+    return rng.uniform(low, high, size = (n_x, n_y))
+
+if __name__ == '__main__':
+
+    pass
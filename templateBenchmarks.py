@@ -0,0 +1,298 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: templateBenchmarks.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Timing and memory benchmarks of the template plot functions with stored baselines.
+
+Every benchmark case runs one template plot function (e.g. plot_pcolor, plot_image,
+plot_AB_panel, plot_patch_array or one of the Plot functions) for a list of problem
+sizes. The plot function is called as is, where the time spent is split into stages
+by intercepting Figure.savefig:
+    setup:   from the call until the first savefig (figure, axes and artist creation)
+    draw:    one Agg draw of the figure (layout and rasterization), which is measured
+             separately before its first savefig
+    save:    time spent in savefig (all written formats)
+    total:   the time of the call without the separate draw
+    peakRSS: peak resident set size of the process in MB
+Times are the minimum over repeated calls. Every case runs in a fresh worker process
+(see parallelSweep.run_sweep), such that peakRSS is the peak of this case only:
+    ##############################################
+    from templateBenchmarks import BenchmarkCase
+    from templateBenchmarks import run_benchmarks
+    from templateBenchmarks import compareResults
+    # other code ...
+    cases = [BenchmarkCase('image', 'mpl_imshow_template/mpl_imshow_template.py',
+                           'plot_image', getImageKwargs, (32, 256, 1024))]
+    results = run_benchmarks(cases, outdir)
+    regressions = compareResults(results, load_baseline(BASELINE_FILE))
+    # other code ...
+    ##############################################
+getKwargs(size, outdir) is a module level function returning the keyword arguments of
+the plot function for the given size. It is called in the worker process, such that
+the (possibly large) input data is never pickled.
+A run regresses if one of its times exceeds the baseline time by more than the
+relative tolerance (and by more than BENCHMARK_MIN_SECONDS, to ignore timer noise of
+very fast stages), if its peakRSS exceeds the baseline by more than the relative RSS
+tolerance, or if a case fails. Failing cases are never stored as baseline
+(save_baseline raises a ValueError).
+'''
+
+import os
+import sys
+import json
+import time
+import platform
+import datetime
+import traceback
+import importlib.util
+from collections import namedtuple
+from collections import OrderedDict
+import numpy as np
+import matplotlib as mpl
+import matplotlib.figure
+
+from atomicWrite import atomic_write
+from memoryGuard import getPeakRSS
+from parallelSweep import run_sweep
+from renderCache import disable as disableRenderCache
+
+REPODIR = os.path.dirname(os.path.abspath(__file__))
+
+# number of timed calls per case and size (the minimum is reported)
+BENCHMARK_REPEAT = 3
+
+# tolerated relative increase of the stage times and of the peak RSS
+BENCHMARK_TOLERANCE = 0.25
+BENCHMARK_RSS_TOLERANCE = 0.25
+
+# time differences below this value (in seconds) are never reported as regressions
+BENCHMARK_MIN_SECONDS = 0.02
+
+BENCHMARK_STAGES = ('setup', 'draw', 'save', 'total')
+
+BenchmarkCase = namedtuple('BenchmarkCase', ['name', 'path', 'function', 'getKwargs',
+                                             'sizes'])
+
+Regression = namedtuple('Regression', ['case', 'metric', 'baseline', 'current'])
+
+_templateModules = {}
+
+def loadTemplate(path):
+    '''
+    Imports the template script path (relative to the repository root) and returns the
+    module. The script is imported again, if it was modified since its last import.
+    '''
+    path = os.path.join(REPODIR, path)
+    mtime = os.stat(path).st_mtime_ns
+    if path not in _templateModules or _templateModules[path][0] != mtime:
+        name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        # (the templates import the shared modules of the repository root)
+        if REPODIR not in sys.path:
+            sys.path.append(REPODIR)
+        spec.loader.exec_module(module)
+        _templateModules[path] = (mtime, module)
+    return _templateModules[path][1]
+
+def loadTemplateFunction(path, function):
+    '''
+    Returns the function of the given name of the template script path (see
+    loadTemplate).
+    '''
+    return getattr(loadTemplate(path), function)
+
+class StageTimer:
+    '''
+    Context manager, which intercepts Figure.savefig to record the start of the first
+    save, the time of one separate Agg draw per figure and the time spent in savefig.
+    '''
+
+    def __init__(self):
+        self.firstSave = None
+        self.draw = 0.0
+        self.save = 0.0
+        self._drawn = []
+
+    def __enter__(self):
+        self._savefig = mpl.figure.Figure.savefig
+        timer = self
+
+        def savefig(fig, *args, **kwargs):
+            if not any(fig is drawn for drawn in timer._drawn):
+                start = time.perf_counter()
+                if timer.firstSave is None:
+                    timer.firstSave = start
+                fig.canvas.draw()
+                timer.draw += time.perf_counter() - start
+                timer._drawn.append(fig)
+            start = time.perf_counter()
+            try:
+                return timer._savefig(fig, *args, **kwargs)
+            finally:
+                timer.save += time.perf_counter() - start
+
+        mpl.figure.Figure.savefig = savefig
+        return self
+
+    def __exit__(self, *exc):
+        mpl.figure.Figure.savefig = self._savefig
+        self._drawn = []
+        return False
+
+def measure(func, kwargs, repeat = BENCHMARK_REPEAT):
+    '''
+    Calls func(**kwargs) repeat times and returns the minimal stage times.
+    :returns times: dict of the stage times (see BENCHMARK_STAGES) in seconds
+    '''
+    times = {stage: [] for stage in BENCHMARK_STAGES}
+    for k in range(repeat):
+        with StageTimer() as timer:
+            start = time.perf_counter()
+            func(**kwargs)
+            stop = time.perf_counter()
+        firstSave = stop if timer.firstSave is None else timer.firstSave
+        times['setup'].append(firstSave - start)
+        times['draw'].append(timer.draw)
+        times['save'].append(timer.save)
+        times['total'].append(stop - start - timer.draw)
+    return {stage: min(values) for stage, values in times.items()}
+
+def _runCase(path, function, getKwargs, size, outdir, repeat):
+    '''
+    Benchmarks one case and size (run in a worker process).
+    :returns result: dict of the stage times and peakRSS, or of the error message
+    '''
+    try:
+        # cached figures would not be rendered at all
+        disableRenderCache()
+        func = loadTemplateFunction(path, function)
+        result = measure(func, getKwargs(size, outdir), repeat = repeat)
+    except (Exception, SystemExit) as exc:
+        return {'error': '{}: {}'.format(type(exc).__name__, exc),
+                'traceback': traceback.format_exc()}
+    result['peakRSS'] = getPeakRSS()
+    return result
+
+def getCaseKey(case, size):
+    return '{}[{}]'.format(case.name, size)
+
+def run_benchmarks(cases, outdir, repeat = BENCHMARK_REPEAT, isolate = True,
+                   verbose = True):
+    '''
+    Runs all cases for all of their sizes, one after the other.
+    :param cases: sequence of BenchmarkCase tuples
+    :param outdir: string, output directory of the plot functions
+    :param repeat: int, number of timed calls per case and size
+    :param isolate: bool, if True, every case and size runs in a fresh worker process
+        (otherwise in this process, where peakRSS is the peak of all previous cases)
+    :returns results: OrderedDict of 'name[size]' and result dicts
+    '''
+    results = OrderedDict()
+    for case in cases:
+        for size in case.sizes:
+            job = (_runCase, {'path': case.path, 'function': case.function,
+                              'getKwargs': case.getKwargs, 'size': size,
+                              'outdir': outdir, 'repeat': repeat})
+            if isolate:
+                result = run_sweep([job], n_workers = 1, max_tasks_per_child = 1)[0]
+            else:
+                result = run_sweep([job], n_workers = 1)[0]
+            results[getCaseKey(case, size)] = result
+            if verbose:
+                print(formatResult(getCaseKey(case, size), result))
+    return results
+
+def formatResult(key, result):
+    if 'error' in result:
+        return '{:<36s} failed ({})'.format(key, result['error'])
+    rss = result.get('peakRSS')
+    return '{:<36s} '.format(key) + \
+        '  '.join('{} {:8.4f} s'.format(stage, result[stage])
+                  for stage in BENCHMARK_STAGES) + \
+        ('  peakRSS {:8.1f} MB'.format(rss) if rss is not None else '')
+
+def getEnvironmentInfo():
+    '''
+    Returns the versions and the machine, which the timings refer to.
+    '''
+    return {'date': datetime.datetime.now().strftime("%Y-%m-%d"),
+            'python': platform.python_version(),
+            'matplotlib': mpl.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count()}
+
+def save_baseline(results, path):
+    '''
+    Writes the results together with the environment info as JSON baseline file.
+    :raises ValueError: if any of the results is a failed case (failing cases can not
+        serve as reference)
+    '''
+    failed = sorted(key for key, result in results.items() if 'error' in result)
+    if failed:
+        raise ValueError("The failed cases {} can not be stored as baseline.".format(
+                         ', '.join(failed)))
+    with atomic_write(path) as tmpfile:
+        with open(tmpfile, 'w') as fh:
+            json.dump({'environment': getEnvironmentInfo(), 'results': results}, fh,
+                      indent = 2)
+    return path
+
+def load_baseline(path):
+    '''
+    Returns the baseline file as dict with the keys 'environment' and 'results'.
+    '''
+    with open(path, 'r') as fh:
+        return json.load(fh)
+
+def compareResults(results, baseline, tolerance = BENCHMARK_TOLERANCE,
+                   rssTolerance = BENCHMARK_RSS_TOLERANCE,
+                   minSeconds = BENCHMARK_MIN_SECONDS):
+    '''
+    Compares the results with the baseline results (cases missing in either of both
+    are not compared). Failed cases are always reported, also if they are missing in
+    the baseline or if their baseline (written before failing cases were refused)
+    recorded an error.
+    :param baseline: dict as returned by load_baseline
+    :returns regressions: list of Regression tuples (case, metric, baseline, current),
+        where metric is a stage, 'peakRSS' or 'error'
+    '''
+    regressions = []
+    for key, result in results.items():
+        if 'error' in result:
+            regressions.append(Regression(key, 'error', None, result['error']))
+            continue
+        reference = baseline['results'].get(key)
+        if reference is None or 'error' in reference:
+            continue
+        for stage in BENCHMARK_STAGES:
+            if result[stage] > reference[stage] * (1.0 + tolerance) + minSeconds:
+                regressions.append(Regression(key, stage, reference[stage], result[stage]))
+        if result.get('peakRSS') is not None and reference.get('peakRSS') is not None and \
+           result['peakRSS'] > reference['peakRSS'] * (1.0 + rssTolerance):
+            regressions.append(Regression(key, 'peakRSS', reference['peakRSS'],
+                                          result['peakRSS']))
+    return regressions
+
+def formatRegression(regression):
+    if regression.metric == 'error':
+        return '{}: failed ({})'.format(regression.case, regression.current)
+    unit = 'MB' if regression.metric == 'peakRSS' else 's'
+    return '{}: {} {:.4f} {} -> {:.4f} {} ({:+.0f} %)'.format(
+           regression.case, regression.metric, regression.baseline, unit,
+           regression.current, unit,
+           100.0 * (regression.current / regression.baseline - 1.0)
+           if regression.baseline else float('inf'))
+
+if __name__ == '__main__':
+
+    pass
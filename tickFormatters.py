@@ -0,0 +1,155 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: tickFormatters.py
+# tested with python 3.11.7 in conjunction with mpl version 3.11.2
+##########################################################################################
+
+'''
+Vectorized and memoizing tick formatters.
+
+Wrapping cleanFormatter (ticker.py) or str_format_power_of_ten (mpl_string_formatter.py)
+in a FuncFormatter formats every tick label separately in python, again for every draw
+of every figure. The formatters of this module instead format the whole tick array at
+once in Formatter.format_ticks, where every distinct tick value is only formatted once
+and the label lists of previously seen tick arrays are looked up from a cache:
+    ##############################################
+    from tickFormatters import CleanFormatter
+    # other code ...
+    ax1.xaxis.set_major_formatter(CleanFormatter())
+    # other code ...
+    ##############################################
+The labels are memoized (value -> label), such that identical tick values always yield
+the identical mathtext string, which matplotlib's mathtext layer then parses only once.
+'''
+
+from functools import lru_cache
+import numpy as np
+import matplotlib as mpl
+import matplotlib.ticker
+
+LABEL_CACHE_SIZE = 4096
+
+def cleanLabel(x: float) -> str:
+    '''
+    Memoized '{:g}' formatting, i.e. 0.0 --> '0', 1.0 --> '1' and 0.50 --> '0.5'.
+    -0.0 is labeled '0' as well, since the cache does not distinguish -0.0 from 0.0
+    (otherwise the label of zero would depend on which of both was formatted first).
+    '''
+    return _cleanLabel(x + 0.0)
+
+@lru_cache(maxsize = LABEL_CACHE_SIZE)
+def _cleanLabel(x: float) -> str:
+    return '{:g}'.format(x)
+
+@lru_cache(maxsize = LABEL_CACHE_SIZE)
+def powerOfTenLabel(mantissa: str, exponent: int, omitUnitMantissa: bool = True) -> str:
+    '''
+    Memoized mathtext label mantissa x 10^exponent, e.g.
+    ('1.27', -5) --> '$\\mathdefault{1.27 \\times 10^{-5}}$'.
+    For omitUnitMantissa = True a mantissa of '1' is left out ('$\\mathdefault{10^{-5}}$').
+    '''
+    if omitUnitMantissa and mantissa == '1':
+        return r'$\mathdefault{10^{' + str(exponent) + '}}$'
+    return r'$\mathdefault{' + mantissa + r' \times 10^{' + str(exponent) + '}}$'
+
+def _formatUnique(values, labelFunc):
+    '''
+    Applies labelFunc to every distinct value only once (np.unique merges -0.0 and 0.0).
+    '''
+    values = np.asarray(values, dtype = float) + 0.0
+    if values.size == 0:
+        return []
+    uniqueValues, inverse = np.unique(values, return_inverse = True)
+    labels = [labelFunc(value) for value in uniqueValues.tolist()]
+    return [labels[k] for k in inverse.ravel().tolist()]
+
+def formatClean(values) -> list:
+    '''
+    Vectorized version of cleanFormatter for a whole array of values.
+    :returns labels: list of strings
+    '''
+    return _formatUnique(values, cleanLabel)
+
+def formatPowerOfTen(values, precision: int = 3, omitUnitMantissa: bool = True) -> list:
+    '''
+    Formats an array of values as mathtext labels m x 10^e with at most precision
+    significant digits of the mantissa m, where 1 <= |m| < 10. Zero is labeled '0'.
+    The exponents and mantissas of all values are computed at once.
+    :returns labels: list of strings
+    '''
+    values = np.asarray(values, dtype = float)
+    if values.size == 0:
+        return []
+    nonzero = (values != 0.0) & np.isfinite(values)
+    absValues = np.where(nonzero, np.abs(values), 1.0)
+    exponents = np.floor(np.log10(absValues)).astype(int)
+    mantissas = np.round(values / 10.0 ** exponents, precision - 1)
+    # rounding may carry over to the next decade (e.g. 9.9996 --> 10.0)
+    carry = np.abs(mantissas) >= 10.0
+    exponents = np.where(carry, exponents + 1, exponents)
+    mantissas = np.where(carry, mantissas / 10.0, mantissas)
+
+    labels = []
+    for value, isNonzero, mantissa, exponent in zip(values.tolist(), nonzero.tolist(),
+                                                   mantissas.tolist(), exponents.tolist()):
+        if isNonzero:
+            labels.append(powerOfTenLabel(cleanLabel(mantissa), exponent,
+                                          omitUnitMantissa))
+        else:
+            labels.append(cleanLabel(value))
+    return labels
+
+class _CachedFormatter(mpl.ticker.Formatter):
+    '''
+    Base class memoizing the label lists per tick array.
+    '''
+
+    def __init__(self, maxsize: int = 256):
+        self._formatTicksCached = lru_cache(maxsize = maxsize)(self._formatTuple)
+
+    def _formatTuple(self, values):
+        '''
+        Abstract method, which is implemented by the subclasses.
+        :param values: tuple of floats, the tick values
+        :returns labels: tuple of strings, one label per tick value
+        '''
+        raise NotImplementedError
+
+    def __call__(self, x, pos = None):
+        return self._formatTicksCached((float(x) + 0.0,))[0]
+
+    def format_ticks(self, values):
+        # + 0.0 maps -0.0 to 0.0, which are equal cache keys
+        values = tuple(float(value) + 0.0 for value in values)
+        return list(self._formatTicksCached(values))
+
+class CleanFormatter(_CachedFormatter):
+    '''
+    Formatter equivalent to FuncFormatter(cleanFormatter), i.e. 0.0 as 0 and 1.0 as 1,
+    except that -0.0 is labeled 0 as well.
+    '''
+
+    def _formatTuple(self, values):
+        return tuple(formatClean(values))
+
+class PowerOfTenFormatter(_CachedFormatter):
+    '''
+    Formatter labeling the ticks as m x 10^e, see formatPowerOfTen.
+    '''
+
+    def __init__(self, precision: int = 3, omitUnitMantissa: bool = True,
+                 maxsize: int = 256):
+        super().__init__(maxsize = maxsize)
+        self.precision = precision
+        self.omitUnitMantissa = omitUnitMantissa
+
+    def _formatTuple(self, values):
+        return tuple(formatPowerOfTen(values, self.precision, self.omitUnitMantissa))
+
+if __name__ == '__main__':
+
+    pass
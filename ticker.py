@@ -9,7 +9,19 @@
 ##########################################################################################
 
 import numpy as np
-from typing import Union
+import matplotlib as mpl
+import matplotlib.ticker
+from typing import List, Union
+from collections import OrderedDict
+
+def _getDecades(expMin: int, expMax: int) -> np.ndarray:
+    '''
+    Returns the decades [10^expMin, ..., 10^expMax].
+    The decades are parsed from their literals (e.g. '1e-12'), which yields the
+    correctly rounded floats, whereas 10.0 ** exp may deviate by one ulp. This keeps
+    ticks at interval bounds given as literals (e.g. min = 1.0e-12) inside the interval.
+    '''
+    return np.array([float('1e{}'.format(exp)) for exp in range(expMin, expMax + 1)])
 
 def getLogTicksBase10(min: float, max: float,\
     comb: np.ndarray = np.arange(1, 10)) -> np.ndarray:
@@ -47,25 +59,104 @@ def getLogTicksBase10(min: float, max: float,\
     expMin = int(np.floor(np.log10(min)))
     expMax = int(np.floor(np.log10(max)))
 
-    if np.isclose(expMin, expMax):
-        tmp = comb * 10.0 ** expMin
-        tmp = tmp[tmp >= min]
-        return tmp[tmp <= max]
-
-    ticks = np.array([])
-
-    tmp = comb * 10.0 ** expMin
+    # outer product of all decades and the comb, followed by a mask (closed interval)
+    decades = _getDecades(expMin, expMax)
+    ticks = (decades[:, np.newaxis] * np.asarray(comb)[np.newaxis, :]).ravel()
+    return ticks[(ticks >= min) & (ticks <= max)]
 
-    ticks = np.concatenate((ticks, tmp[tmp >= min]), axis = 0)
-
-    for exp in np.arange(expMin + 1, expMax, 1).astype(int):
-        tmp = comb * 10.0 ** exp
-        ticks = np.concatenate((ticks, tmp), axis = 0)
-
-    tmp = comb * 10.0 ** (expMax)
-    ticks = np.concatenate((ticks, tmp[tmp <= max]), axis = 0)
+def getLogTicksBase10Batch(mins: np.ndarray, maxs: np.ndarray,\
+    comb: np.ndarray = np.arange(1, 10)) -> List[np.ndarray]:
+    '''
+    Batch version of getLogTicksBase10 for many (min, max) intervals in a single call.
+    :param mins: 1d array like of lower interval bounds
+    :param maxs: 1d array like of upper interval bounds (same length as mins)
+    :param comb: the comb used for every decade, see getLogTicksBase10
+    :returns ticks: list of 1d tick arrays, where ticks[k] equals
+        getLogTicksBase10(mins[k], maxs[k], comb)
+    The tick candidates of all decades spanned by any of the intervals are computed
+    once, and each interval selects its ticks from them by a (broadcast) mask.
+    '''
+    mins = np.asarray(mins, dtype = float)
+    maxs = np.asarray(maxs, dtype = float)
+    if mins.shape != maxs.shape or mins.ndim != 1:
+        raise ValueError("mins and maxs must be 1d arrays of equal length.")
+    if mins.size == 0:
+        return []
+    lower = np.minimum(mins, maxs)
+    upper = np.maximum(mins, maxs)
+
+    expMin = int(np.floor(np.log10(lower.min())))
+    expMax = int(np.floor(np.log10(upper.max())))
+
+    decades = _getDecades(expMin, expMax)
+    candidates = (decades[:, np.newaxis] * np.asarray(comb)[np.newaxis, :]).ravel()
+    mask = (candidates[np.newaxis, :] >= lower[:, np.newaxis]) & \
+           (candidates[np.newaxis, :] <= upper[:, np.newaxis])
+    return [candidates[row] for row in mask]
+
+_logTicksCache = OrderedDict()
+LOG_TICKS_CACHE_SIZE = 256
+
+class CachedLogTickLocator(mpl.ticker.Locator):
+    '''
+    Tick locator placing logarithmic base 10 ticks at comb * 10^n using
+    getLogTicksBase10, e.g. as a minor tick locator on logarithmic axes.
+    The tick arrays are memoized per (vmin, vmax, comb) in a module level LRU cache
+    (shared by all instances), such that repeated draws of the same view interval
+    (batch renders of many figures or interactive pans back and forth) do not
+    recompute them.
+    Optionally the ticks are restricted to the closed interval limits = (min, max),
+    independent of the view interval.
+    Example usage:
+    Here the minor ticks have no labels (NullFormatter).
+    ****************************************************************
+    ...
+    ax.set_xscale('log')
+    ax.xaxis.set_minor_locator(CachedLogTickLocator(limits = (1.0e-12, 1.0e-6)))
+    ax.xaxis.set_minor_formatter(mpl.ticker.NullFormatter())
+    ...
+    ****************************************************************
+    '''
 
-    return ticks
+    def __init__(self, comb: np.ndarray = np.arange(1, 10), limits = None,
+                 maxsize: int = LOG_TICKS_CACHE_SIZE):
+        self.comb = tuple(float(c) for c in comb)
+        self.limits = None if limits is None else (min(limits), max(limits))
+        self.maxsize = maxsize
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        if vmin > vmax:
+            vmin, vmax = vmax, vmin
+        if vmax <= 0.0:
+            return np.array([])
+        if vmin <= 0.0:
+            # non-positive limits can only occur on non-log axes or during autoscaling
+            vmin = self.axis.get_minpos() if self.axis is not None else vmax / 10.0
+        if self.limits is not None:
+            vmin, vmax = np.maximum(vmin, self.limits[0]), np.minimum(vmax, self.limits[1])
+            if vmin > vmax:
+                return np.array([])
+        key = (float(vmin), float(vmax), self.comb)
+
+        ticks = _logTicksCache.get(key)
+        if ticks is not None:
+            _logTicksCache.move_to_end(key)
+            return ticks
+
+        ticks = getLogTicksBase10(vmin, vmax, np.array(self.comb))
+        ticks.flags.writeable = False
+
+        _logTicksCache[key] = ticks
+        while len(_logTicksCache) > self.maxsize:
+            _logTicksCache.popitem(last = False)
+        return self.raise_if_exceeds(ticks)
+
+def clearLogTicksCache():
+    _logTicksCache.clear()
 
 def cleanFormatter(x: Union[float, int], pos = None) -> str:
     '''
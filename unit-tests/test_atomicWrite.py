@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_atomicWrite.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import shutil
+import platform
+import tempfile
+import unittest
+
+sys.path.append('../')
+
+from atomicWrite import atomic_write
+
+class AtomicWriteTest(unittest.TestCase):
+    '''
+    Tests for the atomic_write context manager (atomicWrite.py).
+    '''
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'subdir', 'data.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors = True)
+
+    def test_01(self):
+        '''
+        The temporary file keeps the extension and replaces the target on success.
+        '''
+        with atomic_write(self.path) as tmpfile:
+            self.assertTrue(tmpfile.endswith('.tmp.json'))
+            self.assertTrue(os.path.dirname(tmpfile) == os.path.dirname(self.path))
+            with open(tmpfile, 'w') as fh:
+                fh.write('new')
+            self.assertFalse(os.path.isfile(self.path))
+        with open(self.path, 'r') as fh:
+            self.assertTrue(fh.read() == 'new')
+        self.assertTrue(os.listdir(os.path.dirname(self.path)) == ['data.json'])
+        return None
+
+    def test_02(self):
+        '''
+        If the body raises, the target is left unchanged and the temporary file removed.
+        '''
+        with atomic_write(self.path) as tmpfile:
+            with open(tmpfile, 'w') as fh:
+                fh.write('old')
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as tmpfile:
+                with open(tmpfile, 'w') as fh:
+                    fh.write('partial')
+                raise RuntimeError('interrupted')
+        with open(self.path, 'r') as fh:
+            self.assertTrue(fh.read() == 'old')
+        self.assertTrue(os.listdir(os.path.dirname(self.path)) == ['data.json'])
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_available_fonts.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import json
+import platform
+import tempfile
+import unittest
+import matplotlib as mpl
+import matplotlib.font_manager
+
+sys.path.append('../')
+
+from mpl_fonts import available_fonts
+from mpl_fonts.available_fonts import resolve_families
+from mpl_fonts.available_fonts import clear_cache
+from mpl_fonts.available_fonts import warm_up
+
+class AvailableFontsTest(unittest.TestCase):
+    '''
+    Test cases for the font resolution of mpl_fonts/available_fonts.py.
+    '''
+
+    def test_01(self):
+
+        with tempfile.TemporaryDirectory() as cachedir:
+            cachefile = os.path.join(cachedir, 'fonts.json')
+            clear_cache(cachefile)
+
+            resolved = resolve_families(['No Such Font Family', 'DejaVu Sans'],
+                                        cachefile = cachefile)
+            self.assertTrue(resolved == ['DejaVu Sans'])
+
+            # missing families fall back to the given (installed) fallback families
+            resolved = resolve_families(['No Such Font Family'],
+                                        fallback = ['No Such Font', 'DejaVu Sans'],
+                                        cachefile = cachefile)
+            self.assertTrue(resolved == ['DejaVu Sans'])
+
+            # generic families are kept
+            self.assertTrue(resolve_families(['sans-serif'], cachefile = cachefile) == \
+                            ['sans-serif'])
+
+            # the resolution is persisted and keyed by the font directories
+            self.assertTrue(os.path.exists(cachefile))
+            with open(cachefile, 'r') as fh:
+                data = json.load(fh)
+            self.assertTrue(data['key']['mpl'] == mpl.__version__)
+            self.assertTrue(data['families']['DejaVu Sans'] == True)
+            self.assertTrue(data['families']['Myriad Pro'] == \
+                            any(font.name == 'Myriad Pro'
+                                for font in mpl.font_manager.fontManager.ttflist))
+
+            # a stale cache file is ignored
+            data['key']['dirs'] = {}
+            with open(cachefile, 'w') as fh:
+                json.dump(data, fh)
+            self.assertTrue(available_fonts._loadResolution(cachefile) is None)
+
+            clear_cache(cachefile)
+            self.assertTrue(not os.path.exists(cachefile))
+
+        return None
+
+    def test_02(self):
+
+        resolved = warm_up(families = ['Myriad Pro'], sizes = [10.0])
+
+        self.assertTrue(list(resolved.keys()) == ['Myriad Pro'])
+        self.assertTrue(len(resolved['Myriad Pro']) > 0)
+
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,265 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_batchJobs.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import json
+import shutil
+import platform
+import tempfile
+import threading
+import unittest
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from batchJobs import load_spec
+from batchJobs import expandSpec
+from batchJobs import dropDuplicates
+from batchJobs import evaluateArguments
+from batchJobs import CostModel
+from batchJobs import orderJobs
+from batchJobs import run_batch
+from batchJobs import _values
+from renderClient import shutdown
+from renderDaemon import RenderServer
+from templateBenchmarks import REPODIR
+
+TEMPLATE = '''
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+
+def getRamp(n, slope = 1.0):
+    return slope * np.arange(n)
+
+def plot_line(Y, outname, outdir, linewidth = 1.0):
+    if linewidth < 0.0:
+        raise ValueError('negative linewidth')
+    f, ax1 = plt.subplots(1)
+    ax1.plot(Y, lw = linewidth)
+    f.savefig(os.path.join(outdir, outname + '.png'), dpi = 20)
+    plt.close(f)
+    return outname
+'''
+
+class BatchJobsTest(unittest.TestCase):
+    '''
+    Tests for the declarative batch jobs of batchJobs.py.
+    '''
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.template = os.path.join(self.tmpdir, 'template.py')
+        with open(self.template, 'w') as fh:
+            fh.write(TEMPLATE)
+        self.spec = {
+            'defaults': {'outdir': 'out', 'params': {'linewidth': 1.0}},
+            'jobs': [{'name': 'lines',
+                      'template': self.template,
+                      'function': 'plot_line',
+                      'params': {'Y': {'__call__': self.template + ':getRamp',
+                                       'args': [{'__param__': '_n'}],
+                                       'kwargs': {'slope': 2.0}}},
+                      'grid': {'_n': [3, 50], 'linewidth': [0.5, 1.5]},
+                      'outname': 'line_{index}_{_n}_{linewidth}'}]}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors = True)
+
+    def test_01(self):
+        '''
+        Expansion of the grid (cartesian product, underscore variables, outname and
+        outdir) and of a union of grids.
+        '''
+        jobs = expandSpec(self.spec, self.tmpdir)
+        self.assertTrue(len(jobs) == 4)
+        self.assertTrue([job.outname for job in jobs] ==
+                        ['line_0_3_0.5', 'line_1_3_1.5', 'line_2_50_0.5', 'line_3_50_1.5'])
+        self.assertTrue(all('_n' not in job.kwargs for job in jobs))
+        self.assertTrue([job.kwargs['linewidth'] for job in jobs] == [0.5, 1.5, 0.5, 1.5])
+        self.assertTrue(jobs[0].kwargs['Y']['args'] == [3])
+        self.assertTrue(jobs[0].kwargs['outdir'] == os.path.join(self.tmpdir, 'out'))
+        self.assertTrue([job.size for job in jobs] == [3, 3, 50, 50])
+        self.assertTrue(len(set(job.key for job in jobs)) == 4)
+
+        self.spec['jobs'][0]['grid'] = [{'_n': [3], 'linewidth': [0.5]},
+                                        {'_n': [4, 5], 'linewidth': [2.0]}]
+        jobs = expandSpec(self.spec, self.tmpdir)
+        self.assertTrue([(job.params['_n'], job.kwargs['linewidth']) for job in jobs] ==
+                        [(3, 0.5), (4, 2.0), (5, 2.0)])
+
+        # the defaults apply without a grid
+        del self.spec['jobs'][0]['grid']
+        self.spec['jobs'][0]['params']['Y'] = [1.0, 2.0]
+        self.spec['jobs'][0]['outname'] = 'line'
+        jobs = expandSpec(self.spec, self.tmpdir)
+        self.assertTrue(len(jobs) == 1 and jobs[0].kwargs['linewidth'] == 1.0)
+
+        # index is reserved for the job index
+        self.spec['jobs'][0]['grid'] = [{'_n': [3]}, {'index': [0, 1]}]
+        with self.assertRaises(ValueError):
+            expandSpec(self.spec, self.tmpdir)
+        return None
+
+    def test_02(self):
+        '''
+        Evaluation of __call__, __ndarray__, __npy__ and __format__ values.
+        '''
+        np.save(os.path.join(self.tmpdir, 'X.npy'), np.eye(2))
+        spec = {'jobs': [{'template': self.template, 'function': 'plot_line',
+                          'params': {'Y': {'__call__': 'numpy.linspace',
+                                           'args': [0.0, 1.0, {'__param__': '_n'}]},
+                                     'X': {'__npy__': 'X.npy'},
+                                     'Z': {'__ndarray__': [1, 2], 'dtype': 'float32'},
+                                     'label': {'__format__': 'n = {_n:03d}'}},
+                          'grid': {'_n': [5]}}]}
+        job = expandSpec(spec, self.tmpdir)[0]
+        self.assertTrue(job.kwargs['label'] == 'n = 005')
+        kwargs = evaluateArguments(job.kwargs, job.basedir)
+        self.assertTrue(np.array_equal(kwargs['Y'], np.linspace(0.0, 1.0, 5)))
+        self.assertTrue(np.array_equal(kwargs['X'], np.eye(2)))
+        self.assertTrue(kwargs['Z'].dtype == np.float32)
+        # equal calls are evaluated once and shared read-only
+        self.assertTrue(evaluateArguments(job.kwargs, job.basedir)['Y'] is kwargs['Y'])
+        self.assertFalse(kwargs['Y'].flags.writeable)
+        with self.assertRaises(ValueError):
+            kwargs['Y'][0] = 1.0
+        return None
+
+    def test_03(self):
+        '''
+        Duplicate jobs are dropped, different jobs with the same output raise.
+        '''
+        self.spec['jobs'].append(dict(self.spec['jobs'][0],
+                                      grid = {'_n': [3], 'linewidth': [0.5, 2.5]}))
+        jobs, duplicates = dropDuplicates(expandSpec(self.spec, self.tmpdir))
+        self.assertTrue(len(jobs) == 5 and len(duplicates) == 1)
+        self.assertTrue(duplicates[0].outname == 'line_0_3_0.5')
+
+        self.spec['jobs'][1]['params'] = {'Y': [1.0, 2.0]}
+        with self.assertRaises(ValueError):
+            dropDuplicates(expandSpec(self.spec, self.tmpdir))
+        return None
+
+    def test_04(self):
+        '''
+        Ordering by the recorded render times and persistence of the cost model.
+        '''
+        jobs = expandSpec(self.spec, self.tmpdir)
+        path = os.path.join(self.tmpdir, 'costs.json')
+        costModel = CostModel(path)
+        # without history, larger inputs come first
+        self.assertTrue([job.size for job in orderJobs(jobs, costModel)] == [50, 50, 3, 3])
+
+        costModel.update(jobs[0], 3.0)
+        costModel.update(jobs[3], 1.0)
+        costModel.save()
+        costModel = CostModel(path)
+        self.assertTrue(costModel.predict(jobs[0]) == 3.0)
+        # unknown jobs of a known function are scaled by their input size
+        self.assertTrue(np.isclose(costModel.predict(jobs[1]), 2.0 * 3 / 26.5))
+        self.assertTrue(np.isclose(costModel.predict(jobs[2]), 2.0 * 50 / 26.5))
+        self.assertTrue(orderJobs(jobs, costModel) == [jobs[2], jobs[0], jobs[3], jobs[1]])
+        return None
+
+    def test_05(self):
+        '''
+        Serial and process executors, where failing jobs do not stop the batch.
+        '''
+        self.spec['jobs'][0]['grid']['linewidth'] = [-1.0, 1.5]
+        jobs = expandSpec(self.spec, self.tmpdir)
+        costModel = CostModel(os.path.join(self.tmpdir, 'costs.json'))
+        for executor in ['serial', 'process']:
+            results = run_batch(jobs, executor, n_workers = 2, costModel = costModel,
+                                verbose = False)
+            self.assertTrue([result.ok for result in results] ==
+                            [False, True, False, True])
+            self.assertTrue(results[0].error == 'ValueError: negative linewidth')
+            self.assertTrue([result.result for result in results if result.ok] ==
+                            ['line_1_3_1.5', 'line_3_50_1.5'])
+        self.assertTrue(os.path.isfile(os.path.join(self.tmpdir, 'out',
+                                                    'line_3_50_1.5.png')))
+        self.assertTrue(len(CostModel(costModel.path).jobs) == 2)
+        self.assertTrue(plt.get_fignums() == [])
+
+        with open(os.path.join(self.tmpdir, 'spec.json'), 'w') as fh:
+            json.dump(self.spec, fh)
+        self.assertTrue(load_spec(os.path.join(self.tmpdir, 'spec.json')) == self.spec)
+        return None
+
+    def test_06(self):
+        '''
+        The daemon executor sends the unevaluated arguments, which are evaluated by the
+        daemon (only calling scripts it serves).
+        '''
+        socketPath = os.path.join(self.tmpdir, 'render.sock')
+        server = RenderServer(socketPath, roots = (self.tmpdir,))
+        thread = threading.Thread(target = server.serve_forever)
+        thread.start()
+        try:
+            jobs = expandSpec(self.spec, self.tmpdir)
+            _values.clear()
+            results = run_batch(jobs, 'daemon', socketPath = socketPath, verbose = False)
+            self.assertTrue([result.result for result in results] ==
+                            [job.outname for job in jobs])
+            self.assertTrue(os.path.isfile(os.path.join(self.tmpdir, 'out',
+                                                        'line_3_50_1.5.png')))
+            # (the ramps were computed by the daemon thread, not by the client)
+            self.assertTrue(len(_values) == 2)
+
+            self.spec['jobs'][0]['params']['Y']['__call__'] = \
+                os.path.join(REPODIR, 'syntheticFields.py') + ':getRampField'
+            results = run_batch(expandSpec(self.spec, self.tmpdir)[:1], 'daemon',
+                                socketPath = socketPath, verbose = False)
+            self.assertFalse(results[0].ok)
+            self.assertTrue('is not served' in results[0].error)
+        finally:
+            shutdown(socketPath)
+            thread.join()
+            server.server_close()
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_binnedHistograms.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import sys
+import platform
+import unittest
+import warnings
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from binnedHistograms import getBinIndices
+from binnedHistograms import BinnedHistogram
+from binnedHistograms import BinnedHistogram2d
+
+class BinnedHistogramsTest(unittest.TestCase):
+    '''
+    Tests for the chunk-wise accumulated histograms (binnedHistograms.py).
+    '''
+
+    def setUp(self):
+        rng = np.random.RandomState(123456789)
+        self.X = rng.normal(loc = 100.0, scale = 15.0, size = (50001, 2))
+        self.X[:, 1] += 0.5 * self.X[:, 0]
+
+    def test_01(self):
+        '''
+        Uniform and non-uniform bin edges reproduce np.histogram, including values on
+        the bin edges.
+        '''
+        edges = np.linspace(55.0, 125.0, 46)
+        values = np.concatenate([self.X[:, 0], edges, [np.nan, np.inf]])
+        hist = BinnedHistogram(edges)
+        for start in range(0, len(values), 7000):
+            hist.update(values[start:start + 7000])
+        counts, _ = np.histogram(values[np.isfinite(values)], bins = edges)
+        self.assertTrue(np.array_equal(hist.counts, counts))
+        self.assertTrue(np.allclose(hist.density(),
+                                    np.histogram(values[np.isfinite(values)],
+                                                 bins = edges, density = True)[0]))
+
+        edges = np.array([0.0, 50.0, 80.0, 100.0, 101.0, 200.0])
+        indices = getBinIndices([-1.0, 0.0, 50.0, 100.5, 200.0, 250.0], edges)
+        self.assertTrue(indices.tolist() == [-1, 0, 1, 3, 4, -1])
+        self.assertTrue(np.array_equal(BinnedHistogram(edges).update(self.X).counts,
+                                       np.histogram(self.X, bins = edges)[0]))
+        return None
+
+    def test_02(self):
+        '''
+        The chunk-wise accumulated 2d histogram equals np.histogram2d.
+        '''
+        joint = BinnedHistogram2d.fromRange((48.0, 123.0), (78.0, 177.0), (60, 70))
+        for start in range(0, len(self.X), 6000):
+            joint.update(self.X[start:start + 6000])
+        counts, _, _ = np.histogram2d(self.X[:, 0], self.X[:, 1],
+                                      bins = [joint.xEdges, joint.yEdges])
+        self.assertTrue(np.array_equal(joint.counts, counts))
+        self.assertTrue(np.isclose(joint.density().sum() * 1.25 * (99.0 / 70.0), 1.0))
+
+        inside = (self.X[:, 0] >= 48.0) & (self.X[:, 0] <= 123.0) & \
+                 (self.X[:, 1] >= 78.0) & (self.X[:, 1] <= 177.0)
+        self.assertTrue(np.isclose(joint.getPearson(),
+                                   np.corrcoef(self.X[inside].T)[0, 1]))
+        self.assertTrue(np.array_equal(joint.marginal(0).counts, counts.sum(axis = 1)))
+
+        # empty histograms and constant coordinates have no correlation coefficient
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            empty = BinnedHistogram2d(joint.xEdges, joint.yEdges)
+            self.assertTrue(np.isnan(empty.getPearson()))
+            self.assertTrue(np.isnan(empty.update([[50.0, 80.0]]).getPearson()))
+            self.assertTrue(np.isnan(empty.update([[50.0, 90.0]]).getPearson()))
+        return None
+
+    def test_03(self):
+        '''
+        fromData reproduces np.histogram (counts, edges and density) exactly.
+        '''
+        for bins in [7, 50, 333]:
+            hist = BinnedHistogram.fromData(self.X[:, 0], bins = bins)
+            counts, edges = np.histogram(self.X[:, 0], bins = bins)
+            self.assertTrue(np.array_equal(hist.edges, edges))
+            self.assertTrue(np.array_equal(hist.counts, counts))
+            self.assertTrue(np.array_equal(hist.density(),
+                np.histogram(self.X[:, 0], bins = bins, density = True)[0]))
+        return None
+
+    def test_04(self):
+        '''
+        Merged partial histograms equal the histogram of all samples.
+        '''
+        hist = BinnedHistogram.fromRange((40.0, 160.0), bins = 60).update(self.X[:, 0])
+        parts = [BinnedHistogram.fromRange((40.0, 160.0), bins = 60).update(chunk)
+                 for chunk in np.array_split(self.X[:, 0], 4)]
+        merged = parts[0].merge(*parts[1:])
+        self.assertTrue(np.array_equal(merged.counts, hist.counts))
+        with self.assertRaises(ValueError):
+            merged.merge(BinnedHistogram.fromRange((40.0, 160.0), bins = 30))
+
+        joint = BinnedHistogram2d.fromRange((48.0, 123.0), (78.0, 177.0), bins = 40)
+        joint.update(self.X)
+        parts = [BinnedHistogram2d.fromRange((48.0, 123.0), (78.0, 177.0), bins = 40)
+                 .update(chunk) for chunk in np.array_split(self.X[::-1], 3)]
+        merged = parts[0].merge(*parts[1:])
+        self.assertTrue(np.array_equal(merged.counts, joint.counts))
+        self.assertTrue(np.isclose(merged.getPearson(), joint.getPearson()))
+        return None
+
+    def test_05(self):
+        '''
+        Rebinning sums up the counts of the merged bins.
+        '''
+        hist = BinnedHistogram.fromRange((40.0, 160.0), bins = 60).update(self.X[:, 0])
+        coarse = hist.rebin(3)
+        self.assertTrue(np.allclose(coarse.edges, np.linspace(40.0, 160.0, 21)))
+        self.assertTrue(np.array_equal(coarse.counts,
+                                       hist.counts.reshape(20, 3).sum(axis = 1)))
+        self.assertTrue(np.array_equal(hist.rebin(np.linspace(40.0, 160.0, 21)).counts,
+                                       coarse.counts))
+        partial = hist.rebin([60.0, 100.0, 104.0])
+        self.assertTrue(np.array_equal(partial.counts, [hist.counts[10:30].sum(),
+                                                        hist.counts[30:32].sum()]))
+        with self.assertRaises(ValueError):
+            hist.rebin(7)
+        with self.assertRaises(ValueError):
+            hist.rebin([40.0, 101.0, 160.0])
+        return None
+
+    def test_06(self):
+        '''
+        Already binned data is drawn as by ax.hist using the values as weights.
+        '''
+        edges = np.linspace(0.0, 1.0, 11)
+        values = np.linspace(0.1, 1.0, 10) ** 2
+        hist = BinnedHistogram.fromCounts(edges, values)
+        self.assertTrue(np.allclose(hist.getCoordinates(),
+                                    np.column_stack([edges[:-1] + 0.05, values])))
+        f, ax1 = plt.subplots(1)
+        bars = hist.bar(ax1)
+        reference = ax1.hist(edges[:-1], edges, weights = values)[2]
+        for bar, patch in zip(bars, reference):
+            self.assertTrue(np.allclose(bar.get_bbox().get_points(),
+                                        patch.get_bbox().get_points()))
+        step = hist.stairs(ax1, density = True)
+        self.assertTrue(np.allclose(step.get_data().values, values / 0.1 / values.sum()))
+        plt.close(f)
+        with self.assertRaises(ValueError):
+            BinnedHistogram.fromCounts(edges, values[:-1])
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_colormapSweep.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import platform
+import tempfile
+import unittest
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.image import imread
+
+sys.path.append('../')
+
+from colormapSweep import getOutputKey
+from colormapSweep import OutputManifest
+from colormapSweep import ColormapSweep
+
+def createFigure(cmap):
+    '''
+    Image with a colorbar, whose ticks and tick labels are customized.
+    '''
+    f, ax1 = plt.subplots(1)
+    image = ax1.imshow(np.linspace(0.0, 1.0, 24).reshape(4, 6), cmap = cmap,
+                       vmin = 0.0, vmax = 1.0)
+    cb1 = f.colorbar(image)
+    cb1.set_ticks(np.arange(0.0, 1.5, 0.5))
+    cb1.set_ticklabels(['low', 'mid', 'high'])
+    cb1.ax.minorticks_on()
+    return f, image
+
+class ColormapSweepTest(unittest.TestCase):
+    '''
+    Tests for the incremental colormap sweep (colormapSweep.py).
+    '''
+
+    def test_01(self):
+        '''
+        Output keys depend on the figure key, the colormap and further content.
+        '''
+        key = getOutputKey('figure', mpl.colormaps['viridis'], 'name')
+        self.assertTrue(key == getOutputKey('figure', mpl.colormaps['viridis'], 'name'))
+        self.assertTrue(key != getOutputKey('figure', mpl.colormaps['plasma'], 'name'))
+        self.assertTrue(key != getOutputKey('other', mpl.colormaps['viridis'], 'name'))
+        self.assertTrue(getOutputKey(None, mpl.colormaps['viridis'], 'name') is None)
+        self.assertTrue(getOutputKey('figure', object()) is None)
+        return None
+
+    def test_02(self):
+        '''
+        Manifest entries are current only for the recorded key and unmodified files.
+        '''
+        with tempfile.TemporaryDirectory() as outdir:
+            manifest = OutputManifest(outdir)
+            for fmt in ['pdf', 'png']:
+                with open(os.path.join(outdir, 'out.' + fmt), 'w') as fh:
+                    fh.write(fmt)
+            self.assertFalse(manifest.isCurrent('out', 'a', ['pdf', 'png']))
+            manifest.record('out', 'a', ['pdf', 'png'])
+            self.assertTrue(manifest.isCurrent('out', 'a', ['pdf', 'png']))
+            self.assertFalse(manifest.isCurrent('out', 'b', ['pdf', 'png']))
+            self.assertFalse(manifest.isCurrent('out', None, ['pdf', 'png']))
+            self.assertFalse(manifest.isCurrent('out', 'a', ['pdf', 'svg']))
+
+            stat = os.stat(os.path.join(outdir, 'out.png'))
+            os.utime(os.path.join(outdir, 'out.png'),
+                     ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            self.assertFalse(manifest.isCurrent('out', 'a', ['pdf', 'png']))
+
+            manifest.record('out', 'a', ['pdf'])
+            os.remove(os.path.join(outdir, 'out.pdf'))
+            self.assertFalse(manifest.isCurrent('out', 'a', ['pdf']))
+        return None
+
+    def test_03(self):
+        '''
+        Swapping the colormap reproduces the figure built for that colormap, including
+        the customized colorbar ticks, and unchanged outputs are skipped.
+        '''
+        cmaps = [mpl.colormaps['viridis'], mpl.colormaps['plasma'], 'gray']
+        outnames = ['sweep_viridis', 'sweep_plasma', 'sweep_gray']
+        with tempfile.TemporaryDirectory() as outdir:
+            f, image = createFigure(cmaps[0])
+            sweep = ColormapSweep(f, [image], outdir, formats = ['png'], key = 'figure')
+            for cmap, outname in zip(cmaps, outnames):
+                self.assertTrue(sweep.render(cmap, outname))
+            self.assertTrue(sweep.close() == outnames)
+
+            for cmap, outname in zip(cmaps, outnames):
+                # (save_figure writes png files at 600 dpi)
+                f, image = createFigure(cmap)
+                f.savefig(os.path.join(outdir, 'reference.png'), dpi = 600)
+                plt.close(f)
+                self.assertTrue(np.array_equal(
+                    imread(os.path.join(outdir, outname + '.png')),
+                    imread(os.path.join(outdir, 'reference.png'))))
+
+            # a second sweep of the same figure key skips all outputs
+            f, image = createFigure(cmaps[0])
+            sweep = ColormapSweep(f, [image], outdir, formats = ['png'], key = 'figure')
+            self.assertFalse(any(sweep.render(cmap, outname)
+                                 for cmap, outname in zip(cmaps, outnames)))
+            self.assertTrue(sweep.skipped == outnames)
+            sweep.close()
+
+            # a changed figure key, respectively no key, writes all outputs again
+            for key in ['changed', None]:
+                f, image = createFigure(cmaps[0])
+                sweep = ColormapSweep(f, [image], outdir, formats = ['png'], key = key)
+                for cmap, outname in zip(cmaps, outnames):
+                    sweep.render(cmap, outname)
+                self.assertTrue(sweep.written == outnames)
+                sweep.close()
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_figureExport.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import platform
+import tempfile
+import unittest
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from figureExport import save_figure
+from figureExport import save_all
+
+class FigureExportTest(unittest.TestCase):
+    '''
+    Test cases for the figureExport module.
+    '''
+
+    def test_01(self):
+
+        f, ax1 = plt.subplots(1)
+        ax1.plot([1.0, 2.0, 3.0], [1.0, 4.0, 9.0], label = r'$x^2$')
+        ax1.set_xlabel(r'x label')
+
+        fonttype = mpl.rcParams['pdf.fonttype']
+
+        with tempfile.TemporaryDirectory() as outdir:
+            basename = os.path.join(outdir, 'figure')
+            paths = save_figure(f, basename, formats = ['pdf', 'png', 'svg', '.eps'])
+
+            self.assertTrue(paths == [basename + '.' + fmt
+                                      for fmt in ['pdf', 'png', 'svg', 'eps']])
+            for path in paths:
+                self.assertTrue(os.path.getsize(path) > 0)
+
+            with open(basename + '.png', 'rb') as fh:
+                self.assertTrue(fh.read(8) == b'\x89PNG\r\n\x1a\n')
+            with open(basename + '.svg', 'r') as fh:
+                self.assertTrue('<svg' in fh.read())
+            # TrueType (Type 42) fonts are embedded as FontFile2 streams
+            with open(basename + '.pdf', 'rb') as fh:
+                self.assertTrue(b'/FontFile2' in fh.read())
+
+        # the global rcParams remain untouched
+        self.assertTrue(mpl.rcParams['pdf.fonttype'] == fonttype)
+
+        with self.assertRaises(ValueError):
+            save_figure(f, basename, formats = ['tiff'])
+
+        plt.close(f)
+
+        return None
+
+    def test_02(self):
+
+        f, ax1 = plt.subplots(1, layout = 'constrained')
+        ax1.plot([1.0, 2.0, 3.0], [1.0, 4.0, 9.0])
+        ax1.set_ylabel(r'$\mathrm{y}\ \mathrm{label}$')
+        engine = f.get_layout_engine()
+
+        with tempfile.TemporaryDirectory() as outdir:
+            basename = os.path.join(outdir, 'figure')
+            results = save_all(f, basename, formats = ['pdf', 'png', 'eps'],
+                               bbox_inches = 'tight')
+
+            self.assertTrue([result.format for result in results] == \
+                            ['layout', 'pdf', 'png', 'eps'])
+            self.assertTrue(results[0].path is None)
+            self.assertTrue(all(result.seconds >= 0.0 for result in results))
+
+            # the shared tight bounding box matches the per call tight bounding box
+            f.savefig(basename + '_ref.png', dpi = 600, bbox_inches = 'tight')
+            img = plt.imread(basename + '.png')
+            img_ref = plt.imread(basename + '_ref.png')
+            self.assertTrue(img.shape == img_ref.shape)
+
+        # the layout engine is restored
+        self.assertTrue(f.get_layout_engine() is engine)
+
+        plt.close(f)
+
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -37,6 +37,9 @@ import unittest
 sys.path.append('../')
 
 from mplUtils import getPcolorBoxCoordinates
+from mplUtils import getPcolorBoxCoordinatesCached
+from mplUtils import getPcolorBoxCoordinatesBatch
+from mplUtils import clearPcolorBoxCoordinatesCache
 
 class PColorBoxCoordinatesTest(unittest.TestCase):
 
@@ -129,6 +132,143 @@ class PColorBoxCoordinatesTest(unittest.TestCase):
 
         return None
 
+    def test_07(self):
+
+        xVals = np.array([0.0, 1.0, 2.0])
+
+        with self.assertRaises(ValueError):
+            getPcolorBoxCoordinates(xVals, type = 'unknown')
+
+        return None
+
+class PColorBoxCoordinatesCachedTest(unittest.TestCase):
+
+    """
+    Test cases for the getPcolorBoxCoordinatesCached function
+    """
+
+    def setUp(self):
+
+        clearPcolorBoxCoordinatesCache()
+
+    def test_01(self):
+
+        xVals = np.array([0.1, 0.2, 0.3, 0.4, 0.5])
+        res = np.array([0.05, 0.15, 0.25, 0.35, 0.45, 0.55])
+
+        xBoxCoords_a = getPcolorBoxCoordinatesCached(xVals)
+        xBoxCoords_b = getPcolorBoxCoordinatesCached(xVals.copy())
+
+        self.assertTrue(np.allclose(xBoxCoords_a, res))
+        # identical input bytes return the cached (read-only) array
+        self.assertTrue(xBoxCoords_a is xBoxCoords_b)
+        self.assertFalse(xBoxCoords_a.flags.writeable)
+
+        xBoxCoords_log = getPcolorBoxCoordinatesCached(xVals, type = 'log')
+        self.assertFalse(xBoxCoords_log is xBoxCoords_a)
+
+        return None
+
+    def test_02(self):
+
+        xVals = np.array([0.0])
+
+        xBoxCoords = getPcolorBoxCoordinatesCached(xVals, unitWidth = 12.0)
+        self.assertTrue(np.array_equal(xBoxCoords, np.array([-6.0, 6.0])))
+
+        with self.assertRaises(ValueError):
+            getPcolorBoxCoordinatesCached(xVals)
+
+        with self.assertRaises(ValueError):
+            getPcolorBoxCoordinatesCached(np.array([1.0, 2.0]), type = 'unknown')
+
+        return None
+
+    def test_03(self):
+
+        # least recently used entries are evicted first
+        xVals_a = np.array([0.0, 1.0, 2.0])
+        xVals_b = np.array([0.0, 2.0, 4.0])
+        xVals_c = np.array([0.0, 3.0, 6.0])
+
+        xBoxCoords_a = getPcolorBoxCoordinatesCached(xVals_a, maxsize = 2)
+        xBoxCoords_b = getPcolorBoxCoordinatesCached(xVals_b, maxsize = 2)
+        getPcolorBoxCoordinatesCached(xVals_a, maxsize = 2)
+        getPcolorBoxCoordinatesCached(xVals_c, maxsize = 2)
+
+        self.assertTrue(getPcolorBoxCoordinatesCached(xVals_a, maxsize = 2) is xBoxCoords_a)
+        self.assertFalse(getPcolorBoxCoordinatesCached(xVals_b, maxsize = 2) is xBoxCoords_b)
+
+        return None
+
+class PColorBoxCoordinatesBatchTest(unittest.TestCase):
+
+    """
+    Test cases for the getPcolorBoxCoordinatesBatch function
+    """
+
+    def test_01(self):
+
+        X = np.array([[0.0, 1.0, 2.0],
+                      [0.2, 0.4, 0.6]])
+        res = np.array([[-0.5, 0.5, 1.5, 2.5],
+                        [0.1, 0.3, 0.5, 0.7]])
+
+        xBoxCoords = getPcolorBoxCoordinatesBatch(X)
+
+        self.assertTrue(xBoxCoords.shape == (2, 4))
+        self.assertTrue(np.allclose(xBoxCoords, res))
+
+        # 1D input returns a 1D array, consistent with getPcolorBoxCoordinates
+        xBoxCoords = getPcolorBoxCoordinatesBatch(X[1])
+        self.assertTrue(xBoxCoords.shape == (4,))
+        self.assertTrue(np.allclose(xBoxCoords, getPcolorBoxCoordinates(X[1])))
+
+        return None
+
+    def test_02(self):
+
+        # non-uniform spacing
+        xVals = np.array([0.0, 1.0, 3.0, 7.0])
+        res = np.array([-0.5, 0.5, 2.0, 5.0, 9.0])
+
+        xBoxCoords = getPcolorBoxCoordinatesBatch(xVals)
+
+        self.assertTrue(np.allclose(xBoxCoords, res))
+
+        return None
+
+    def test_03(self):
+
+        X = np.logspace(1, 3, 11)
+
+        xBoxCoords = getPcolorBoxCoordinatesBatch(np.vstack((X, 10.0 * X)), type = 'log')
+        res = getPcolorBoxCoordinates(X, type = 'log')
+
+        self.assertTrue(np.allclose(xBoxCoords[0], res))
+        self.assertTrue(np.allclose(xBoxCoords[1], 10.0 * res))
+
+        with self.assertRaises(ValueError):
+            getPcolorBoxCoordinatesBatch(np.array([0.0, 1.0]), type = 'log')
+
+        return None
+
+    def test_04(self):
+
+        X = np.array([[0.0], [5.0]])
+        res = np.array([[-0.5, 0.5], [4.5, 5.5]])
+
+        xBoxCoords = getPcolorBoxCoordinatesBatch(X, unitWidth = 1.0)
+        self.assertTrue(np.allclose(xBoxCoords, res))
+
+        with self.assertRaises(ValueError):
+            getPcolorBoxCoordinatesBatch(X)
+
+        with self.assertRaises(ValueError):
+            getPcolorBoxCoordinatesBatch(np.zeros((2, 2, 2)))
+
+        return None
+
 if __name__ == '__main__':
 
     print("/////////////////////////////////////////////////////////////////////////////")
@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_mathtextCache.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import sys
+import platform
+import unittest
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.mathtext import MathTextParser
+from matplotlib.font_manager import FontProperties
+
+sys.path.append('../')
+
+import mathtextCache
+from mathtextCache import install
+from mathtextCache import clearMathtextCache
+from mathtextCache import getMathtextCacheInfo
+
+class MathtextCacheTest(unittest.TestCase):
+    '''
+    Test cases for the mathtextCache module.
+    '''
+
+    def test_01(self):
+
+        self.assertTrue(install(maxsize = 8))
+        clearMathtextCache()
+
+        label = r'$p(k\, |\, \mu)$'
+        prop = FontProperties(size = 10.0)
+
+        # separate parser instances (as created by every renderer) share the cache
+        ref = MathTextParser('path').parse(label, dpi = 72, prop = prop)
+        res = MathTextParser('path').parse(label, dpi = 72, prop = prop)
+        self.assertTrue(res is ref)
+
+        info = getMathtextCacheInfo()
+        self.assertTrue(info.hits == 1 and info.misses == 1 and info.currsize == 1)
+
+        # dpi, font properties and output type are part of the key
+        MathTextParser('path').parse(label, dpi = 300, prop = prop)
+        MathTextParser('path').parse(label, dpi = 72, prop = FontProperties(size = 8.0))
+        MathTextParser('agg').parse(label, dpi = 72, prop = prop)
+        self.assertTrue(getMathtextCacheInfo().misses == 4)
+
+        # the mathtext rcParams read by the parser are part of the key
+        with mpl.rc_context({'mathtext.default': 'rm'}):
+            upright = MathTextParser('path').parse(r'$x$', dpi = 72, prop = prop)
+        with mpl.rc_context({'mathtext.default': 'it'}):
+            italic = MathTextParser('path').parse(r'$x$', dpi = 72, prop = prop)
+        self.assertTrue(italic is not upright)
+        self.assertTrue(getMathtextCacheInfo().misses == 6)
+        with mpl.rc_context({'mathtext.fontset': 'custom', 'mathtext.rm': 'serif'}):
+            MathTextParser('path').parse(r'$\mathrm{x}$', dpi = 72,
+                                         prop = FontProperties(size = 10.0))
+        with mpl.rc_context({'mathtext.fontset': 'custom', 'mathtext.rm': 'monospace'}):
+            MathTextParser('path').parse(r'$\mathrm{x}$', dpi = 72,
+                                         prop = FontProperties(size = 10.0))
+        self.assertTrue(getMathtextCacheInfo().misses == 8)
+        with mpl.rc_context({'mathtext.default': 'rm'}):
+            self.assertTrue(MathTextParser('path').parse(r'$x$', dpi = 72,
+                                                         prop = prop) is upright)
+
+        # the cache is size bounded
+        for k in range(20):
+            MathTextParser('path').parse(r'$x_{' + str(k) + '}$', dpi = 72, prop = prop)
+        self.assertTrue(getMathtextCacheInfo().currsize == 8)
+
+        install(maxsize = mathtextCache.MATHTEXT_CACHE_SIZE)
+        clearMathtextCache()
+
+        return None
+
+    def test_02(self):
+
+        install()
+        clearMathtextCache()
+
+        for k in range(3):
+            f, ax1 = plt.subplots(1)
+            ax1.set_xlabel(r'$p(k\, |\, \mu)$')
+            f.canvas.draw()
+            plt.close(f)
+
+        # the label is only parsed in the first figure
+        info = getMathtextCacheInfo()
+        self.assertTrue(info.misses == 1)
+        self.assertTrue(info.hits >= 2)
+
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
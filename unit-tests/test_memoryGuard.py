@@ -0,0 +1,149 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_memoryGuard.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import platform
+import tempfile
+import tracemalloc
+import unittest
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from memoryGuard import MemoryGuard
+from memoryGuard import formatMemoryReport
+from parallelSweep import run_bounded_sweep
+
+def getPid(value):
+    return value, os.getpid()
+
+def exitOnce(value, markerfile):
+    '''
+    Kills its worker on the first call.
+    '''
+    if not os.path.isfile(markerfile):
+        open(markerfile, 'w').close()
+        os._exit(1)
+    return value
+
+class MemoryGuardTest(unittest.TestCase):
+    '''
+    Tests for the memory guard (memoryGuard.py) and the bounded sweep (parallelSweep.py).
+    '''
+
+    def test_01(self):
+        '''
+        Leaked figures are reported as growth relative to the first sample.
+        '''
+        guard = MemoryGuard(every = 2, traceMalloc = True, top = 1000)
+        figures = []
+        reports = []
+        try:
+            for k in range(6):
+                f, ax1 = plt.subplots(1)
+                ax1.plot(range(10 * k))
+                figures.append(f)
+                reports.append(guard.record())
+        finally:
+            plt.close('all')
+            guard.close()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertTrue([report is not None for report in reports] ==
+                        [False, True, False, True, False, True])
+        first, last = reports[1], reports[-1]
+        self.assertTrue(first.renders == 2 and last.renders == 6)
+        self.assertTrue(last.figures - first.figures == 4)
+        self.assertTrue(first.types == [])
+        types = {name: growth for name, count, growth in last.types}
+        self.assertTrue(types['matplotlib.figure.Figure'] == 4)
+        self.assertTrue(types['matplotlib.axes._axes.Axes'] == 4)
+        self.assertTrue(not any(name.startswith('builtins.') for name in types))
+        self.assertTrue(last.rss > 0.0 and last.traced > 0.0)
+        self.assertTrue(len(last.lines) > 0)
+        self.assertTrue(guard.getGrowth() is not None)
+        self.assertTrue('matplotlib.figure.Figure' in formatMemoryReport(last))
+
+        # a tracemalloc session of the caller is left running
+        tracemalloc.start()
+        try:
+            MemoryGuard(traceMalloc = True).close()
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        return None
+
+    def test_02(self):
+        '''
+        Workers above the memory budget are replaced without losing or reordering jobs.
+        '''
+        jobs = [(getPid, {'value': k}) for k in range(4)]
+        sweep = run_bounded_sweep(jobs, n_workers = 2, memory_budget = None,
+                                  check_every = 1, verbose = False)
+        self.assertTrue([value for value, pid in sweep.results] == list(range(4)))
+        self.assertTrue(len(set(pid for value, pid in sweep.results)) <= 2)
+        self.assertTrue(sweep.recycled == 0)
+        self.assertTrue(len(sweep.reports) == 4)
+
+        sweep = run_bounded_sweep(jobs, n_workers = 2, memory_budget = 1.0,
+                                  check_every = 10, verbose = False)
+        self.assertTrue([value for value, pid in sweep.results] == list(range(4)))
+        self.assertTrue(len(set(pid for value, pid in sweep.results)) == 4)
+        self.assertTrue(sweep.recycled == 4)
+        self.assertTrue(sweep.reports == [])
+        return None
+
+    def test_03(self):
+        '''
+        The job of a worker, which died, is run once more by a fresh worker.
+        '''
+        with tempfile.TemporaryDirectory() as tmpdir:
+            markerfile = os.path.join(tmpdir, 'marker')
+            jobs = [(exitOnce, {'value': k, 'markerfile': markerfile}) for k in range(3)]
+            sweep = run_bounded_sweep(jobs, n_workers = 1, verbose = False)
+        self.assertTrue(sweep.results == [0, 1, 2])
+        self.assertTrue(sweep.recycled == 1)
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
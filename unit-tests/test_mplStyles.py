@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_mplStyles.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import sys
+import platform
+import threading
+import unittest
+import matplotlib as mpl
+
+sys.path.append('../')
+
+from mplStyles import STYLES
+from mplStyles import compileStyle
+from mplStyles import style_context
+from mplStyles import use_style
+from mpl_fonts.available_fonts import resolve_families
+
+class MplStylesTest(unittest.TestCase):
+    '''
+    Test cases for the mplStyles module.
+    '''
+
+    def test_01(self):
+
+        before = dict(mpl.rcParams)
+
+        with style_context('pcolor'):
+            self.assertTrue(mpl.rcParams['pdf.fonttype'] == 42)
+            self.assertTrue(mpl.rcParams['mathtext.fontset'] == 'cm')
+            self.assertTrue(mpl.rcParams['font.sans-serif'] == \
+                            resolve_families(['Myriad Pro']))
+            # nested contexts restore the enclosing style
+            with style_context('image'):
+                self.assertTrue(mpl.rcParams['ytick.left'] == False)
+            self.assertTrue(mpl.rcParams['ytick.left'] == before['ytick.left'])
+
+        self.assertTrue(dict(mpl.rcParams) == before)
+
+        return None
+
+    def test_02(self):
+
+        style = compileStyle('prml-schematic', {'legend.fontsize': '7.5'})
+        # the values are validated and converted at compile time
+        self.assertTrue(style['legend.fontsize'] == 7.5)
+        self.assertTrue(style['axes.linewidth'] == 1.0)
+        self.assertTrue(set(STYLES) == {'clean', 'pcolor', 'image', 'prml-schematic'})
+
+        with self.assertRaises(ValueError):
+            compileStyle('unknown')
+
+        with self.assertRaises(ValueError):
+            compileStyle('clean', {'xtick.direction': 'sideways'})
+
+        return None
+
+    def test_03(self):
+
+        @use_style('clean', {'legend.fontsize': 5.0})
+        def plot():
+            return mpl.rcParams['legend.fontsize']
+
+        fontsize = mpl.rcParams['legend.fontsize']
+
+        results = []
+        threads = [threading.Thread(target = lambda: results.append(plot()))
+                   for k in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(results == [5.0] * 8)
+        self.assertTrue(mpl.rcParams['legend.fontsize'] == fontsize)
+
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
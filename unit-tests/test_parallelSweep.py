@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_parallelSweep.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import time
+import platform
+import unittest
+
+sys.path.append('../')
+
+from parallelSweep import run_sweep
+
+# set by the worker initializer
+_initialized = None
+
+def setInitialized(value):
+    global _initialized
+    _initialized = value
+
+def getPid(value, delay = 0.0):
+    '''
+    Returns the job value together with the id of the executing process.
+    '''
+    time.sleep(delay)
+    return value, os.getpid(), _initialized
+
+class ParallelSweepTest(unittest.TestCase):
+    '''
+    Tests for the run_sweep process pool driver (parallelSweep.py).
+    '''
+
+    def test_01(self):
+        '''
+        The results are returned in the order of the jobs, also when the earlier jobs
+        finish last.
+        '''
+        n_jobs = 6
+        jobs = [(getPid, {'value': k, 'delay': 0.05 * (n_jobs - k)})
+                for k in range(n_jobs)]
+        results = run_sweep(jobs, n_workers = 3, initializer = setInitialized,
+                            initargs = ('worker',))
+        self.assertTrue([value for value, pid, initialized in results] ==
+                        list(range(n_jobs)))
+        self.assertTrue(all(pid != os.getpid() for value, pid, initialized in results))
+        self.assertTrue(len(set(pid for value, pid, initialized in results)) <= 3)
+        self.assertTrue(all(initialized == 'worker'
+                            for value, pid, initialized in results))
+        return None
+
+    def test_02(self):
+        '''
+        For n_workers = 1 the jobs are run serially in the calling process.
+        '''
+        jobs = [(getPid, {'value': k}) for k in range(4)]
+        results = run_sweep(jobs, n_workers = 1)
+        self.assertTrue([value for value, pid, initialized in results] == list(range(4)))
+        self.assertTrue(all(pid == os.getpid() for value, pid, initialized in results))
+        self.assertTrue(run_sweep([], n_workers = 4) == [])
+        return None
+
+    def test_03(self):
+        '''
+        With max_tasks_per_child = 1 every job runs in its own worker process, also for
+        n_workers = 1.
+        '''
+        jobs = [(getPid, {'value': k}) for k in range(4)]
+        results = run_sweep(jobs, n_workers = 1, max_tasks_per_child = 1,
+                            initializer = setInitialized, initargs = ('worker',))
+        pids = [pid for value, pid, initialized in results]
+        self.assertTrue([value for value, pid, initialized in results] == list(range(4)))
+        self.assertTrue(len(set(pids)) == 4)
+        self.assertTrue(os.getpid() not in pids)
+        self.assertTrue(all(initialized == 'worker'
+                            for value, pid, initialized in results))
+        return None
+
+    def test_04(self):
+        '''
+        A single job with n_workers > 1 still runs in an initialized worker process.
+        '''
+        results = run_sweep([(getPid, {'value': 0})], n_workers = 4,
+                            initializer = setInitialized, initargs = ('worker',))
+        value, pid, initialized = results[0]
+        self.assertTrue(value == 0)
+        self.assertTrue(pid != os.getpid())
+        self.assertTrue(initialized == 'worker')
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_pointAggregation.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import io
+import sys
+import platform
+import unittest
+import warnings
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from pointAggregation import aggregatePoints
+from pointAggregation import spreadImage
+from pointAggregation import aggregated_scatter
+from pointAggregation import AggregatedPoints
+
+class PointAggregationTest(unittest.TestCase):
+    '''
+    Tests for the aggregated scatter rendering (pointAggregation.py).
+    '''
+
+    def setUp(self):
+        rng = np.random.RandomState(123456789)
+        self.X = rng.normal(size = (20000, 2))
+
+    def test_01(self):
+        '''
+        The pixel counts equal np.histogram2d on the unit pixel grid.
+        '''
+        px = (self.X[:, 0] + 3.0) * 10.0
+        py = (self.X[:, 1] + 3.0) * 10.0
+        counts = aggregatePoints(px, py, (60, 60))
+        reference, _, _ = np.histogram2d(py, px, bins = [np.arange(61), np.arange(61)])
+        self.assertTrue(np.array_equal(counts, reference))
+
+        sums = aggregatePoints(px, py, (60, 60), weights = np.ones(len(px)))
+        self.assertTrue(np.array_equal(sums, reference))
+
+        # non-finite coordinates are dropped without warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            counts = aggregatePoints(np.array([np.nan, np.inf, 1.5, 1.0e30]),
+                                     np.array([1.0, 1.0, -np.inf, 1.0]), (4, 4))
+        self.assertTrue(counts.sum() == 0.0)
+
+        # a single point covers the disc of radius 2 (13 pixels)
+        image = np.zeros((9, 9))
+        image[4, 4] = 1.0
+        self.assertTrue(spreadImage(image, 2.0).sum() == 13.0)
+        return None
+
+    def test_02(self):
+        '''
+        Below the threshold the scatter is unchanged, above the threshold an empty
+        legend proxy and the aggregated image are added.
+        '''
+        f, ax1 = plt.subplots(1)
+        p = aggregated_scatter(ax1, self.X[:, 0], self.X[:, 1], s = 12.0,
+                               facecolor = 'C0', label = 'scatter')
+        self.assertTrue(len(p.get_offsets()) == len(self.X))
+        plt.close(f)
+
+        f, ax1 = plt.subplots(1)
+        p = aggregated_scatter(ax1, self.X[:, 0], self.X[:, 1], threshold = 1000,
+                               s = 12.0, facecolor = 'C0', alpha = 0.5,
+                               label = 'scatter')
+        self.assertTrue(len(p.get_offsets()) == 0)
+        artists = [a for a in ax1.artists if isinstance(a, AggregatedPoints)]
+        self.assertTrue(len(artists) == 1)
+        leg = ax1.legend()
+        self.assertTrue([t.get_text() for t in leg.get_texts()] == ['scatter'])
+        self.assertTrue(ax1.get_xlim()[0] < self.X[:, 0].min())
+
+        f.canvas.draw()
+        image, magnification = artists[0].getRGBA(f.canvas.get_renderer())
+        alphas = np.unique(image[:, :, 3])
+        # empty pixels are transparent, a single marker has alpha 0.5
+        self.assertTrue(alphas[0] == 0 and 128 in alphas)
+        for fmt in ['pdf', 'svg']:
+            f.savefig(io.BytesIO(), format = fmt)
+        plt.close(f)
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
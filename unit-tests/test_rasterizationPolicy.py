@@ -0,0 +1,123 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_rasterizationPolicy.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import io
+import sys
+import platform
+import unittest
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from mplUtils import applyRasterizationPolicy
+from mplUtils import RASTERIZE_CELL_THRESHOLD
+
+class RasterizationPolicyTest(unittest.TestCase):
+    '''
+    Tests for the applyRasterizationPolicy function (mplUtils.py).
+    '''
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_01(self):
+        '''
+        A pcolormesh is rasterized only above the threshold number of cells.
+        '''
+        f, ax1 = plt.subplots(1)
+        mesh = ax1.pcolormesh(np.zeros((8, 8)))
+        self.assertTrue(applyRasterizationPolicy(mesh, threshold = 63))
+        self.assertTrue(mesh.get_rasterized())
+        self.assertFalse(applyRasterizationPolicy(mesh, threshold = 64))
+        self.assertFalse(mesh.get_rasterized())
+        self.assertFalse(applyRasterizationPolicy(mesh, threshold = 100))
+        self.assertFalse(mesh.get_rasterized())
+        return None
+
+    def test_02(self):
+        '''
+        The cells of an image exclude its color channels and the default threshold
+        is 64 x 64 cells.
+        '''
+        f, ax1 = plt.subplots(1)
+        image = ax1.imshow(np.zeros((64, 64, 3)))
+        self.assertFalse(applyRasterizationPolicy(image))
+        self.assertFalse(image.get_rasterized())
+        image = ax1.imshow(np.zeros((65, 64)))
+        self.assertTrue(65 * 64 > RASTERIZE_CELL_THRESHOLD)
+        self.assertTrue(applyRasterizationPolicy(image))
+        self.assertTrue(image.get_rasterized())
+        return None
+
+    def test_03(self):
+        '''
+        Threshold None never rasterizes and leaves the artist unchanged.
+        '''
+        f, ax1 = plt.subplots(1)
+        mesh = ax1.pcolormesh(np.zeros((128, 128)))
+        mesh.set_rasterized(True)
+        self.assertFalse(applyRasterizationPolicy(mesh, threshold = None))
+        self.assertTrue(mesh.get_rasterized())
+        return None
+
+    def test_04(self):
+        '''
+        A rasterized mesh is embedded as a single bitmap in vector outputs.
+        '''
+        svgs = []
+        for threshold in [1000, 10]:
+            f, ax1 = plt.subplots(1)
+            mesh = ax1.pcolormesh(np.arange(100.0).reshape(10, 10))
+            applyRasterizationPolicy(mesh, threshold = threshold)
+            buffer = io.StringIO()
+            f.savefig(buffer, format = 'svg')
+            svgs.append(buffer.getvalue())
+            plt.close(f)
+        self.assertTrue('<image' not in svgs[0])
+        self.assertTrue(svgs[1].count('<image') == 1)
+        self.assertTrue(len(svgs[1]) < len(svgs[0]))
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,202 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_renderCache.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import shutil
+import platform
+import tempfile
+import unittest
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+import renderCache
+from renderCache import render_cache
+from renderCache import getRenderKey
+from renderCache import getRenderCacheInfo
+from renderCache import clearRenderCache
+from renderCache import invalidate
+from renderCache import getValueKey
+
+_calls = []
+
+@render_cache()
+def plot_field(Z, zFormat, outname, outdir, savePNG = True, datestamp = False):
+    _calls.append(outname)
+    f, ax1 = plt.subplots(1, figsize = (1.0, 1.0))
+    ax1.imshow(Z, vmin = zFormat[0], vmax = zFormat[1])
+    if savePNG:
+        f.savefig(os.path.join(outdir, outname) + '.png', dpi = 20)
+    plt.close(f)
+    return outname
+
+class RenderCacheTest(unittest.TestCase):
+    '''
+    Tests for the on-disk render cache (renderCache.py).
+    '''
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.outdir = os.path.join(self.tmpdir, 'out')
+        os.makedirs(self.outdir)
+        self.settings = dict(renderCache._settings)
+        renderCache.enable(cachedir = os.path.join(self.tmpdir, 'cache'))
+        clearRenderCache()
+        del _calls[:]
+
+    def tearDown(self):
+        renderCache._settings.update(self.settings)
+        shutil.rmtree(self.tmpdir, ignore_errors = True)
+
+    def test_01(self):
+        '''
+        The cache key depends on the array content and on the rcParams in effect,
+        but not on the output directory.
+        '''
+        Z = np.arange(16.0).reshape(4, 4)
+        key = getRenderKey(plot_field, (Z, (0.0, 15.0), 'a', 'dir1'), {})
+
+        self.assertTrue(key == getRenderKey(plot_field, (Z.copy(), (0.0, 15.0), 'a',
+                                                         'dir2'), {}))
+        self.assertTrue(key != getRenderKey(plot_field, (Z.T, (0.0, 15.0), 'a',
+                                                         'dir1'), {}))
+        self.assertTrue(key != getRenderKey(plot_field, (Z, (0.0, 10.0), 'a',
+                                                         'dir1'), {}))
+        with mpl.rc_context({'image.cmap': 'gray'}):
+            self.assertTrue(key != getRenderKey(plot_field, (Z, (0.0, 15.0), 'a',
+                                                             'dir1'), {}))
+        # arguments without a value representation have no key
+        self.assertTrue(getRenderKey(plot_field, (object(), (0.0, 15.0), 'a', 'dir1'),
+                                     {}) is None)
+        return None
+
+    def test_02(self):
+        '''
+        A repeated call restores the cached file without rendering.
+        '''
+        Z = np.random.RandomState(123).rand(8, 8)
+
+        outname = plot_field(Z, (0.0, 1.0), 'field', self.outdir)
+        path = os.path.join(self.outdir, outname + '.png')
+        with open(path, 'rb') as fh:
+            reference = fh.read()
+        os.remove(path)
+
+        self.assertTrue(plot_field(Z, (0.0, 1.0), 'field', self.outdir) == outname)
+        self.assertTrue(_calls == ['field'])
+        with open(path, 'rb') as fh:
+            self.assertTrue(fh.read() == reference)
+
+        info = getRenderCacheInfo()
+        self.assertTrue(info.hits == 1)
+        self.assertTrue(info.misses == 1)
+        self.assertTrue(info.entries == 1)
+        self.assertTrue(info.bytes == len(reference))
+
+        # invalidated entries are rendered again
+        self.assertTrue(invalidate(plot_field) == 1)
+        plot_field(Z, (0.0, 1.0), 'field', self.outdir)
+        self.assertTrue(_calls == ['field', 'field'])
+        return None
+
+    def test_03(self):
+        '''
+        Least recently used entries are evicted beyond maxbytes.
+        '''
+        Z = np.random.RandomState(123).rand(8, 8)
+        plot_field(Z, (0.0, 1.0), 'field_0', self.outdir)
+        size = getRenderCacheInfo().bytes
+        renderCache.enable(maxbytes = 2 * size + size // 2)
+
+        plot_field(Z, (0.0, 0.5), 'field_1', self.outdir)
+        # make field_1 the least recently used entry
+        entries = sorted(renderCache._listEntries(renderCache._settings['cachedir']),
+                         key = lambda item: item[3]['outname'])
+        os.utime(os.path.join(entries[1][2], 'entry.json'), (0, 0))
+        plot_field(Z, (0.0, 0.2), 'field_2', self.outdir)
+
+        remaining = sorted(item[3]['outname'] for item in
+                           renderCache._listEntries(renderCache._settings['cachedir']))
+        self.assertTrue(remaining == ['field_0', 'field_2'])
+        return None
+
+    def test_04(self):
+        '''
+        The disabled cache simply calls the plot function.
+        '''
+        renderCache.disable()
+        Z = np.zeros((4, 4))
+        plot_field(Z, (0.0, 1.0), 'field', self.outdir)
+        plot_field(Z, (0.0, 1.0), 'field', self.outdir)
+        self.assertTrue(_calls == ['field', 'field'])
+        self.assertTrue(getRenderCacheInfo().entries == 0)
+        return None
+
+    def test_05(self):
+        '''
+        Lambdas and closures are hashed by their code and closure, and the key covers
+        the modules of the repository used by the plot function.
+        '''
+        def getScaled(factor):
+            return lambda x: factor * x
+
+        self.assertTrue(getValueKey(lambda x: np.sin(x)) == getValueKey(lambda x: np.sin(x)))
+        self.assertTrue(getValueKey(lambda x: np.sin(x)) != getValueKey(lambda x: np.cos(x)))
+        self.assertTrue(getValueKey(lambda x: 2.0 * x) != getValueKey(lambda x: 3.0 * x))
+        self.assertTrue(getValueKey(getScaled(2.0)) == getValueKey(getScaled(2.0)))
+        self.assertTrue(getValueKey(getScaled(2.0)) != getValueKey(getScaled(3.0)))
+        self.assertTrue(getValueKey(np.sin) == getValueKey(np.sin))
+
+        Z = np.zeros((4, 4))
+        plot_field(Z, (0.0, 1.0), 'field', self.outdir)
+        plot_field(Z, (0.0, 1.0), 'field', self.outdir)
+        self.assertTrue(_calls == ['field'])
+
+        modules = renderCache._getRepoModules(plot_field.__globals__)
+        self.assertTrue(renderCache.__file__ in modules)
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
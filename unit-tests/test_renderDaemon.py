@@ -0,0 +1,203 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_renderDaemon.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import json
+import shutil
+import platform
+import tempfile
+import threading
+import unittest
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from renderClient import encodeMessage
+from renderClient import submit
+from renderClient import ping
+from renderClient import shutdown
+from renderClient import checkOwner
+from renderDaemon import RenderServer
+from renderDaemon import makeSocketDir
+from batchJobs import evaluateArguments
+
+TEMPLATE = '''
+import os
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+
+def plot_line(Y, outname, outdir):
+    mpl.rcParams['lines.linewidth'] = 7.0
+    f, ax1 = plt.subplots(1)
+    ax1.plot(Y)
+    f.savefig(os.path.join(outdir, outname + '.png'), dpi = 20)
+    return outname
+
+def plot_object():
+    return object()
+
+def plot_failing():
+    raise ValueError('{}')
+'''
+
+def writeTemplate(path, message):
+    with open(path, 'w') as fh:
+        fh.write(TEMPLATE.format(message))
+
+class RenderDaemonTest(unittest.TestCase):
+    '''
+    Tests for the render daemon (renderDaemon.py) and its client (renderClient.py).
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.template = os.path.join(cls.tmpdir, 'template.py')
+        writeTemplate(cls.template, 'first version')
+        cls.socketPath = os.path.join(cls.tmpdir, 'render.sock')
+        cls.server = RenderServer(cls.socketPath, roots = (cls.tmpdir,),
+                                  templates = (cls.template,))
+        cls.thread = threading.Thread(target = cls.server.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown(cls.socketPath)
+        cls.thread.join()
+        cls.server.server_close()
+        shutil.rmtree(cls.tmpdir, ignore_errors = True)
+
+    def test_01(self):
+        '''
+        Status of the daemon and encoding of numpy arrays.
+        '''
+        status = ping(self.socketPath)
+        self.assertTrue(status['ok'] and status['pid'] == os.getpid())
+        self.assertTrue(ping(os.path.join(self.tmpdir, 'missing.sock')) is None)
+
+        kwargs = {'X': np.arange(6.0).reshape(2, 3), 'n': np.int64(3),
+                  'xFormat': (0.0, 1.0), 'labels': ['a', 'b']}
+        decoded = evaluateArguments(json.loads(encodeMessage(kwargs)), self.tmpdir)
+        self.assertTrue(np.array_equal(decoded['X'], kwargs['X']))
+        self.assertTrue(decoded['X'].dtype == np.float64)
+        self.assertTrue(decoded['n'] == 3)
+        self.assertTrue(decoded['xFormat'] == [0.0, 1.0])
+        self.assertTrue(decoded['labels'] == ['a', 'b'])
+        return None
+
+    def test_02(self):
+        '''
+        Render jobs write to the output directory relative to the client's directory,
+        without leaking rcParams or figures.
+        '''
+        linewidth = mpl.rcParams['lines.linewidth']
+        os.makedirs(os.path.join(self.tmpdir, 'out'), exist_ok = True)
+        jobs = [{'template': self.template, 'function': 'plot_line',
+                 'kwargs': {'Y': np.arange(n), 'outname': 'line_{}'.format(n),
+                            'outdir': 'out'}} for n in [3, 4]]
+        responses = submit(jobs, self.socketPath, cwd = self.tmpdir)
+        self.assertTrue([response['result'] for response in responses] ==
+                        ['line_3', 'line_4'])
+        self.assertTrue(all(response['seconds'] > 0.0 for response in responses))
+        for n in [3, 4]:
+            self.assertTrue(os.path.isfile(os.path.join(self.tmpdir, 'out',
+                                                        'line_{}.png'.format(n))))
+        self.assertTrue(mpl.rcParams['lines.linewidth'] == linewidth)
+        self.assertTrue(plt.get_fignums() == [])
+
+        response = submit([{'template': self.template, 'function': 'plot_object',
+                            'kwargs': {}}], self.socketPath)[0]
+        self.assertTrue(response['ok'] and response['result'].startswith('<object'))
+        return None
+
+    def test_03(self):
+        '''
+        Failing jobs are reported without stopping the daemon and modified templates
+        are imported again.
+        '''
+        job = {'template': self.template, 'function': 'plot_failing', 'kwargs': {}}
+        outside = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'test_renderDaemon.py')
+        responses = submit([job,
+                            dict(job, function = 'missing'),
+                            dict(job, template = outside)], self.socketPath)
+        self.assertTrue([response['ok'] for response in responses] == [False] * 3)
+        self.assertTrue(responses[0]['error'] == 'ValueError: first version')
+        self.assertTrue('ValueError' in responses[0]['traceback'])
+        self.assertTrue(responses[1]['error'].startswith('AttributeError'))
+        self.assertTrue(responses[2]['error'].endswith('is not served.'))
+
+        mtime = os.stat(self.template).st_mtime_ns
+        writeTemplate(self.template, 'second version')
+        os.utime(self.template, ns = (mtime + 10 ** 9, mtime + 10 ** 9))
+        response = submit([job], self.socketPath)[0]
+        self.assertTrue(response['error'] == 'ValueError: second version')
+        self.assertTrue(ping(self.socketPath)['failed'] >= 4)
+        return None
+
+    def test_04(self):
+        '''
+        Socket directories are private and sockets of other users are refused.
+        '''
+        socketPath = os.path.join(self.tmpdir, 'private', 'render.sock')
+        makeSocketDir(socketPath)
+        self.assertTrue(os.stat(os.path.dirname(socketPath)).st_mode & 0o777 == 0o700)
+
+        checkOwner(self.socketPath)
+        if hasattr(os, 'getuid') and os.getuid() == 0:
+            # (changing the owner requires root privileges)
+            path = os.path.join(self.tmpdir, 'foreign.sock')
+            open(path, 'w').close()
+            os.chown(path, 12345, 12345)
+            with self.assertRaises(PermissionError):
+                checkOwner(path)
+            self.assertTrue(ping(path) is None)
+            os.chown(os.path.dirname(socketPath), 12345, 12345)
+            with self.assertRaises(PermissionError):
+                makeSocketDir(socketPath)
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
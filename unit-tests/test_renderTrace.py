@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_renderTrace.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import tracemalloc
+import unittest
+import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+import renderTrace
+from renderTrace import trace_stage
+from renderTrace import traced
+from renderTrace import render_trace
+from renderTrace import getTraceEvents
+from renderTrace import getStageSummary
+from renderTrace import save_trace
+
+SAVEFIG = mpl.figure.Figure.savefig
+SET_TICKS = mpl.axis.Axis.set_ticks
+
+@traced()
+def plotMesh(outdir):
+    f, ax1 = plt.subplots(1)
+    with trace_stage('data'):
+        Z = np.arange(12.0).reshape(3, 4)
+    mesh = ax1.pcolormesh(Z)
+    f.colorbar(mesh)
+    ax1.set_xticks([0.0, 2.0, 4.0])
+    f.savefig(os.path.join(outdir, 'mesh.png'))
+    plt.close(f)
+    return 'mesh'
+
+class RenderTraceTest(unittest.TestCase):
+    '''
+    Tests for the render stage instrumentation (renderTrace.py).
+    '''
+
+    def test_01(self):
+        '''
+        The disabled trace neither patches matplotlib nor records stages.
+        '''
+        self.assertTrue(trace_stage('a') is trace_stage('b'))
+        with tempfile.TemporaryDirectory() as outdir:
+            self.assertTrue(plotMesh(outdir) == 'mesh')
+        self.assertTrue(getTraceEvents() == [])
+        self.assertTrue(mpl.figure.Figure.savefig is SAVEFIG)
+        self.assertTrue(mpl.axis.Axis.set_ticks is SET_TICKS)
+        return None
+
+    def test_02(self):
+        '''
+        Stages of the plot function and of the matplotlib entry points are recorded,
+        where the self times exclude the nested stages.
+        '''
+        with tempfile.TemporaryDirectory() as outdir:
+            with render_trace() as trace:
+                with trace_stage('outer'):
+                    time.sleep(0.02)
+                    with trace_stage('inner'):
+                        time.sleep(0.02)
+                plotMesh(outdir)
+        self.assertTrue(mpl.figure.Figure.savefig is SAVEFIG)
+        self.assertTrue(mpl.axis.Axis.set_ticks is SET_TICKS)
+
+        events = {event.name: event for event in trace.events}
+        for name in ['plotMesh', 'data', 'figure', 'axes', 'pcolormesh', 'colorbar',
+                     'ticks', 'savefig', 'draw']:
+            self.assertTrue(name in events)
+        self.assertTrue(events['outer'].wall >= events['inner'].wall + 0.02e9)
+        self.assertTrue(events['outer'].self < events['outer'].wall - 0.02e9)
+        self.assertTrue(events['inner'].self == events['inner'].wall)
+        self.assertTrue(events['savefig'].wall >= events['draw'].wall)
+
+        summary = {stage.name: stage for stage in getStageSummary(trace.events)}
+        self.assertTrue(summary['plotMesh'].calls == 1)
+        self.assertTrue(summary['ticks'].calls > 1)
+        self.assertTrue(abs(sum(stage.self for stage in summary.values()) -
+                            (events['outer'].wall + events['plotMesh'].wall) / 1.0e9)
+                        < 1.0e-6)
+        return None
+
+    def test_03(self):
+        '''
+        Chrome trace export (including the traced bytes).
+        '''
+        with tempfile.TemporaryDirectory() as outdir:
+            path = os.path.join(outdir, 'traces', 'trace_{pid}.json')
+            with render_trace(path, memory = True) as trace:
+                with trace_stage('allocate', 'test'):
+                    X = np.ones(10 ** 6)
+            tracefile = os.path.join(outdir, 'traces', 'trace_{}.json'.format(os.getpid()))
+            with open(tracefile, 'r') as fh:
+                traceEvents = json.load(fh)['traceEvents']
+            self.assertTrue(save_trace(os.path.join(outdir, 'trace.json'),
+                                       trace.events).endswith('trace.json'))
+        stages = [event for event in traceEvents if event['ph'] == 'X']
+        self.assertTrue(len(stages) == 1)
+        self.assertTrue(stages[0]['name'] == 'allocate')
+        self.assertTrue(stages[0]['cat'] == 'test')
+        self.assertTrue(stages[0]['ts'] == 0.0)
+        self.assertTrue(stages[0]['dur'] > 0.0)
+        self.assertTrue(stages[0]['args']['allocated_bytes'] >= X.nbytes)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        # a tracemalloc session of the caller is left running
+        tracemalloc.start()
+        try:
+            renderTrace.enable(memory = True)
+            renderTrace.disable()
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
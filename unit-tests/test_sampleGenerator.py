@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_sampleGenerator.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import shutil
+import platform
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.append('../')
+
+from sampleStore import load_samples
+from sampleGenerator import generate_samples
+from sampleGenerator import getChunkBounds
+from sampleGenerator import correlatedNormalChunk
+from sampleGenerator import independentNormalChunk
+
+PARAMS = {'mu1': 87.25, 'sigma1': 8.124, 'mu2': 125.75, 'sigma2': 11.25}
+
+class SampleGeneratorTest(unittest.TestCase):
+    '''
+    Tests for the chunked parallel sample generation (sampleGenerator.py).
+    '''
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors = True)
+
+    def test_01(self):
+        self.assertTrue(getChunkBounds(25, 10) == [(0, 10), (10, 20), (20, 25)])
+        self.assertTrue(getChunkBounds(0, 10) == [])
+        return None
+
+    def test_02(self):
+        '''
+        The samples are bit-identical for any number of worker processes.
+        '''
+        paths = []
+        for n_workers in [1, 3]:
+            basename = os.path.join(self.tmpdir, 'samples_{}'.format(n_workers))
+            paths.append(generate_samples(basename, 25000, correlatedNormalChunk,
+                                          seed = 987654321, params = PARAMS,
+                                          chunksize = 4000, n_workers = n_workers))
+
+        X1, X3 = load_samples(paths[0]), load_samples(paths[1])
+        self.assertTrue(X1.shape == (25000, 2))
+        self.assertTrue(np.array_equal(X1, X3))
+        # fully correlated with the requested mean and standard deviation
+        self.assertTrue(np.corrcoef(X1.T)[0, 1] > 1.0 - 1.0e-12)
+        self.assertTrue(abs(np.mean(X1[:, 0]) - PARAMS['mu1']) < 0.25)
+        self.assertTrue(abs(np.std(X1[:, 1]) - PARAMS['sigma2']) < 0.25)
+        return None
+
+    def test_03(self):
+        '''
+        Different seeds and samplers yield different samples.
+        '''
+        basename = os.path.join(self.tmpdir, 'samples')
+        X = load_samples(generate_samples(basename + '_a', 5000, independentNormalChunk,
+                                          seed = 1, params = PARAMS, n_workers = 1))
+        Y = load_samples(generate_samples(basename + '_b', 5000, independentNormalChunk,
+                                          seed = 2, params = PARAMS, n_workers = 1))
+        self.assertFalse(np.array_equal(X, Y))
+        self.assertTrue(abs(np.corrcoef(X.T)[0, 1]) < 0.05)
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_sampleStore.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import shutil
+import platform
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.append('../')
+
+from sampleStore import save_samples
+from sampleStore import load_samples
+from sampleStore import create_samples_file
+from sampleStore import iter_sample_chunks
+
+class SampleStoreTest(unittest.TestCase):
+    '''
+    Tests for the binary sample storage (sampleStore.py).
+    '''
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.basename = os.path.join(self.tmpdir, 'samples')
+        self.samples = np.random.RandomState(123).normal(size = (1000, 2))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors = True)
+
+    def test_01(self):
+        '''
+        npy samples are loaded as read-only memory map.
+        '''
+        path = save_samples(self.basename, self.samples)
+        self.assertTrue(path == self.basename + '.npy')
+
+        X = load_samples(self.basename)
+        self.assertTrue(isinstance(X, np.memmap))
+        self.assertFalse(X.flags.writeable)
+        self.assertTrue(np.array_equal(X, self.samples))
+        self.assertTrue(np.array_equal(load_samples(path), self.samples))
+        return None
+
+    def test_02(self):
+        '''
+        Chunked npz samples and text samples (with conversion to npy).
+        '''
+        save_samples(self.basename, self.samples, fmt = 'npz', chunksize = 300)
+        self.assertTrue(np.array_equal(load_samples(self.basename), self.samples))
+        chunks = list(iter_sample_chunks(self.basename, chunksize = 200))
+        self.assertTrue([len(chunk) for chunk in chunks] == [200, 100] * 3 + [100])
+        self.assertTrue(np.array_equal(np.concatenate(chunks), self.samples))
+        os.remove(self.basename + '.npz')
+
+        save_samples(self.basename, self.samples, fmt = 'txt')
+        X = load_samples(self.basename, convert = True)
+        self.assertTrue(np.allclose(X, self.samples, rtol = 0.0, atol = 1.0e-8))
+        self.assertTrue(os.path.isfile(self.basename + '.npy'))
+        self.assertTrue(isinstance(X, np.memmap))
+        return None
+
+    def test_03(self):
+        '''
+        Block-wise writing into a memory mapped samples file.
+        '''
+        X = create_samples_file(self.basename, self.samples.shape)
+        for start in range(0, len(self.samples), 256):
+            X[start:start + 256] = self.samples[start:start + 256]
+        X.flush()
+        del X
+
+        chunks = list(iter_sample_chunks(self.basename, chunksize = 256))
+        self.assertTrue(len(chunks) == 4)
+        self.assertTrue(np.array_equal(np.concatenate(chunks), self.samples))
+
+        with self.assertRaises(FileNotFoundError):
+            load_samples(os.path.join(self.tmpdir, 'missing'))
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_syntheticFields.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+import sys
+import platform
+import numpy as np
+import unittest
+
+sys.path.append('../')
+
+from syntheticFields import getRampField
+from syntheticFields import getGaussianField
+from syntheticFields import getProductField
+from syntheticFields import getRandomField
+
+class SyntheticFieldsTest(unittest.TestCase):
+    '''
+    Test cases for the syntheticFields module.
+    The vectorized fields are compared against the nested loop reference implementations
+    previously used in the template scripts.
+    '''
+
+    def test_ramp_field_01(self):
+
+        n_pxs_x, n_pxs_y = 7, 4
+        xVals = np.linspace(0.0, 6.0, n_pxs_x)
+        yVals = np.linspace(0.0, 3.0, n_pxs_y)
+
+        zVals_ref = np.zeros((n_pxs_x, n_pxs_y))
+        for j in range(n_pxs_y):     # iterate over y values
+            for i in range(n_pxs_x): # iterate over x values
+                zVals_ref[i, j] = 0.2 * xVals[i]
+
+        zVals = getRampField(xVals, yVals, slope = 0.2)
+
+        self.assertTrue(zVals.shape == (n_pxs_x, n_pxs_y))
+        self.assertTrue(np.array_equal(zVals, zVals_ref))
+
+        # the returned field has to be writeable (e.g. zVals -= 1.0 / 3.0)
+        zVals -= 1.0 / 3.0
+        self.assertTrue(np.allclose(zVals, zVals_ref - 1.0 / 3.0))
+
+        return None
+
+    def test_ramp_field_02(self):
+
+        xVals = np.arange(3.0)
+        yVals = np.arange(5.0)
+
+        zVals = getRampField(xVals, yVals, slope = 2.0, offset = 1.0, axis = 'y',
+                             indexing = 'xy')
+
+        self.assertTrue(zVals.shape == (5, 3))
+        self.assertTrue(np.array_equal(zVals[:, 0], 1.0 + 2.0 * yVals))
+        self.assertTrue(np.array_equal(zVals[:, 2], 1.0 + 2.0 * yVals))
+
+        with self.assertRaises(ValueError):
+            getRampField(xVals, yVals, axis = 'z')
+
+        with self.assertRaises(ValueError):
+            getRampField(xVals, yVals, indexing = 'ji')
+
+        return None
+
+    def test_gaussian_field(self):
+
+        xVals = np.linspace(-2.0, 2.0, 9)
+        yVals = np.linspace(-1.0, 3.0, 5)
+
+        zVals_ref = np.zeros((len(xVals), len(yVals)))
+        for j in range(len(yVals)):
+            for i in range(len(xVals)):
+                zVals_ref[i, j] = 3.0 * np.exp(- (xVals[i] - 0.5) ** 2 / (2.0 * 0.7 ** 2)
+                                               - (yVals[j] - 1.0) ** 2 / (2.0 * 1.2 ** 2))
+
+        zVals = getGaussianField(xVals, yVals, x0 = 0.5, y0 = 1.0,
+                                 sigma_x = 0.7, sigma_y = 1.2, amplitude = 3.0)
+
+        self.assertTrue(zVals.shape == zVals_ref.shape)
+        self.assertTrue(np.allclose(zVals, zVals_ref))
+
+        return None
+
+    def test_product_field(self):
+
+        n_datapoints = 11
+        xVals = np.logspace(1, 3, n_datapoints)
+        yVals = np.logspace(-3, -1, n_datapoints + 2)
+
+        Z_ref = np.zeros((len(yVals), len(xVals)))
+        for i in range(len(yVals)):
+            for j in range(len(xVals)):
+                Z_ref[i, j] = np.sin(np.pi * np.log(yVals[i])) * \
+                              np.cos(np.pi * np.log(xVals[j]) - np.pi / 2.0)
+
+        Z = getProductField(xVals, yVals,
+                            fx = lambda x: np.cos(np.pi * np.log(x) - np.pi / 2.0),
+                            fy = lambda y: np.sin(np.pi * np.log(y)),
+                            indexing = 'xy')
+
+        self.assertTrue(Z.shape == Z_ref.shape)
+        self.assertTrue(np.allclose(Z, Z_ref))
+
+        return None
+
+    def test_random_field(self):
+
+        img_a = getRandomField(16, 8, seed = 123456789)
+        img_b = getRandomField(16, 8, seed = 123456789)
+
+        self.assertTrue(img_a.shape == (16, 8))
+        self.assertTrue(np.array_equal(img_a, img_b))
+        self.assertTrue(np.all(img_a >= 0.0) and np.all(img_a < 1.0))
+
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
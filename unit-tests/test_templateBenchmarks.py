@@ -0,0 +1,180 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_templateBenchmarks.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import os
+import sys
+import platform
+import tempfile
+import unittest
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.append('../')
+
+from templateBenchmarks import BENCHMARK_STAGES
+from templateBenchmarks import BenchmarkCase
+from templateBenchmarks import measure
+from templateBenchmarks import run_benchmarks
+from templateBenchmarks import save_baseline
+from templateBenchmarks import load_baseline
+from templateBenchmarks import compareResults
+
+TEMPLATE = '''
+import os
+import matplotlib as mpl
+mpl.use('Agg')
+import matplotlib.pyplot as plt
+
+def plot_line(n, outname, outdir):
+    f, ax1 = plt.subplots(1)
+    ax1.plot(range(n))
+    f.savefig(os.path.join(outdir, outname + '.png'))
+    plt.close(f)
+    return outname
+
+def plot_failing(n, outname, outdir):
+    raise ValueError('n = {}'.format(n))
+'''
+
+def plotLine(n, outdir):
+    f, ax1 = plt.subplots(1)
+    ax1.plot(range(n))
+    f.savefig(os.path.join(outdir, 'line.png'))
+    plt.close(f)
+    return None
+
+def getLineKwargs(size, outdir):
+    return {'n': size, 'outname': 'line_{}'.format(size), 'outdir': outdir}
+
+def getResult(time, rss = 100.0):
+    result = {stage: time for stage in BENCHMARK_STAGES}
+    result['peakRSS'] = rss
+    return result
+
+class TemplateBenchmarksTest(unittest.TestCase):
+    '''
+    Tests for the template benchmarks (templateBenchmarks.py).
+    '''
+
+    def test_01(self):
+        '''
+        All stages are measured and the setup, draw and save stages add up to the total
+        (apart from the separate draw).
+        '''
+        with tempfile.TemporaryDirectory() as outdir:
+            times = measure(plotLine, {'n': 10, 'outdir': outdir}, repeat = 2)
+            self.assertTrue(os.path.isfile(os.path.join(outdir, 'line.png')))
+        self.assertTrue(sorted(times.keys()) == sorted(BENCHMARK_STAGES))
+        for stage in BENCHMARK_STAGES:
+            self.assertTrue(times[stage] > 0.0)
+        self.assertTrue(times['setup'] + times['save'] <= times['total'] + 1.0e-3)
+        # savefig is restored
+        self.assertTrue(mpl.figure.Figure.savefig.__name__ == 'savefig')
+        self.assertTrue(mpl.figure.Figure.savefig.__module__ == 'matplotlib.figure')
+        return None
+
+    def test_02(self):
+        '''
+        Regressions beyond the tolerances, new failures and no regressions otherwise.
+        '''
+        baseline = {'results': {'a[1]': getResult(1.0),
+                                'b[1]': getResult(0.001),
+                                'c[1]': getResult(1.0),
+                                'd[1]': {'error': 'ValueError: d'},
+                                'e[1]': getResult(1.0)}}
+        results = {'a[1]': getResult(1.2, rss = 120.0),
+                   'b[1]': getResult(0.01),
+                   'c[1]': {'error': 'ValueError: c'},
+                   'd[1]': {'error': 'ValueError: d'},
+                   'f[1]': getResult(5.0),
+                   'g[1]': {'error': 'ValueError: g'}}
+        # failing cases are reported, also if they are new since the baseline
+        self.assertTrue(compareResults(results, baseline, tolerance = 0.25,
+                                       rssTolerance = 0.25, minSeconds = 0.02) ==
+                        [('c[1]', 'error', None, 'ValueError: c'),
+                         ('d[1]', 'error', None, 'ValueError: d'),
+                         ('g[1]', 'error', None, 'ValueError: g')])
+        regressions = compareResults(results, baseline, tolerance = 0.1,
+                                     rssTolerance = 0.1, minSeconds = 0.0)
+        self.assertTrue(sorted((r.case, r.metric) for r in regressions) ==
+                        sorted([('a[1]', stage) for stage in BENCHMARK_STAGES] +
+                               [('a[1]', 'peakRSS')] +
+                               [('b[1]', stage) for stage in BENCHMARK_STAGES] +
+                               [('c[1]', 'error'), ('d[1]', 'error'),
+                                ('g[1]', 'error')]))
+        return None
+
+    def test_03(self):
+        '''
+        Baselines round trip and isolated runs of templates, where failing cases are
+        recorded instead of raised, but refused as baseline.
+        '''
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'template.py')
+            with open(path, 'w') as fh:
+                fh.write(TEMPLATE)
+            cases = [BenchmarkCase('line', path, 'plot_line', getLineKwargs, (10, 100)),
+                     BenchmarkCase('failing', path, 'plot_failing', getLineKwargs, (1,))]
+            results = run_benchmarks(cases, tmpdir, repeat = 1, verbose = False)
+            self.assertTrue(list(results.keys()) == ['line[10]', 'line[100]',
+                                                     'failing[1]'])
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir, 'line_100.png')))
+            for key in ['line[10]', 'line[100]']:
+                for stage in BENCHMARK_STAGES:
+                    self.assertTrue(results[key][stage] > 0.0)
+            self.assertTrue(results['failing[1]']['error'] == 'ValueError: n = 1')
+            self.assertTrue('traceback' in results['failing[1]'])
+
+            baselinefile = os.path.join(tmpdir, 'baselines', 'baseline.json')
+            with self.assertRaises(ValueError):
+                save_baseline(results, baselinefile)
+            self.assertFalse(os.path.exists(baselinefile))
+            del results['failing[1]']
+            save_baseline(results, baselinefile)
+            baseline = load_baseline(baselinefile)
+            self.assertTrue('matplotlib' in baseline['environment'])
+            self.assertTrue(baseline['results']['line[10]'] == results['line[10]'])
+            self.assertTrue(compareResults(results, baseline, minSeconds = 1.0) == [])
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
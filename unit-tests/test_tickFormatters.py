@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_tickFormatters.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+--- Example invocations ---
+Cd to the directory containing this script and there invoke
+$python -m pytest (-v)
+where python is your chosen python interpreter or alternatively only call
+$pytest
+or
+$pytest -v
+using the default python interpreter on your system.
+The -v flag (equal to --verbose) sets the pytest mode to 'verbose'.
+-------------------------------------------------------------------------------
+To only run the tests in this test file use
+$python -m pytest (-v) test_*.py
+where test_*.py is the considered unit test script.
+-------------------------------------------------------------------------------
+plain unittest invocation
+$python test_*.py
+-------------------------------------------------------------------------------
+Tested with pytest version 6.2.2.
+'''
+
+
+import sys
+import platform
+import numpy as np
+import unittest
+
+sys.path.append('../')
+
+from ticker import cleanFormatter
+from tickFormatters import CleanFormatter
+from tickFormatters import PowerOfTenFormatter
+from tickFormatters import formatPowerOfTen
+from tickFormatters import cleanLabel
+import mpl_string_formatter
+from mpl_string_formatter import str_format_power_of_ten
+from mpl_string_formatter import str_format_power_of_ten_exponent
+
+class TickFormattersTest(unittest.TestCase):
+    '''
+    Test cases for the tickFormatters module.
+    '''
+
+    def test_clean_formatter(self):
+
+        values = np.array([0.0, 0.5, 1.0, 1.0, 10.0, 2.5e-7, -3.0, 90000.0])
+
+        formatter = CleanFormatter()
+        labels = formatter.format_ticks(values)
+
+        self.assertTrue(labels == [cleanFormatter(value) for value in values])
+        self.assertTrue(formatter(0.5, 2) == '0.5')
+        # repeated tick arrays are served from the cache
+        self.assertTrue(formatter.format_ticks(values) == labels)
+        self.assertTrue(formatter._formatTicksCached.cache_info().hits >= 1)
+        self.assertTrue(formatter.format_ticks([]) == [])
+
+        return None
+
+    def test_power_of_ten_formatter(self):
+
+        labels = formatPowerOfTen([1.0e-5, 1.27e-5, 0.0, -2.5e3, 9.9996e2])
+
+        self.assertTrue(labels == [r'$\mathdefault{10^{-5}}$',
+                                   r'$\mathdefault{1.27 \times 10^{-5}}$',
+                                   '0',
+                                   r'$\mathdefault{-2.5 \times 10^{3}}$',
+                                   r'$\mathdefault{10^{3}}$'])
+
+        formatter = PowerOfTenFormatter(precision = 2, omitUnitMantissa = False)
+        self.assertTrue(formatter.format_ticks([1.0e6, 4.56e-2]) == \
+                        [r'$\mathdefault{1 \times 10^{6}}$',
+                         r'$\mathdefault{4.6 \times 10^{-2}}$'])
+
+        return None
+
+    def test_str_format_power_of_ten(self):
+
+        self.assertTrue(str_format_power_of_ten('1.27e+05') == \
+                        r'1.27$ \times\mathdefault{10^{5}}$')
+        self.assertTrue(str_format_power_of_ten_exponent('1e-05') == \
+                        r'$\mathdefault{\times \, 10^{-05}}$')
+        # inputs without an exponent are rejected
+        with self.assertRaises(ValueError):
+            str_format_power_of_ten('1.0')
+        with self.assertRaises(ValueError):
+            str_format_power_of_ten_exponent('1.0')
+
+        return None
+
+    def test_negative_zero(self):
+
+        # the labels of zero do not depend on whether -0.0 was formatted first
+        self.assertTrue(cleanLabel(-0.0) == '0')
+        self.assertTrue(cleanLabel(0.0) == '0')
+        self.assertTrue(mpl_string_formatter.cleanFormatter(-0.0) == '0')
+        self.assertTrue(mpl_string_formatter.cleanFormatter(0.0) == '0')
+
+        formatter = CleanFormatter()
+        self.assertTrue(formatter.format_ticks([-0.0, 1.0]) == ['0', '1'])
+        self.assertTrue(formatter.format_ticks([0.0, 1.0]) == ['0', '1'])
+        self.assertTrue(formatter(-0.0) == '0' and formatter(0.0) == '0')
+        self.assertTrue(PowerOfTenFormatter().format_ticks([-0.0, 0.0]) == ['0', '0'])
+
+        return None
+
+if __name__ == '__main__':
+
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Running", __file__)
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Python Interpreter Version =", platform.python_version())
+    print("/////////////////////////////////////////////////////////////////////////////")
+    print("Start testing ...")
+    print("/////////////////////////////////////////////////////////////////////////////")
+
+    unittest.main()
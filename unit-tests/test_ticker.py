@@ -37,6 +37,9 @@ import unittest
 sys.path.append('../')
 
 from ticker import getLogTicksBase10
+from ticker import getLogTicksBase10Batch
+from ticker import CachedLogTickLocator
+from ticker import clearLogTicksCache
 from ticker import cleanFormatter
 
 class TickerTest(unittest.TestCase):
@@ -251,6 +254,63 @@ class TickerTest(unittest.TestCase):
 
         return None
 
+    def test_log_ticks_13(self):
+
+        # exact decade bounds given as literals are included
+        ticks = getLogTicksBase10(1.0e-12, 1.0e-6)
+
+        self.assertTrue(len(ticks) == 6 * 9 + 1)
+        self.assertTrue(ticks[0] == 1.0e-12)
+        self.assertTrue(ticks[-1] == 1.0e-6)
+
+        ticks = getLogTicksBase10(1.0, 100.0, comb = np.array([1.0, 5.0]))
+
+        self.assertTrue(np.allclose(ticks, [1.0, 5.0, 10.0, 50.0, 100.0]))
+
+        return None
+
+    def test_log_ticks_batch(self):
+
+        mins = np.array([3.0e2, 1.0e-12, 1.01e-1, 1.0e-10, 7.0])
+        maxs = np.array([8.0e4, 1.0e-6, 1.02e-1, 1.0e-12, 7.0])
+
+        ticks = getLogTicksBase10Batch(mins, maxs)
+
+        self.assertTrue(len(ticks) == len(mins))
+        for k in range(len(mins)):
+            self.assertTrue(np.array_equal(ticks[k], getLogTicksBase10(mins[k], maxs[k])))
+
+        self.assertTrue(getLogTicksBase10Batch([], []) == [])
+
+        with self.assertRaises(ValueError):
+            getLogTicksBase10Batch(mins, maxs[:-1])
+
+        return None
+
+    def test_cached_log_tick_locator(self):
+
+        clearLogTicksCache()
+
+        locator = CachedLogTickLocator()
+        ticks = locator.tick_values(3.0e2, 8.0e4)
+
+        self.assertTrue(np.array_equal(ticks, getLogTicksBase10(3.0e2, 8.0e4)))
+        # the memoized array is returned for the same (vmin, vmax, comb)
+        self.assertTrue(CachedLogTickLocator().tick_values(8.0e4, 3.0e2) is ticks)
+        self.assertTrue(not ticks.flags.writeable)
+
+        # a different comb yields different ticks
+        ticks = CachedLogTickLocator(comb = [1.0, 5.0]).tick_values(3.0e2, 8.0e4)
+        self.assertTrue(np.allclose(ticks, [5.0e2, 1.0e3, 5.0e3, 1.0e4, 5.0e4]))
+
+        # ticks restricted to the limits independent of the view interval
+        locator = CachedLogTickLocator(limits = (1.0e-12, 1.0e-6))
+        ticks = locator.tick_values(5.0e-13, 2.5e-6)
+        self.assertTrue(np.array_equal(ticks, getLogTicksBase10(1.0e-12, 1.0e-6)))
+        self.assertTrue(len(locator.tick_values(1.0e-3, 1.0e-1)) == 0)
+
+        return None
+
     def test_cleanFormatter(self):
 
         ticklabel = cleanFormatter(0.0)